@@ -2,29 +2,41 @@ import asyncio
 import os
 import discord
 from discord.ext import commands
-from config import TOKEN, GUILD_ID, INTENTS, DEBUG, LOG_CHANNEL_ID
+from config import TOKEN, GUILD_IDS, INTENTS
+from utils.logs import get_logger, setup_logging
+from utils.excel import warm_guild_async
+from utils.file_lock import DataLockTimeout
+from utils.lock_replies import reply_data_locked
+from utils.guilds import log_channel_id
+from utils.command_sync import sync_commands_if_changed
+from utils.jobs import REPORTS
+
+logger = get_logger("bot")
 
 bot = commands.Bot(command_prefix="!", intents=INTENTS)
 tree = bot.tree
 
-log_channel = None  # Will hold the log channel object
+log_channels = {}  # Will hold the log channel object of each guild
 startup_logs = []  # Initialize here globally
+guild_startup_logs = {}  # Startup lines that only concern one guild
+first_ready_done = False  # on_ready fires again on every reconnect
 
-async def send_to_log_channel(messages: list[str]):
-    global log_channel
+async def send_to_log_channel(messages: list[str], guild_id: int):
+    log_channel = log_channels.get(guild_id)
     if not log_channel:
-        guild = bot.get_guild(GUILD_ID)
+        guild = bot.get_guild(guild_id)
         if guild:
-            log_channel = guild.get_channel(LOG_CHANNEL_ID)
+            log_channel = guild.get_channel(log_channel_id(guild_id))
+            log_channels[guild_id] = log_channel
 
     if log_channel and isinstance(log_channel, discord.TextChannel):
         content = "🛠️ **Startup Log:**\n" + "\n".join(messages)
-        print(content)
+        logger.info(content, extra={"guild_id": guild_id})
         await log_channel.send(content)
     else:
-        print("⚠️ Could not find log channel to send startup log.")
+        logger.warning(f"⚠️ Could not find log channel to send startup log for guild `{guild_id}`.", extra={"guild_id": guild_id})
         for msg in messages:
-            print(msg)
+            logger.info(msg, extra={"guild_id": guild_id})
 
 async def load_cogs() -> list[str]:
     logs = []
@@ -37,41 +49,58 @@ async def load_cogs() -> list[str]:
             except Exception as e:
                 error_msg = f"❌ Failed to load cog `{cog_name}`. Error: {e}"
                 logs.append(error_msg)
-                if DEBUG:
-                    import traceback
-                    traceback.print_exc()
+                logger.error(error_msg, exc_info=True)
     return logs
 
+@tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: discord.app_commands.AppCommandError):
+    original = getattr(error, "original", error)
+    if not isinstance(original, DataLockTimeout):
+        logger.error(f"❌ Error in command `/{interaction.command.qualified_name if interaction.command else '?'}`: {error}", extra={"guild_id": interaction.guild_id}, exc_info=error)
+        return
+    await reply_data_locked(interaction, original)
+
 @bot.event
 async def on_ready():
-    try:
-        guild = discord.Object(id=GUILD_ID)
-        
-        # Sync commands
-        synced = await tree.sync(guild=guild)
-        
-        # Get short list of command names
-        command_names = " | ".join([f"`/{cmd.name}`" for cmd in synced])
-        sync_msg = f"✅ Synced {len(synced)} command(s) for guild `{GUILD_ID}`. Logged in as {bot.user}."
-        commands_msg = f"📜 Commands: {command_names}" if synced else "⚠️ No commands found."
-        
-        startup_logs.append(sync_msg)
-        startup_logs.append(commands_msg)
-        
-        await send_to_log_channel(startup_logs)
+    global first_ready_done
+    if first_ready_done:
+        # on_ready also fires after the gateway reconnects; the commands and startup log are unchanged.
+        logger.debug(f"🔁 Reconnected as {bot.user}.")
+        return
+    first_ready_done = True
+
+    for guild_id in GUILD_IDS:
+        try:
+            # Sync commands only if they changed since the last sync
+            synced, command_list = await sync_commands_if_changed(tree, guild_id)
 
-    except Exception as e:
-        error_msg = f"❌ Error in on_ready: {e}"
-        print(error_msg)
-        if DEBUG:
-            import traceback
-            traceback.print_exc()
+            # Get short list of command names
+            command_names = " | ".join([f"`/{name}`" for name in command_list])
+            if synced:
+                sync_msg = f"✅ Synced {len(command_list)} command(s) for guild `{guild_id}`. Logged in as {bot.user}."
+            else:
+                sync_msg = f"✅ Commands unchanged for guild `{guild_id}`, skipped sync. Logged in as {bot.user}."
+            commands_msg = f"📜 Commands: {command_names}" if command_list else "⚠️ No commands found."
+
+            await send_to_log_channel(
+                startup_logs + guild_startup_logs.get(guild_id, []) + [sync_msg, commands_msg],
+                guild_id
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Error in on_ready for guild `{guild_id}`: {e}", extra={"guild_id": guild_id}, exc_info=True)
 
 
 async def main():
     global startup_logs
+    setup_logging()
     startup_logs = await load_cogs()
-    await bot.start(TOKEN)
+    for guild_id in GUILD_IDS:
+        guild_startup_logs[guild_id] = [await warm_guild_async(guild_id)]
+    try:
+        await bot.start(TOKEN)
+    finally:
+        REPORTS.shutdown()  # Stop report workers (see utils.jobs) so exit never waits on an export
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    asyncio.run(main())
@@ -1,25 +1,68 @@
 import discord
 from discord.ext import commands
 from discord import app_commands, Interaction
+from typing import Optional
 from modals.add_book_modal import AddBookModal, AddAudioBookModal
 import config
+from utils.auto_defer import auto_defer
+from utils.catalogue import CATALOGUE
+from utils.search_index import SEARCH
+
+
+def catalogue_prefill(guild_id: int, book: Optional[str], is_audio: bool) -> dict | None:
+    """Returns the catalogue entry to pre-fill the add modal with (only the title if the book is new)."""
+    if not book:
+        return None
+    return CATALOGUE.lookup(guild_id, book, is_audio) or {"title": book}
+
+
+def catalogue_choices(guild_id: int, current: str, is_audio: bool) -> list[app_commands.Choice[str]]:
+    """Autocompletes titles that are already in the guild's catalogue."""
+    choices = []
+    for title, _, _ in SEARCH.search(guild_id, current, limit=25):
+        entry = CATALOGUE.lookup(guild_id, title, is_audio)
+        if entry is None:
+            continue
+        unit = "min" if is_audio else "pages"
+        details = f" ({entry['total']} {unit})" if entry["total"] else ""
+        name = f"{entry['title'].title()} — {entry['author'].title() or 'Unknown'}{details}"
+        choices.append(app_commands.Choice(name=name[:100], value=entry["title"][:100]))
+    return choices
+
 
 class AddBookCog(commands.Cog):
-    """Cog for handling the addition of new books via a Discord slash command."""
+    """
+    Cog for handling the addition of new books via a Discord slash command.
+
+    Picking a book someone in the server already logged (the `book` option autocompletes
+    from the catalogue in `utils.catalogue`) pre-fills its author, genres and length.
+    """
 
     def __init__(self, bot):
         self.bot = bot
 
     @app_commands.command(name="add_book", description="Add a new book.")
-    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
-    async def add_book(self, interaction: Interaction):
-        await interaction.response.send_modal(AddBookModal())
-    
+    @app_commands.guilds(*config.GUILD_OBJECTS)
+    @app_commands.describe(book="Start typing to pick a book others logged and pre-fill its details")
+    @auto_defer(opens_modal=True)
+    async def add_book(self, interaction: Interaction, book: Optional[str] = None):
+        await interaction.response.send_modal(AddBookModal(catalogue_prefill(interaction.guild_id, book, is_audio=False)))
+
+    @add_book.autocomplete("book")
+    async def add_book_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return catalogue_choices(interaction.guild_id, current, is_audio=False)
+
     # I can add new commands like this right? 
     @app_commands.command(name="add_audiobook", description="Add a new audiobook.")
-    @app_commands.guilds(discord.Object(id=config.GUILD_ID))
-    async def add_audiobook(self, interaction: Interaction):
-        await interaction.response.send_modal(AddAudioBookModal())
+    @app_commands.guilds(*config.GUILD_OBJECTS)
+    @app_commands.describe(book="Start typing to pick an audiobook others logged and pre-fill its details")
+    @auto_defer(opens_modal=True)
+    async def add_audiobook(self, interaction: Interaction, book: Optional[str] = None):
+        await interaction.response.send_modal(AddAudioBookModal(catalogue_prefill(interaction.guild_id, book, is_audio=True)))
+
+    @add_audiobook.autocomplete("book")
+    async def add_audiobook_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return catalogue_choices(interaction.guild_id, current, is_audio=True)
 
 async def setup(bot):
     await bot.add_cog(AddBookCog(bot))
@@ -0,0 +1,46 @@
+from datetime import datetime
+from discord.ext import commands, tasks
+from config import GUILD_IDS, ARCHIVE_AFTER_DAYS
+from utils.archive import archive_stale_rows_async
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class ArchiveCog(commands.Cog):
+    """
+    Cog that keeps the hot reading log small.
+
+    Once a night, finished or shelved books that have not been updated for
+    `ARCHIVE_AFTER_DAYS` days are moved to each guild's archive (cold tier). Exports and
+    `/stats` still include them, and an archived book is moved back when it is unshelved or deleted.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.last_archive_run = None
+        self.nightly_archive_loop.start()
+
+    @tasks.loop(minutes=10)
+    async def nightly_archive_loop(self):
+        await self.bot.wait_until_ready()
+        now = datetime.now()
+        today = now.date()
+
+        # Run once daily at 04:00–04:09
+        if now.hour == 4 and now.minute < 10:
+            if self.last_archive_run == today:
+                return
+            self.last_archive_run = today
+
+            for guild_id in GUILD_IDS:
+                try:
+                    moved = await archive_stale_rows_async(guild_id, ARCHIVE_AFTER_DAYS)
+                    if moved:
+                        logger.info(f"🧊 Moved {moved} row(s) of guild {guild_id} to the archive.", extra={"guild_id": guild_id})
+                except Exception as e:
+                    logger.error(f"⚠️ Error archiving rows of guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
+
+
+async def setup(bot):
+    await bot.add_cog(ArchiveCog(bot))
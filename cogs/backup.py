@@ -0,0 +1,80 @@
+from typing import Optional
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_OBJECTS
+from utils.excel import restore_backup_async
+from utils.backup import list_backups
+from utils.guilds import guild_excel_path, guild_archive_path, log_channel_id
+
+
+class BackupCog(commands.Cog):
+    """
+    Cog for restoring the reading log from the local rotating backups.
+
+    Backups are taken automatically by every write (see `utils.backup`): full copies at the
+    start of each chain and compressed incremental deltas in between.
+
+    Commands:
+        /restore_backup [backup] [tier]: Restore the reading log or archive (admin only, restricted to log channel).
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="restore_backup", description="♻️ Restore the reading log from a backup (admin only)")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(
+        backup="Backup to restore. Defaults to the newest.",
+        tier="Reading log (default) or the archive of old books."
+    )
+    @app_commands.choices(tier=[
+        app_commands.Choice(name="Reading log", value="log"),
+        app_commands.Choice(name="Archive", value="archive"),
+    ])
+    async def restore_backup(
+        self,
+        interaction: Interaction,
+        backup: Optional[str] = None,
+        tier: Optional[app_commands.Choice[str]] = None
+    ):
+        admin_channel_id = log_channel_id(interaction.guild_id)
+        if str(interaction.channel.id) != str(admin_channel_id):
+            await interaction.response.send_message(
+                f"⛔ This command can only be used in <#{admin_channel_id}>.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer()
+        archive = bool(tier and tier.value == "archive")
+        try:
+            rows = await restore_backup_async(interaction.guild_id, backup, archive=archive)
+        except ValueError as e:
+            await interaction.followup.send(f"❌ {e}", ephemeral=True)
+            return
+        except Exception as e:
+            await interaction.followup.send(f"❌ Restore failed: {e}", ephemeral=True)
+            return
+
+        await interaction.followup.send(
+            f"♻️ Restored **{rows}** row(s) of the {'archive' if archive else 'reading log'} "
+            f"from backup `{backup or 'latest'}`. The previous contents were backed up first."
+        )
+
+    @restore_backup.autocomplete("backup")
+    async def backup_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        tier = getattr(interaction.namespace, "tier", None)
+        path = guild_archive_path(interaction.guild_id) if tier == "archive" else guild_excel_path(interaction.guild_id)
+        names = [name for name in reversed(list_backups(path)) if current in name]
+        return [app_commands.Choice(name=name, value=name) for name in names[:25]]
+
+    async def cog_app_command_error(self, interaction: Interaction, error):
+        if isinstance(error, app_commands.errors.MissingPermissions):
+            await interaction.response.send_message("❌ Only administrators can use this command.", ephemeral=True)
+        else:
+            raise error
+
+
+async def setup(bot):
+    await bot.add_cog(BackupCog(bot))
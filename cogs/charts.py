@@ -0,0 +1,79 @@
+from typing import Optional
+from datetime import datetime
+import io
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands, tasks
+from config import GUILD_IDS, GUILD_OBJECTS
+from utils.charts import get_genre_chart, get_progress_chart, precompute_charts
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class ChartsCog(commands.Cog):
+    """
+    Cog for rendering reading charts as images.
+
+    Charts are rendered with Pillow in a worker process pool and cached per user data
+    version, so repeating a command without new updates is served from the cache.
+    A nightly loop pre-renders the charts of everyone active in the past week.
+
+    Commands:
+        /genre_chart [user]: Bar chart of the user's most read genres.
+        /progress_chart [user]: Progress bars for the user's books in progress.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.last_precompute_run = None
+        self.nightly_precompute_loop.start()
+
+    @app_commands.command(name="genre_chart", description="Chart of the genres you (or another user) read most")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(user="Defaults to yourself.")
+    async def genre_chart(self, interaction: Interaction, user: Optional[discord.User] = None):
+        await interaction.response.defer()
+        target_user = user or interaction.user
+        try:
+            png = await get_genre_chart(interaction.guild_id, str(target_user.id), target_user.display_name)
+            await interaction.followup.send(file=discord.File(io.BytesIO(png), filename="genres.png"))
+        except Exception as e:
+            await interaction.followup.send(f"❌ Could not render chart: {e}", ephemeral=True)
+
+    @app_commands.command(name="progress_chart", description="Chart of the books you (or another user) are reading")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(user="Defaults to yourself.")
+    async def progress_chart(self, interaction: Interaction, user: Optional[discord.User] = None):
+        await interaction.response.defer()
+        target_user = user or interaction.user
+        try:
+            png = await get_progress_chart(interaction.guild_id, str(target_user.id), target_user.display_name)
+            await interaction.followup.send(file=discord.File(io.BytesIO(png), filename="progress.png"))
+        except Exception as e:
+            await interaction.followup.send(f"❌ Could not render chart: {e}", ephemeral=True)
+
+    @tasks.loop(minutes=10)
+    async def nightly_precompute_loop(self):
+        await self.bot.wait_until_ready()
+        now = datetime.now()
+        today = now.date()
+
+        # Run once daily at 03:00–03:09
+        if now.hour == 3 and now.minute < 10:
+            if self.last_precompute_run == today:
+                return
+            self.last_precompute_run = today
+
+            for guild_id in GUILD_IDS:
+                guild = self.bot.get_guild(guild_id)
+                names = {str(member.id): member.display_name for member in guild.members} if guild else {}
+                try:
+                    count = await precompute_charts(guild_id, names)
+                    logger.info(f"🖼️ Pre-rendered charts for {count} active user(s) in guild {guild_id}.", extra={"guild_id": guild_id})
+                except Exception as e:
+                    logger.error(f"⚠️ Error in nightly chart precompute for guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
+
+
+async def setup(bot):
+    await bot.add_cog(ChartsCog(bot))
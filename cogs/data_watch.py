@@ -0,0 +1,41 @@
+from discord.ext import commands, tasks
+from config import GUILD_IDS, DATA_CHANGE_CHECK_SECONDS
+from utils.excel import excel_transaction, may_have_changed
+from utils.indexes import is_warmed
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class DataWatchCog(commands.Cog):
+    """
+    Cog that picks up changes other processes make to the data files.
+
+    Another bot worker, an admin script or a hand edit can change a guild's reading log or
+    archive. Every `DATA_CHANGE_CHECK_SECONDS` the files' mtime and size are compared with the
+    version this process last read or wrote; on a difference the guild is reloaded under its
+    lock, where the contents are hashed so a file that was only touched is not reloaded.
+    Writes check as well (see `utils.excel.excel_transaction`), so they never act on stale data.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.data_watch_loop.start()
+
+    def cog_unload(self):
+        self.data_watch_loop.cancel()
+
+    @tasks.loop(seconds=DATA_CHANGE_CHECK_SECONDS)
+    async def data_watch_loop(self):
+        for guild_id in GUILD_IDS:
+            if not is_warmed(guild_id) or not may_have_changed(guild_id):
+                continue
+            try:
+                async with excel_transaction(guild_id):
+                    pass  # Entering the transaction confirms the change and reloads the guild
+            except Exception as e:
+                logger.error(f"⚠️ Error checking guild {guild_id}'s data for changes: {e}", extra={"guild_id": guild_id}, exc_info=True)
+
+
+async def setup(bot):
+    await bot.add_cog(DataWatchCog(bot))
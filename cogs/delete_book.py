@@ -2,9 +2,10 @@ from discord.ext import commands
 from discord import app_commands, Interaction
 import discord
 import pandas as pd
-from config import EXCEL_FILE, GUILD_ID
+from config import GUILD_OBJECTS
 from views.delete_book_view import DeleteBookSelectView
-from utils.excel import read_excel_async
+from utils.excel import read_full_log_async
+from utils.auto_defer import auto_defer
 
 class DeleteBookCog(commands.Cog):
     """Cog for handling the deletion of books from a user's reading log."""
@@ -13,16 +14,17 @@ class DeleteBookCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="delete_book", description="Delete a book from your reading log")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @auto_defer()
     async def delete_book(self, interaction: Interaction):
         """
         Slash command to delete a book from the user's reading log.
 
-        Loads the reading log from the Excel file, filters books belonging to the user,
+        Loads the reading log (including archived books), filters books belonging to the user,
         and presents a selection menu for deletion using `DeleteBookSelectView`. 
         """
         try:
-            df = await read_excel_async(EXCEL_FILE)
+            df = await read_full_log_async(interaction.guild_id)
             df["UserID"] = df["UserID"].astype(str)
         except FileNotFoundError:
             await interaction.response.send_message("No books logged yet.", ephemeral=True)
@@ -1,10 +1,13 @@
 import discord
 from discord import app_commands, Interaction
 from discord.ext import commands
-from config import EXCEL_FILE, GUILD_ID, LOG_CHANNEL_ID
-from utils.excel import read_excel_async
+from config import GUILD_OBJECTS
+from utils.guilds import guild_excel_path, guild_archive_path, log_channel_id
+from utils.auto_defer import auto_defer
+from utils.jobs import JobCancelled
+from utils.reports import export_log
+from views.job_progress_view import run_report
 import os
-import pandas as pd
 from io import BytesIO
 
 class DownloadLogCog(commands.Cog):
@@ -14,6 +17,9 @@ class DownloadLogCog(commands.Cog):
     Commands:
         /download_log [user]: Download your own reading log or, if admin, another user's log.
         /download_log_all: Download the full reading log (admin only, restricted to log channel).
+
+    The workbooks are built in a report worker process (`utils.jobs`), so a large export
+    never stalls the bot; the reply shows the export's progress and can cancel it.
     """
 
     def __init__(self, bot):
@@ -24,7 +30,7 @@ class DownloadLogCog(commands.Cog):
         description="📁 Download your own reading log or someone else's (admin only)"
     )
     @app_commands.describe(user="Defaults to yourself. Admins can use this to fetch others' logs.")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     async def download_log(self, interaction: Interaction, user: discord.User = None):
         """
         Slash command for downloading logs.
@@ -42,71 +48,89 @@ class DownloadLogCog(commands.Cog):
             await interaction.followup.send("⛔ Only admins can download logs for other users.", ephemeral=True)
             return
 
-        if not os.path.exists(EXCEL_FILE):
+        excel_path = guild_excel_path(interaction.guild_id)
+        if not os.path.exists(excel_path):
             await interaction.followup.send("❌ Log file not found.", ephemeral=True)
             return
 
         try:
-            df = await read_excel_async()
-            df["UserID"] = df["UserID"].astype(str)
-            filtered = df[df["UserID"] == str(target_user.id)]
-
-            if filtered.empty:
-                await interaction.followup.send(
-                    f"📭 No entries found for {target_user.display_name}.",
-                    ephemeral=True
+            data = await run_report(
+                interaction,
+                f"Exporting {target_user.display_name}'s log",
+                export_log,
+                self.data_paths(interaction.guild_id),
+                str(target_user.id)
+            )
+
+            if data is None:
+                await interaction.edit_original_response(
+                    content=f"📭 No entries found for {target_user.display_name}.",
+                    view=None
                 )
                 return
 
-            buffer = BytesIO()
-            filtered.to_excel(buffer, index=False, engine="openpyxl")
-            buffer.seek(0)
-
-            await interaction.followup.send(
+            await interaction.edit_original_response(
                 content=f"📤 Here's the reading log for **{target_user.display_name}**:",
-                file=discord.File(buffer, filename=f"{target_user.display_name}_log.xlsx"),
-                ephemeral=True
+                attachments=[discord.File(BytesIO(data), filename=f"{target_user.display_name}_log.xlsx")],
+                view=None
             )
+        except JobCancelled:
+            await interaction.edit_original_response(content="✖️ Export cancelled.", view=None)
         except Exception as e:
-            await interaction.followup.send(f"❌ Error: {e}", ephemeral=True)
+            await interaction.edit_original_response(content=f"❌ Error: {e}", view=None)
 
     @app_commands.command(
         name="download_log_all",
         description="📁 Download the full reading log (admin only, restricted to log channel)"
     )
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     @app_commands.checks.has_permissions(administrator=True)
+    @auto_defer(ephemeral=False)  # The log is posted publicly
     async def download_log_all(self, interaction: Interaction):
         """
         Slash command for downloading complete logs.
 
-        Useable only if the invoker is an admin. It copies the excel file and then sends it 
-        as xlsx file.
+        Useable only if the invoker is an admin. The reading log and its archive are exported
+        to one xlsx file by a report worker.
         """
-        if str(interaction.channel.id) != str(LOG_CHANNEL_ID):
+        admin_channel_id = log_channel_id(interaction.guild_id)
+        if str(interaction.channel.id) != str(admin_channel_id):
             await interaction.response.send_message(
-                f"⛔ This command can only be used in <#{LOG_CHANNEL_ID}>.",
+                f"⛔ This command can only be used in <#{admin_channel_id}>.",
                 ephemeral=True
             )
             return
 
-        if not os.path.exists(EXCEL_FILE):
+        excel_path = guild_excel_path(interaction.guild_id)
+        if not os.path.exists(excel_path):
             await interaction.response.send_message("❌ Log file not found.", ephemeral=True)
             return
 
+        await interaction.response.defer(thinking=True)
         try:
-            df = await read_excel_async()
-            buffer = BytesIO()
-            df.to_excel(buffer, index=False, engine="openpyxl")
-            buffer.seek(0)
+            data = await run_report(
+                interaction, "Exporting the full log", export_log, self.data_paths(interaction.guild_id)
+            )
+            if data is None:
+                await interaction.edit_original_response(content="📭 The reading log is empty.", view=None)
+                return
 
-            await interaction.response.send_message(
+            await interaction.edit_original_response(
                 content="📤 Here's the full reading log:",
-                file=discord.File(buffer, filename="Reading_Log_All.xlsx"),
-                ephemeral=False
+                attachments=[discord.File(BytesIO(data), filename="Reading_Log_All.xlsx")],
+                view=None
             )
+        except JobCancelled:
+            await interaction.edit_original_response(content="✖️ Export cancelled.", view=None)
         except Exception as e:
-            await interaction.response.send_message(f"❌ Error: {e}", ephemeral=True)
+            await interaction.edit_original_response(content=f"❌ Error: {e}", view=None)
+
+    @staticmethod
+    def data_paths(guild_id: int) -> list[str]:
+        """Returns the guild's data files to export: the reading log and, if any, its archive."""
+        archive_path = guild_archive_path(guild_id)
+        paths = [guild_excel_path(guild_id)]
+        return paths + [archive_path] if os.path.exists(archive_path) else paths
 
     async def cog_app_command_error(self, interaction: Interaction, error):
         if interaction.command and interaction.command.name == "download_log_all":
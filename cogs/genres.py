@@ -1,7 +1,7 @@
 from discord.ext import commands
 from discord import app_commands, Interaction
 import discord
-from config import GUILD_ID, DEBUG
+from config import GUILD_OBJECTS, DEBUG
 import utils.genres
 
 class GenresCog(commands.Cog):
@@ -11,7 +11,7 @@ class GenresCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="genres", description="View the list of available genres")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     async def list_genres(self, interaction: Interaction):
         """
         Sends an embed listing all available genres.
@@ -3,8 +3,12 @@ from discord import app_commands, Interaction
 import discord
 from datetime import datetime
 
-from config import GUILD_ID, LOG_CHANNEL_ID, DEBUG
+from config import GUILD_IDS, GUILD_OBJECTS
 from utils.google_sync import sync_excel_to_google_sheet
+from utils.guilds import log_channel_id
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
 
 class GoogleSyncCog(commands.Cog):
     """
@@ -18,37 +22,35 @@ class GoogleSyncCog(commands.Cog):
     @tasks.loop(hours=1)
     async def weekly_google_sync(self):
         """
-        Automatically syncs Excel data to Google Sheets every Sunday at 11:00 AM.
+        Automatically syncs every guild's Excel data to Google Sheets every Sunday at 11:00 AM.
         """
         await self.bot.wait_until_ready()
         now = datetime.now()
         if now.weekday() == 6 and now.hour == 11:
-            try:
-                if DEBUG:
-                    print("📤 Auto-sync to Google Sheet starting...")
-                success, warning = await sync_excel_to_google_sheet()
-                if DEBUG:
+            for guild_id in GUILD_IDS:
+                try:
+                    logger.info(f"📤 Auto-sync to Google Sheet starting for guild {guild_id}...", extra={"guild_id": guild_id})
+                    success, warning = await sync_excel_to_google_sheet(guild_id)
                     if success:
-                        print("✅ Auto-sync completed successfully.")
+                        logger.info(f"✅ Auto-sync completed successfully for guild {guild_id}.", extra={"guild_id": guild_id})
                     if warning:
-                        print(warning)
-            except Exception as e:
-                if DEBUG:
-                    print(f"❌ Auto-sync failed: {e}")
+                        logger.warning(warning, extra={"guild_id": guild_id})
+                except Exception as e:
+                    logger.error(f"❌ Auto-sync failed for guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
 
     @app_commands.command(
         name="gsheet_sync",
         description="Sync Excel data and genres to Google Sheet & CSV"
     )
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     @app_commands.checks.has_permissions(administrator=True)
     async def manual_sync(self, interaction: Interaction):
         """
         Manually syncs Excel data to Google Sheets. 
         
-        Only available to administrators in the admin channel (LOG_CHANNEL_ID).
+        Only available to administrators in the guild's admin channel (its log channel).
         """
-        if interaction.channel_id != LOG_CHANNEL_ID:
+        if interaction.channel_id != log_channel_id(interaction.guild_id):
             await interaction.response.send_message(
                 "⛔ This command can only be used in the admin channel.",
                 ephemeral=True
@@ -57,7 +59,7 @@ class GoogleSyncCog(commands.Cog):
 
         try:
             await interaction.response.defer(ephemeral=True)
-            success, warning = await sync_excel_to_google_sheet()
+            success, warning = await sync_excel_to_google_sheet(interaction.guild_id)
             if success:
                 msg = "✅ Excel synced to Google Sheet."
                 if warning:
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import time
+import discord
+from aiohttp import web
+from discord.ext import commands
+from config import GUILD_IDS, HEALTH_HOST, HEALTH_PORT, HEALTH_MAX_HEARTBEAT_AGE
+from utils.auto_defer import ACK_METRICS
+from utils.book_index import BOOKS
+from utils.excel import pending_writes
+from utils.guilds import guild_excel_path
+from utils.health import COMMAND_METRICS, LoopLagMonitor, render_metrics, rss_bytes, storage_writable
+from utils.indexes import is_warmed
+from utils.jobs import REPORTS
+from utils.query_cache import QUERY_CACHE
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class HealthCog(commands.Cog):
+    """
+    Serves health checks and metrics over HTTP on localhost, for the process supervisor.
+
+    Only started if `HEALTH_PORT` is set. Every endpoint reads counters that are already
+    kept in memory, so scraping every few seconds costs next to nothing.
+
+    Endpoints:
+        /healthz: 200 if the gateway is connected, heartbeats are acknowledged and the data
+            directories are writable; 503 otherwise. The JSON body says which check failed.
+        /readyz: 200 once every guild's data is loaded and indexed and the bot is ready.
+        /metrics: Prometheus text format: event loop lag, RSS, indexed rows, pending writes,
+            query cache, report jobs and per-command counters.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.lag = LoopLagMonitor()
+        self._lag_task: asyncio.Task | None = None
+        self._runner: web.AppRunner | None = None
+
+    async def cog_load(self):
+        if not HEALTH_PORT:
+            return
+        self._lag_task = asyncio.create_task(self.lag.run())
+        app = web.Application()
+        app.router.add_get("/healthz", self.healthz)
+        app.router.add_get("/readyz", self.readyz)
+        app.router.add_get("/metrics", self.metrics)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, HEALTH_HOST, HEALTH_PORT).start()
+        logger.info(f"🩺 Health endpoints listening on http://{HEALTH_HOST}:{HEALTH_PORT}.")
+
+    async def cog_unload(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if interaction.type == discord.InteractionType.application_command and interaction.command:
+            COMMAND_METRICS[(interaction.command.qualified_name, "invoked")] += 1
+
+    @commands.Cog.listener()
+    async def on_app_command_completion(self, interaction: discord.Interaction, command):
+        COMMAND_METRICS[(command.qualified_name, "completed")] += 1
+
+    def heartbeat_age(self) -> float | None:
+        """Seconds since the gateway last acknowledged a heartbeat, or None if not connected."""
+        keep_alive = getattr(getattr(self.bot, "ws", None), "_keep_alive", None)
+        last_ack = getattr(keep_alive, "_last_ack", None)
+        return time.perf_counter() - last_ack if last_ack else None
+
+    async def healthz(self, request: web.Request) -> web.Response:
+        heartbeat_age = self.heartbeat_age()
+        directories = {os.path.dirname(guild_excel_path(guild_id)) or "." for guild_id in GUILD_IDS}
+        checks = {
+            "gateway_connected": not self.bot.is_closed() and self.bot.ws is not None,
+            "heartbeat_ok": heartbeat_age is not None and heartbeat_age < HEALTH_MAX_HEARTBEAT_AGE,
+            "storage_writable": all(storage_writable(directory) for directory in directories),
+        }
+        body = {
+            "status": "ok" if all(checks.values()) else "fail",
+            **checks,
+            "heartbeat_age_seconds": round(heartbeat_age, 3) if heartbeat_age is not None else None,
+        }
+        return web.json_response(body, status=200 if all(checks.values()) else 503)
+
+    async def readyz(self, request: web.Request) -> web.Response:
+        warming = [guild_id for guild_id in GUILD_IDS if not is_warmed(guild_id)]
+        ready = self.bot.is_ready() and not warming
+        body = {"status": "ready" if ready else "starting", "bot_ready": self.bot.is_ready(), "guilds_warming": warming}
+        return web.json_response(body, status=200 if ready else 503)
+
+    async def metrics(self, request: web.Request) -> web.Response:
+        lag_last, lag_max = self.lag.scrape()
+        cache = QUERY_CACHE.stats()
+        jobs = REPORTS.stats()
+        latency = self.bot.latency
+        text = render_metrics([
+            ("booktracker_event_loop_lag_seconds", "gauge", [({"stat": "last"}, lag_last), ({"stat": "max"}, lag_max)]),
+            ("booktracker_rss_bytes", "gauge", [({}, rss_bytes())]),
+            ("booktracker_gateway_latency_seconds", "gauge", [({}, latency if latency == latency else -1)]),  # NaN before the first heartbeat
+            ("booktracker_cached_rows", "gauge", [({"guild": guild_id}, BOOKS.size(guild_id)) for guild_id in GUILD_IDS]),
+            ("booktracker_pending_writes", "gauge", [({}, pending_writes())]),
+            ("booktracker_query_cache_hits_total", "counter", [({"kind": kind}, stats["hits"]) for kind, stats in cache.items()]),
+            ("booktracker_query_cache_misses_total", "counter", [({"kind": kind}, stats["misses"]) for kind, stats in cache.items()]),
+            ("booktracker_report_jobs", "gauge", [({"state": state}, jobs[state]) for state in ("queued", "running")]),
+            ("booktracker_report_jobs_total", "counter", [({"state": state}, jobs[state]) for state in ("done", "failed", "cancelled")]),
+            ("booktracker_commands_total", "counter", [
+                ({"command": command, "event": event}, count) for (command, event), count in sorted(COMMAND_METRICS.items())
+            ]),
+            ("booktracker_interaction_acks_total", "counter", [
+                ({"handler": handler, "event": event}, count) for (event, handler), count in sorted(ACK_METRICS.items())
+            ]),
+        ])
+        return web.Response(text=text, content_type="text/plain", charset="utf-8")
+
+
+async def setup(bot):
+    await bot.add_cog(HealthCog(bot))
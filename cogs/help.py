@@ -1,7 +1,7 @@
 from discord.ext import commands
 from discord import app_commands, Interaction
 import discord
-from config import GUILD_ID, DATE_CUTOFF_DAYS
+from config import GUILD_OBJECTS, DATE_CUTOFF_DAYS
 
 
 class HelpCog(commands.Cog):
@@ -27,7 +27,7 @@ class HelpCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="help", description="Get help with the bot commands")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     async def help_command(self, interaction: Interaction):
         embed = discord.Embed(
             title="📚 BookTrackerBot Help",
@@ -38,13 +38,17 @@ class HelpCog(commands.Cog):
         embed.add_field(
             name="📘 General Commands",
             value=(
-                "`/add_book` — Add a new book to your reading list.\n"
+                "`/add_book [book]` — Add a new book to your reading list. Pick a book others logged to pre-fill its details.\n"
                 "`/update_book` — Update your book reading progress.\n"
-                "`/add_audiobook` — Add a new audiobook to your reading list.\n"
+                "`/add_audiobook [book]` — Add a new audiobook to your reading list, pre-filled like `/add_book`.\n"
                 "`/update_audiobook` — Update your audiobook listening progress.\n"
+                "`/update_many` — Update several books at once, e.g. `Dune = 120; 🎧 Emma = 3h10m`.\n"
                 "`/shelf_book` — Mark a book as shelved (completed/paused).\n"
                 "`/unshelf_book` — Return a shelved book to reading status.\n"
                 "`/delete_book` — Permanently delete a book from your log.\n"
+                "`/search <text>` — Find books by title or author and see who is reading them.\n"
+                "`/readers <book>` — See who in the server is reading or has read a book.\n"
+                "`/recommend` — Get book suggestions from readers with a similar taste.\n"
                 "`/genres` — List all available genres.\n"
                 "`/help` — Show this help message."
             ),
@@ -56,7 +60,11 @@ class HelpCog(commands.Cog):
             value=(
                 f"`/progress` — See your own progress (last {DATE_CUTOFF_DAYS} days).\n"
                 f"`/progress @user1 @user2 ...` — See progress of mentioned users (last {DATE_CUTOFF_DAYS} days).\n"
-                f"`/progress *` — See everyone's progress (Admins only) (last {DATE_CUTOFF_DAYS} days)."
+                f"`/progress *` — See everyone's progress (Admins only) (last {DATE_CUTOFF_DAYS} days).\n"
+                "`/stats [user] [period]` — Books finished, pages read, listening time and favourite genres.\n"
+                "`/leaderboard [metric] [period]` — Top readers by pages, finished books or listening time.\n"
+                "`/genre_chart [user]` — Chart of the genres you read most.\n"
+                "`/progress_chart [user]` — Chart of your books in progress."
             ),
             inline=False
         )
@@ -66,7 +74,10 @@ class HelpCog(commands.Cog):
             value=(
                 "`/download_log [user]` — Download your own reading log as an Excel file. Admins can specify a user to download their log.\n"
                 "`/download_log_all` — Download the full reading log (Admins only, restricted to log channel).\n"
-                "`/gsheet_sync` — Manually sync Excel to Google Sheet."
+                "`/restore_backup [backup] [tier]` — Restore the reading log or archive from a local backup (Admins only, restricted to log channel).\n"
+                "`/import_log <file> [user]` — Import reading history from a CSV/xlsx file. Admins can import for another user.\n"
+                "`/gsheet_sync` — Manually sync Excel to Google Sheet.\n"
+                "`/sync_commands [all_servers]` — Force a slash command sync (Admins only, restricted to log channel)."
             ),
             inline=False
         )
@@ -0,0 +1,84 @@
+import asyncio
+from typing import Optional
+from io import BytesIO
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_OBJECTS, MAX_IMPORT_ROWS
+from utils.excel import read_excel_async, commit_excel_async, excel_transaction, append_rows
+from utils.guilds import guild_excel_path
+from utils.importer import ImportTooLarge, parse_upload, merge_import
+
+
+class ImportLogCog(commands.Cog):
+    """
+    Cog for bulk-importing reading history from a CSV or xlsx upload.
+
+    The upload is stream-parsed in chunks, validated with vectorized checks, de-duplicated
+    against the existing log with a hash join and committed in a single write. Rows that
+    could not be imported are sent back as a CSV file with the reason for each row.
+
+    Commands:
+        /import_log <file> [user]: Import rows with the columns BookName, Author, Genres,
+            LastPage and TotalPages (optional: Status, Date, LastUpdated). Admins can import for another user.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="import_log", description="Import your reading history from a CSV or xlsx file")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(
+        file="CSV/xlsx with BookName, Author, Genres, LastPage, TotalPages (optional: Status, Date, LastUpdated)",
+        user="Admins only: import the rows for another user."
+    )
+    async def import_log(self, interaction: Interaction, file: discord.Attachment, user: Optional[discord.User] = None):
+        await interaction.response.defer(ephemeral=True)
+
+        target_user = user or interaction.user
+        if user and not interaction.user.guild_permissions.administrator:
+            await interaction.followup.send("⛔ Only admins can import logs for other users.", ephemeral=True)
+            return
+
+        data = await file.read()
+        try:
+            # Parsing and validating thousands of rows is CPU work; keep it off the event loop.
+            accepted, rejected, total_rows = await asyncio.to_thread(
+                parse_upload, data, file.filename, str(target_user.id), target_user.name, MAX_IMPORT_ROWS
+            )
+        except ImportTooLarge as e:
+            await interaction.followup.send(f"⚠️ {e}", ephemeral=True)
+            return
+        except ValueError as e:
+            await interaction.followup.send(f"⚠️ Could not read the file: {e}", ephemeral=True)
+            return
+
+        if not total_rows:
+            await interaction.followup.send("📭 The uploaded file has no rows.", ephemeral=True)
+            return
+
+        async with excel_transaction(interaction.guild_id):
+            df = await read_excel_async(guild_excel_path(interaction.guild_id))
+            accepted, rejected = merge_import(df, accepted, rejected, str(target_user.id), interaction.guild_id)
+
+            if not accepted.empty:
+                df = append_rows(df, accepted)
+                await commit_excel_async(df, interaction.guild_id, added=df.tail(len(accepted)))
+
+        msg = f"📥 Imported **{len(accepted)}** of {total_rows} row(s) for **{target_user.display_name}**."
+        if rejected.empty:
+            await interaction.followup.send(msg, ephemeral=True)
+            return
+
+        buffer = BytesIO()
+        rejected.to_csv(buffer, index=False)
+        buffer.seek(0)
+        await interaction.followup.send(
+            msg + f"\n⚠️ {len(rejected)} row(s) were rejected, see the attached file for the reasons.",
+            file=discord.File(buffer, filename="rejected_rows.csv"),
+            ephemeral=True
+        )
+
+
+async def setup(bot):
+    await bot.add_cog(ImportLogCog(bot))
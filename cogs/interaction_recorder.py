@@ -0,0 +1,36 @@
+import discord
+from discord.ext import commands
+from config import GUILD_IDS, RECORD_INTERACTIONS_FILE
+from utils.recorder import InteractionRecorder
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class InteractionRecorderCog(commands.Cog):
+    """
+    Records every interaction, sanitized, when `RECORD_INTERACTIONS_FILE` is set.
+
+    The recording can be replayed against a copy of the data with `python -m loadtest.replay`
+    to reproduce a slowdown or check that a storage change gives the same results.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.recorder = InteractionRecorder(RECORD_INTERACTIONS_FILE) if RECORD_INTERACTIONS_FILE else None
+        if self.recorder is not None:
+            self.recorder.open(GUILD_IDS)
+            logger.info(f"🎙️ Recording interactions to {RECORD_INTERACTIONS_FILE}.")
+
+    async def cog_unload(self):
+        if self.recorder is not None:
+            self.recorder.close()
+
+    @commands.Cog.listener()
+    async def on_interaction(self, interaction: discord.Interaction):
+        if self.recorder is not None:
+            self.recorder.record(interaction)
+
+
+async def setup(bot):
+    await bot.add_cog(InteractionRecorderCog(bot))
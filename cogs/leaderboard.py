@@ -0,0 +1,60 @@
+from typing import Optional
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_OBJECTS
+from utils.leaderboard import LEADERBOARDS, format_leaderboard
+
+
+class LeaderboardCog(commands.Cog):
+    """
+    Cog providing the `/leaderboard` command.
+
+    Leaderboards are kept up to date incrementally by `utils.leaderboard` on every change
+    to the reading log, so the command only reads a precomputed top-K list.
+
+    Commands:
+        /leaderboard [metric] [period]: Top readers by pages, finished books or listening time.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="leaderboard", description="See the top readers of the server")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(metric="What to rank by (default: pages read).", period="Time period (default: this week).")
+    @app_commands.choices(
+        metric=[
+            app_commands.Choice(name="Pages read", value="pages"),
+            app_commands.Choice(name="Books finished", value="finished"),
+            app_commands.Choice(name="Listening time", value="minutes"),
+        ],
+        period=[
+            app_commands.Choice(name="This week", value="week"),
+            app_commands.Choice(name="This month", value="month"),
+            app_commands.Choice(name="All time", value="all"),
+        ]
+    )
+    async def leaderboard(
+        self,
+        interaction: Interaction,
+        metric: Optional[app_commands.Choice[str]] = None,
+        period: Optional[app_commands.Choice[str]] = None
+    ):
+        metric_value = metric.value if metric else "pages"
+        metric_name = metric.name if metric else "Pages read"
+        period_value = period.value if period else "week"
+        period_name = period.name if period else "This week"
+
+        entries = LEADERBOARDS.get(interaction.guild_id, metric_value, period_value)
+        embed = discord.Embed(
+            title=f"🏅 Leaderboard — {metric_name} ({period_name})",
+            description=format_leaderboard(entries, metric_value) or "No reading logged for this period yet. 📚",
+            color=discord.Color.gold()
+        )
+        embed.set_footer(text="Weekly and monthly boards count progress logged in that period; all time counts every book.")
+        await interaction.response.send_message(embed=embed, allowed_mentions=discord.AllowedMentions.none())
+
+
+async def setup(bot):
+    await bot.add_cog(LeaderboardCog(bot))
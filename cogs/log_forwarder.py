@@ -0,0 +1,91 @@
+from collections import Counter
+import discord
+from discord.ext import commands, tasks
+from config import GUILD_IDS, LOG_CHANNEL_FLUSH_SECONDS
+from utils.guilds import log_channel_id
+from utils.logs import LOG_CHANNEL_BUFFER, get_logger
+
+logger = get_logger(__name__)
+
+MAX_MESSAGE_LENGTH = 2000
+LEVEL_ICONS = {"WARNING": "⚠️", "ERROR": "❌", "CRITICAL": "🛑"}
+
+
+def format_log_batch(entries: Counter, dropped: int = 0) -> str:
+    """
+    Formats de-duplicated log entries as one message that fits Discord's length limit.
+
+    Args:
+        entries (Counter): {(level, message): count} as returned by `LOG_CHANNEL_BUFFER.drain()`.
+        dropped (int, optional): Entries lost because the buffer was full.
+
+    Returns:
+        str: The message; entries that don't fit are summarized as "…and N more".
+    """
+    header = "📋 **Bot Log:**"
+    lines = []
+    for (level, message), count in entries.most_common():
+        icon = "" if message.startswith(tuple(LEVEL_ICONS.values())) else f"{LEVEL_ICONS.get(level, '•')} "
+        suffix = f" (×{count})" if count > 1 else ""
+        lines.append(f"{icon}{message[:300]}{suffix}")
+    if dropped:
+        lines.append(f"🗑️ {dropped} older entr{'y was' if dropped == 1 else 'ies were'} dropped (buffer full).")
+
+    content = header
+    for i, line in enumerate(lines):
+        more = f"\n…and {len(lines) - i} more"
+        if len(content) + 1 + len(line) + len(more) > MAX_MESSAGE_LENGTH:
+            return content + more
+        content += "\n" + line
+    return content
+
+
+class LogForwarderCog(commands.Cog):
+    """
+    Cog that posts buffered warnings and errors to the log channels.
+
+    Instead of one Discord message per problem, entries are collected by the logging
+    pipeline (`utils.logs`) and posted every `LOG_CHANNEL_FLUSH_SECONDS` as a single
+    de-duplicated message per channel, so a burst of identical errors costs one API call.
+    Entries without a guild go to the primary guild's log channel.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.flush_loop.start()
+
+    async def cog_unload(self):
+        self.flush_loop.cancel()
+        await self.flush()
+
+    async def flush(self):
+        grouped, dropped = LOG_CHANNEL_BUFFER.drain()
+        by_channel: dict[int, tuple[Counter, int]] = {}
+        for guild_id, entries in grouped.items():
+            channel_id = log_channel_id(guild_id if guild_id is not None else GUILD_IDS[0])
+            if not channel_id:
+                continue
+            merged, _ = by_channel.get(channel_id, (Counter(), 0))
+            merged.update(entries)
+            by_channel[channel_id] = (merged, 0)
+        if dropped and by_channel:
+            channel_id = next(iter(by_channel))
+            by_channel[channel_id] = (by_channel[channel_id][0], dropped)
+
+        for channel_id, (entries, channel_dropped) in by_channel.items():
+            channel = self.bot.get_channel(channel_id)
+            if channel is None:
+                continue
+            try:
+                await channel.send(format_log_batch(entries, channel_dropped))
+            except discord.HTTPException as e:
+                logger.warning(f"⚠️ Could not post log batch to channel {channel_id}: {e}", extra={"log_channel": False})
+
+    @tasks.loop(seconds=LOG_CHANNEL_FLUSH_SECONDS)
+    async def flush_loop(self):
+        await self.bot.wait_until_ready()
+        await self.flush()
+
+
+async def setup(bot):
+    await bot.add_cog(LogForwarderCog(bot))
@@ -2,12 +2,45 @@ import discord
 from discord import app_commands, Interaction
 from discord.ext import commands
 from typing import Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import pandas as pd
 import re
 
-from config import GUILD_ID, EXCEL_FILE, DATE_CUTOFF_DAYS, MAX_FIELDS, STATUS_MAP
-from utils.excel import read_excel_async
+from config import GUILD_OBJECTS, DATE_CUTOFF_DAYS, MAX_FIELDS, STATUS_MAP
+from utils.excel import read_excel_async, read_excel_readonly
+from utils.guilds import guild_excel_path
+from utils.query_cache import QUERY_CACHE
+from utils.jobs import JobContext, JobCancelled
+from views.job_progress_view import run_report
+
+
+def progress_report(ctx: JobContext, path: str, cutoff: datetime) -> dict[str, list[tuple[str, str]]]:
+    """
+    Formats the recent books of every user in the log (runs in a report worker for `/progress *`).
+
+    Args:
+        ctx (JobContext): Progress reporting and cancellation.
+        path (str): The guild's reading log.
+        cutoff (datetime): Books last updated before this are left out.
+
+    Returns:
+        dict[str, list[tuple[str, str]]]: Embed fields (see `ProgressCog.progress_fields`) by
+            user ID, for every user in the log in order of appearance.
+    """
+    ctx.progress(0.0, "loading the log")
+    df = read_excel_readonly(path)
+    df["UserID"] = df["UserID"].astype(str)
+    user_ids = df["UserID"].dropna().unique().tolist()
+    df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
+    recent = dict(tuple(df[df["LastUpdated"] >= cutoff].groupby("UserID")))
+
+    report = {}
+    for i, uid in enumerate(user_ids):
+        if i % 50 == 0:
+            ctx.progress(0.1 + 0.9 * i / len(user_ids), f"{i} of {len(user_ids)} readers")
+        report[uid] = ProgressCog.progress_fields(recent[uid], uid) if uid in recent else []
+    return report
+
 
 class ProgressCog(commands.Cog):
     """
@@ -30,14 +63,17 @@ class ProgressCog(commands.Cog):
 
     - progress_command: Handles the `/progress` slash command and delegates to handle_progress.
     - handle_progress: Processes the command input, checks permissions, parses user mentions, and sends progress embeds.
-    - get_reading_progress: Fetches and formats reading progress data from an Excel file for the specified user IDs, returning a list of Discord embeds.
+    - get_reading_progress: Fetches and formats reading progress data from the guild's Excel file for the specified user IDs, returning a list of Discord embeds.
 
     Features:
     ---------
 
     - Admin-only access for viewing all users' progress.
     - Handles user mentions and permission checks.
-    - Reads progress data asynchronously from an Excel file.
+    - Reads progress data asynchronously from an Excel file; each user's formatted rows are cached
+      until their books change (or the day changes), so repeated calls skip storage entirely.
+    - `/progress *` formats every user in a report worker process (`utils.jobs`), showing its
+      progress with a Cancel button, so large servers don't stall the bot.
     - Formats progress data into Discord embeds, including book details, progress percentage, and last updated time.
     - Handles errors and missing data gracefully.
 
@@ -53,7 +89,7 @@ class ProgressCog(commands.Cog):
         name="progress",
         description="View reading progress for tagged users, yourself, or all users (admin only)."
     )
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
     @app_commands.describe(users="Users to view progress for (optional, mention users or use * for all)")
     async def progress_command(self, interaction: Interaction, users: Optional[str] = None):
         await self.handle_progress(interaction, users)
@@ -68,7 +104,7 @@ class ProgressCog(commands.Cog):
 
         if not users:
             await interaction.response.defer(ephemeral=True)
-            embeds = await self.get_reading_progress([invoker_user.id])
+            embeds = await self.get_reading_progress([invoker_user.id], interaction.guild_id)
             for embed in embeds:
                 await interaction.followup.send(embed=embed, ephemeral=True)
             return
@@ -82,13 +118,22 @@ class ProgressCog(commands.Cog):
 
         if users and users.strip() == "*":
             try:
-                df = await read_excel_async(EXCEL_FILE)
-                user_ids = df["UserID"].dropna().unique().tolist()
-                user_ids = [int(uid) for uid in user_ids]
+                report = await run_report(
+                    interaction,
+                    "Building everyone's progress",
+                    progress_report,
+                    guild_excel_path(interaction.guild_id),
+                    datetime.now() - timedelta(days=DATE_CUTOFF_DAYS)
+                )
+            except JobCancelled:
+                await interaction.edit_original_response(content="✖️ Progress report cancelled.", view=None)
+                return
             except Exception as e:
                 await interaction.followup.send(f"⚠️ Error reading data: {e}", ephemeral=False)
                 return
-            embeds = await self.get_reading_progress(user_ids)
+            await interaction.edit_original_response(content=f"📖 Reading progress of {len(report)} reader(s):", view=None)
+            user_ids = [int(uid) for uid in report]
+            embeds = await self.get_reading_progress(user_ids, interaction.guild_id, report)
             for embed in embeds:
                 await interaction.followup.send(embed=embed, ephemeral=False)
             return
@@ -98,26 +143,28 @@ class ProgressCog(commands.Cog):
             if not user_ids:
                 await interaction.followup.send("Please mention at least one user or use `/progress *` (admins only).", ephemeral=True)
                 return
-            embeds = await self.get_reading_progress(user_ids)
+            embeds = await self.get_reading_progress(user_ids, interaction.guild_id)
             for embed in embeds:
                 await interaction.followup.send(embed=embed, ephemeral=False)
             return
 
-    async def get_reading_progress(self, user_ids: list[int]) -> list[discord.Embed]:
-        try:
-            df = await read_excel_async(EXCEL_FILE)
-            df["UserID"] = df["UserID"].astype(str)
-            df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
-        except Exception as e:
-            error_embed = discord.Embed(
-                title="Reading Progress",
-                description=f"⚠️ Error reading data: {e}",
-                color=discord.Color.red()
-            )
-            return [error_embed]
+    async def get_reading_progress(
+        self,
+        user_ids: list[int],
+        guild_id: int,
+        report: dict[str, list[tuple[str, str]]] | None = None
+    ) -> list[discord.Embed]:
+        log = None
 
-        cutoff_date = datetime.now() - timedelta(days=DATE_CUTOFF_DAYS)
-        df = df[df["LastUpdated"] >= cutoff_date]
+        async def load_recent_log() -> pd.DataFrame:
+            nonlocal log
+            if log is None:
+                df = await read_excel_async(guild_excel_path(guild_id))
+                df["UserID"] = df["UserID"].astype(str)
+                df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
+                cutoff_date = datetime.now() - timedelta(days=DATE_CUTOFF_DAYS)
+                log = df[df["LastUpdated"] >= cutoff_date]
+            return log
 
         embeds = []
         current_embed = discord.Embed(title="📖 Reading Progress", color=discord.Color.purple())
@@ -125,9 +172,25 @@ class ProgressCog(commands.Cog):
         found_any = False
 
         for uid in user_ids:
-            user_books = df[df["UserID"] == str(uid)].sort_values("LastUpdated", ascending=False)
+            async def compute_fields(uid=uid):
+                return self.progress_fields(await load_recent_log(), uid)
+
+            try:
+                if report is not None:
+                    fields = report.get(str(uid), [])
+                else:
+                    # The cutoff moves daily, so today's date is part of the cache key.
+                    fields = await QUERY_CACHE.get_or_compute("progress", guild_id, str(uid), compute_fields, date.today())
+            except Exception as e:
+                error_embed = discord.Embed(
+                    title="Reading Progress",
+                    description=f"⚠️ Error reading data: {e}",
+                    color=discord.Color.red()
+                )
+                return [error_embed]
+
             user_name = f"User ID: {uid}"
-            guild = self.bot.get_guild(GUILD_ID)
+            guild = self.bot.get_guild(guild_id)
             if guild:
                 member = guild.get_member(uid)
                 if not member:
@@ -138,7 +201,7 @@ class ProgressCog(commands.Cog):
                 if member:
                     user_name = member.name
 
-            if user_books.empty:
+            if not fields:
                 if field_count >= MAX_FIELDS:
                     embeds.append(current_embed)
                     current_embed = discord.Embed(title="📖 Reading Progress (contd)", color=discord.Color.purple())
@@ -153,33 +216,13 @@ class ProgressCog(commands.Cog):
 
             found_any = True
 
-            for _, row in user_books.iterrows():
+            for book, value in fields:
                 if field_count >= MAX_FIELDS:
                     embeds.append(current_embed)
                     current_embed = discord.Embed(title="📖 Reading Progress (contd)", color=discord.Color.purple())
                     field_count = 0
 
-                book_title = row.get("BookName", "Unknown").title()
-                author = row.get("Author", "Unknown").title()
-                last_page = row.get("LastPage", "N/A")
-                total_pages = row.get("TotalPages", "N/A")
-                genres = row.get("Genres", "N/A")
-                last_updated = row.get("LastUpdated", "N/A")
-                status_val = row.get("Status", "Unknown")
-                status = STATUS_MAP.get(status_val, status_val)
-                try:
-                    last_page_int = int(last_page)
-                    total_pages_int = int(total_pages)
-                    percent = last_page_int * 100 / total_pages_int
-                    progress = f"{status} {last_page}/{total_pages} pages ({percent:.2f}%)"
-                except Exception:
-                    progress = "N/A"
-
-                current_embed.add_field(
-                    name=f"{user_name}: {book_title} by {author}",
-                    value=f"Genres: {genres}\nProgress: {progress}\nLast Updated: {last_updated.strftime('%Y-%m-%d %H:%M:%S') if last_updated != 'N/A' else 'N/A'}",
-                    inline=False
-                )
+                current_embed.add_field(name=f"{user_name}: {book}", value=value, inline=False)
                 field_count += 1
 
         if field_count > 0:
@@ -195,5 +238,44 @@ class ProgressCog(commands.Cog):
 
         return embeds
 
+    @staticmethod
+    def progress_fields(df: pd.DataFrame, uid: int) -> list[tuple[str, str]]:
+        """
+        Formats a user's recent books as embed fields.
+
+        Args:
+            df (pandas.DataFrame): The reading log, already limited to recent updates.
+            uid (int): The user.
+
+        Returns:
+            list[tuple[str, str]]: ("<book> by <author>", field value) pairs, most recently
+                updated first. The member name is prefixed when the embed is built, so the
+                fields can be cached per user.
+        """
+        fields = []
+        user_books = df[df["UserID"] == str(uid)].sort_values("LastUpdated", ascending=False)
+        for _, row in user_books.iterrows():
+            book_title = row.get("BookName", "Unknown").title()
+            author = row.get("Author", "Unknown").title()
+            last_page = row.get("LastPage", "N/A")
+            total_pages = row.get("TotalPages", "N/A")
+            genres = row.get("Genres", "N/A")
+            last_updated = row.get("LastUpdated", "N/A")
+            status_val = row.get("Status", "Unknown")
+            status = STATUS_MAP.get(status_val, status_val)
+            try:
+                last_page_int = int(last_page)
+                total_pages_int = int(total_pages)
+                percent = last_page_int * 100 / total_pages_int
+                progress = f"{status} {last_page}/{total_pages} pages ({percent:.2f}%)"
+            except Exception:
+                progress = "N/A"
+
+            fields.append((
+                f"{book_title} by {author}",
+                f"Genres: {genres}\nProgress: {progress}\nLast Updated: {last_updated.strftime('%Y-%m-%d %H:%M:%S') if last_updated != 'N/A' else 'N/A'}"
+            ))
+        return fields
+
 async def setup(bot):
     await bot.add_cog(ProgressCog(bot))
@@ -0,0 +1,73 @@
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands, tasks
+from config import GUILD_IDS, GUILD_OBJECTS
+from utils.recommend import RECOMMENDER
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class RecommendCog(commands.Cog):
+    """
+    Cog providing `/recommend` and keeping the recommendation model fresh.
+
+    The genre matrices in `utils.recommend` are adjusted on every change to the reading
+    log; every two minutes the readers' taste profiles of guilds with changes are recomputed
+    in a worker thread, so the command itself only does a matrix-vector product.
+
+    Commands:
+        /recommend: Books finished by readers with a similar taste, and who those readers are.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+        self.refresh_loop.start()
+
+    async def cog_unload(self):
+        self.refresh_loop.cancel()
+
+    @tasks.loop(minutes=2)
+    async def refresh_loop(self):
+        for guild_id in GUILD_IDS:
+            try:
+                if await RECOMMENDER.refresh_async(guild_id):
+                    logger.debug(f"🧭 Refreshed taste profiles of guild {guild_id}.", extra={"guild_id": guild_id})
+            except Exception as e:
+                logger.error(f"❌ Failed to refresh taste profiles of guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
+
+    @app_commands.command(name="recommend", description="Get book suggestions from readers with a similar taste")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    async def recommend(self, interaction: Interaction):
+        result = RECOMMENDER.recommend(interaction.guild_id, str(interaction.user.id))
+        if result is None:
+            await interaction.response.send_message("⏳ Recommendations are still being prepared. Try again in a couple of minutes.", ephemeral=True)
+            return
+
+        books, readers = result
+        if not books and not readers:
+            await interaction.response.send_message(
+                "📚 Log a few books with `/add_book` first, so I can learn what you like!",
+                ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(title="🧭 Recommended for you", color=discord.Color.teal())
+        embed.add_field(
+            name="📚 Books finished by readers like you",
+            value="\n".join(
+                f"**{title.title()}** by {author.title() or 'Unknown'}" for title, author, _ in books
+            ) or "Nothing new yet — your taste twins haven't finished anything you haven't logged.",
+            inline=False
+        )
+        embed.add_field(
+            name="🤝 Readers with a similar taste",
+            value="\n".join(f"<@{user_id}> — {similarity:.0%} match" for user_id, similarity in readers) or "No one yet.",
+            inline=False
+        )
+        embed.set_footer(text="Based on the genres of the books you've logged.")
+        await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=discord.AllowedMentions.none())
+
+
+async def setup(bot):
+    await bot.add_cog(RecommendCog(bot))
@@ -0,0 +1,89 @@
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_OBJECTS
+from utils.book_index import BOOKS
+from utils.search_index import SEARCH
+from utils.readers import READERS, format_readers
+
+STATUS_ICONS = {0: "📦", 1: "📖", 2: "🏆"}
+MAX_READERS_SHOWN = 10
+
+
+class SearchCog(commands.Cog):
+    """
+    Cog providing the `/search` and `/readers` commands.
+
+    Searches the titles and authors of every book logged in the server through the
+    inverted index in `utils.search_index`, and looks up who logged a book in
+    `utils.readers`. Both are kept up to date on every change to the reading log, so
+    neither command scans the log.
+
+    Commands:
+        /search <text>: Books whose title or author match the text, with who is reading them.
+        /readers <book>: Who is reading, has finished or has shelved a book.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="search", description="Find books by title or author and see who is reading them")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(text="Words from the title and/or author")
+    async def search(self, interaction: Interaction, text: str):
+        results = SEARCH.search(interaction.guild_id, text)
+        if not results:
+            await interaction.response.send_message(f"🔍 No books match **{text}**.", ephemeral=True)
+            return
+
+        embed = discord.Embed(title=f"🔍 Books matching “{text}”", color=discord.Color.blue())
+        for title, author, keys in results:
+            readers = []
+            for user_id, name, is_audio in keys[:MAX_READERS_SHOWN]:
+                book = BOOKS.entry(interaction.guild_id, user_id, name, is_audio=is_audio)
+                icon = STATUS_ICONS.get(book.status if book else None, "•")
+                readers.append(f"{icon}{'🎧' if is_audio else ''} <@{user_id}>")
+            shown = ", ".join(readers)
+            if len(keys) > MAX_READERS_SHOWN:
+                shown += f" and {len(keys) - MAX_READERS_SHOWN} more"
+            embed.add_field(
+                name=f"{title.title()} by {author.title() or 'Unknown'}",
+                value=f"{len(keys)} reader(s): {shown}",
+                inline=False
+            )
+        embed.set_footer(text="📖 reading · 🏆 finished · 📦 shelved")
+        await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=discord.AllowedMentions.none())
+
+    @search.autocomplete("text")
+    async def search_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return [
+            app_commands.Choice(name=f"{title.title()} — {author.title() or 'Unknown'}"[:100], value=title[:100])
+            for title, author, _ in SEARCH.search(interaction.guild_id, current, limit=25)
+        ]
+
+    @app_commands.command(name="readers", description="See who in the server is reading or has read a book")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(book="The book's title")
+    async def readers(self, interaction: Interaction, book: str):
+        readers = READERS.get(interaction.guild_id, book)
+        if not readers:
+            await interaction.response.send_message(
+                f"📚 Nobody has logged **{book.title()}** yet. Be the first with `/add_book`!",
+                ephemeral=True
+            )
+            return
+
+        embed = discord.Embed(
+            title=f"👥 Readers of {book.title()}",
+            description=format_readers(readers, limit=30),
+            color=discord.Color.blue()
+        )
+        await interaction.response.send_message(embed=embed, ephemeral=True, allowed_mentions=discord.AllowedMentions.none())
+
+    @readers.autocomplete("book")
+    async def readers_autocomplete(self, interaction: Interaction, current: str) -> list[app_commands.Choice[str]]:
+        return await self.search_autocomplete(interaction, current)
+
+
+async def setup(bot):
+    await bot.add_cog(SearchCog(bot))
@@ -1,9 +1,10 @@
 from discord import app_commands, Interaction
 from discord.ext import commands
 import discord
-from config import GUILD_ID
-from utils.excel import filter_booknames_with_user_status
+from config import GUILD_OBJECTS
+from utils.query_cache import cached_booknames
 from views.shelf_book_view import ShelfBookSelectView
+from utils.auto_defer import auto_defer
 
 
 class ShelfBookCog(commands.Cog):
@@ -23,12 +24,13 @@ class ShelfBookCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="shelf_book", description="Temporarily shelf a book you're reading")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @auto_defer()
     async def shelf_book(self, interaction: Interaction):   
         user_id = str(interaction.user.id)
 
         try:
-            books = await filter_booknames_with_user_status(user_id, status=1)  # Status 1 = Currently Reading
+            books = await cached_booknames(interaction.guild_id, user_id, status=1)  # Status 1 = Currently Reading
 
             if not books:
                 await interaction.response.send_message(
@@ -0,0 +1,75 @@
+from typing import Optional
+import discord
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_OBJECTS
+from utils.stats import STATS
+from utils.excel import get_user_status_counts
+
+
+class StatsCog(commands.Cog):
+    """
+    Cog providing the `/stats` command with per-user reading totals.
+
+    The totals are served from the precomputed rollups in `utils.stats`, which are rebuilt
+    when the bot starts and updated on every add, update, shelf, unshelf and delete, so the
+    command never scans the reading log.
+
+    Commands:
+        /stats [user] [period]: Books finished, pages read, minutes listened, favourite genres
+            and the user's current reading/shelved/finished counts.
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="stats", description="View reading stats for yourself or another user")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(
+        user="Defaults to yourself.",
+        period="This week, this month, this year or all time (default)."
+    )
+    @app_commands.choices(period=[
+        app_commands.Choice(name="This week", value="week"),
+        app_commands.Choice(name="This month", value="month"),
+        app_commands.Choice(name="This year", value="year"),
+        app_commands.Choice(name="All time", value="all"),
+    ])
+    async def stats(
+        self,
+        interaction: Interaction,
+        user: Optional[discord.User] = None,
+        period: Optional[app_commands.Choice[str]] = None
+    ):
+        target_user = user or interaction.user
+        period_value = period.value if period else "all"
+        period_name = period.name if period else "All time"
+
+        totals = STATS.get(interaction.guild_id, str(target_user.id), period_value)
+        hours, minutes = divmod(totals["minutes"], 60)
+        favourite_genres = ", ".join(
+            genre.title() for genre, _ in totals["genres"].most_common(3)
+        ) or "N/A"
+
+        embed = discord.Embed(
+            title=f"📊 Reading Stats — {target_user.display_name}",
+            description=f"Period: **{period_name}**",
+            color=discord.Color.purple()
+        )
+        embed.add_field(name="🏆 Books Finished", value=str(totals["finished"]), inline=True)
+        embed.add_field(name="📖 Pages Read", value=str(totals["pages"]), inline=True)
+        embed.add_field(name="🎧 Listening Time", value=f"{hours}h {minutes}m", inline=True)
+        embed.add_field(name="📚 Favourite Genres", value=favourite_genres, inline=False)
+        counts = get_user_status_counts(interaction.guild_id, str(target_user.id))
+        embed.add_field(
+            name="🗂️ Current Shelf",
+            value=f"📖 {counts[1]} reading · 📦 {counts[0]} shelved · 🏆 {counts[2]} finished",
+            inline=False
+        )
+        embed.set_footer(text="Weekly, monthly and yearly totals count progress logged in that period.")
+
+        await interaction.response.send_message(embed=embed, ephemeral=True)
+
+
+async def setup(bot):
+    await bot.add_cog(StatsCog(bot))
@@ -1,11 +1,18 @@
 from discord.ext import commands, tasks
 import discord
 from datetime import datetime
+import io
 import pandas as pd
 
-from config import GUILD_ID, CHANNEL_ID, EXCEL_FILE, DEBUG
+from config import GUILD_IDS
 from utils.excel import read_excel_async
+from utils.guilds import guild_excel_path, summary_channel_id
+from utils.leaderboard import LEADERBOARDS, format_leaderboard
+from utils.charts import get_genre_chart
 from utils.summaries_utils import get_week_bounds, get_user_mentions, get_all_reader_ids
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
 
 class SummaryCog(commands.Cog):
     """
@@ -18,13 +25,16 @@ class SummaryCog(commands.Cog):
     
     2. weekly_summary_loop:
         - Runs every 10 minutes.
-        - Posts a summary after 23:50 every Sunday showing who updated during the week.
+        - Posts a summary after 23:50 every Sunday showing who updated during the week,
+          followed by the week's top readers from the precomputed leaderboard and the
+          top reader's genre chart (served from the chart cache).
     
     3. weekly_reminder_loop:
         - Runs every 10 minutes.
         - At 18:00–18:09 every Sunday, reminds users who haven't updated.
     
     Notes:
+    - Every loop runs once per configured guild, against that guild's data and summary channel.
     - Uses system time (bot server's local time).
     - All loops are idempotent using a last-run tracker.
     """
@@ -50,33 +60,35 @@ class SummaryCog(commands.Cog):
                 return
             self.last_daily_run = today
 
-            if DEBUG:
-                print(f"📅 Running daily summary for {today} at {now.time()}")
+            logger.info(f"📅 Running daily summary for {today} at {now.time()}")
 
-            if not CHANNEL_ID or not GUILD_ID:
-                if DEBUG:
-                    print("⚠️ CHANNEL_ID or GUILD_ID not set.")
-                return
+            for guild_id in GUILD_IDS:
+                await self.post_daily_summary(guild_id, today)
 
-            try:
-                df = await read_excel_async(EXCEL_FILE)
-                df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
-                updated_today = df[df["LastUpdated"].dt.date == today]
-                unique_users = updated_today["UserName"].unique().tolist()
+    async def post_daily_summary(self, guild_id: int, today):
+        channel_id = summary_channel_id(guild_id)
+        if not channel_id or not guild_id:
+            logger.warning(f"⚠️ Summary channel or guild ID not set for guild {guild_id}.", extra={"guild_id": guild_id})
+            return
 
-                msg = (
-                    f"📖 **Daily Reading Log Summary** ({today}):\n"
-                    f"{', '.join(f'**{name}**' for name in unique_users)} updated their books today. Great job! 🎉"
-                    if unique_users else
-                    f"📖 **Daily Reading Log Summary** ({today}):\nNo one has updated their reading progress yet. 😴"
-                )
+        try:
+            df = await read_excel_async(guild_excel_path(guild_id))
+            df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
+            updated_today = df[df["LastUpdated"].dt.date == today]
+            unique_users = updated_today["UserName"].unique().tolist()
 
-                channel = self.bot.get_channel(CHANNEL_ID)
-                if isinstance(channel, discord.TextChannel):
-                    await channel.send(msg)
-            except Exception as e:
-                if DEBUG:
-                    print(f"⚠️ Error in daily summary task: {e}")
+            msg = (
+                f"📖 **Daily Reading Log Summary** ({today}):\n"
+                f"{', '.join(f'**{name}**' for name in unique_users)} updated their books today. Great job! 🎉"
+                if unique_users else
+                f"📖 **Daily Reading Log Summary** ({today}):\nNo one has updated their reading progress yet. 😴"
+            )
+
+            channel = self.bot.get_channel(channel_id)
+            if isinstance(channel, discord.TextChannel):
+                await channel.send(msg)
+        except Exception as e:
+            logger.error(f"⚠️ Error in daily summary task for guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
 
     @tasks.loop(minutes=10)
     async def weekly_summary_loop(self):
@@ -90,32 +102,53 @@ class SummaryCog(commands.Cog):
                 return
             self.last_weekly_summary_run = week_id
 
-            if DEBUG:
-                print(f"📆 Running weekly summary for week {week_id} at {now.time()}")
-
-            try:
-                df = await read_excel_async(EXCEL_FILE)
-                df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
-                df["UserID"] = df["UserID"].astype(str)
-
-                start_of_week, end_of_week = get_week_bounds(now)
-                updated = df[(df["LastUpdated"] >= start_of_week) & (df["LastUpdated"] <= end_of_week)]
-                user_ids = updated["UserID"].unique().tolist()
-
-                mentions = await get_user_mentions([int(uid) for uid in user_ids], self.bot)
-                msg = (
-                    f"📆 Weekly Reading Summary ({start_of_week.date()} → {end_of_week.date()}):\n"
-                    f"Great job, {', '.join(mentions)}! 🥳"
-                    if mentions else
-                    f"📆 Weekly Reading Summary ({start_of_week.date()} → {end_of_week.date()}):\nNo updates this week. 😔"
-                )
-
-                channel = self.bot.get_channel(CHANNEL_ID)
-                if isinstance(channel, discord.TextChannel):
+            logger.info(f"📆 Running weekly summary for week {week_id} at {now.time()}")
+
+            for guild_id in GUILD_IDS:
+                await self.post_weekly_summary(guild_id, now)
+
+    async def post_weekly_summary(self, guild_id: int, now: datetime):
+        try:
+            df = await read_excel_async(guild_excel_path(guild_id))
+            df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
+            df["UserID"] = df["UserID"].astype(str)
+
+            start_of_week, end_of_week = get_week_bounds(now)
+            updated = df[(df["LastUpdated"] >= start_of_week) & (df["LastUpdated"] <= end_of_week)]
+            user_ids = updated["UserID"].unique().tolist()
+
+            mentions = await get_user_mentions([int(uid) for uid in user_ids], self.bot, guild_id)
+            msg = (
+                f"📆 Weekly Reading Summary ({start_of_week.date()} → {end_of_week.date()}):\n"
+                f"Great job, {', '.join(mentions)}! 🥳"
+                if mentions else
+                f"📆 Weekly Reading Summary ({start_of_week.date()} → {end_of_week.date()}):\nNo updates this week. 😔"
+            )
+            top_readers = LEADERBOARDS.get(guild_id, "pages", "week", now)[:3]
+            chart = None
+            if top_readers:
+                msg += "\n🏅 Top readers this week:\n" + format_leaderboard(top_readers, "pages")
+                chart = await self.top_reader_chart(guild_id, top_readers[0][0])
+
+            channel = self.bot.get_channel(summary_channel_id(guild_id))
+            if isinstance(channel, discord.TextChannel):
+                if chart:
+                    await channel.send(msg, file=chart)
+                else:
                     await channel.send(msg)
-            except Exception as e:
-                if DEBUG:
-                    print(f"⚠️ Error in weekly_summary_loop: {e}")
+        except Exception as e:
+            logger.error(f"⚠️ Error in weekly_summary_loop for guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
+
+    async def top_reader_chart(self, guild_id: int, user_id: str) -> discord.File | None:
+        """Returns the top reader's genre chart, usually pre-rendered by the nightly chart job."""
+        guild = self.bot.get_guild(guild_id)
+        member = guild.get_member(int(user_id)) if guild else None
+        try:
+            png = await get_genre_chart(guild_id, user_id, member.display_name if member else user_id)
+            return discord.File(io.BytesIO(png), filename="top_reader_genres.png")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to attach top reader chart for guild {guild_id}: {e}", extra={"guild_id": guild_id})
+            return None
 
     @tasks.loop(minutes=10)
     async def weekly_reminder_loop(self):
@@ -129,36 +162,38 @@ class SummaryCog(commands.Cog):
                 return
             self.last_weekly_reminder_run = week_id
 
-            if DEBUG:
-                print(f"⏰ Running weekly reminder for week {week_id} at {now.time()}")
-
-            try:
-                df = await read_excel_async(EXCEL_FILE)
-                df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
-                df["UserID"] = df["UserID"].astype(str)
-
-                start_of_week, end_of_week = get_week_bounds(now)
-                updated_ids = set(df[(df["LastUpdated"] >= start_of_week) & (df["LastUpdated"] <= end_of_week)]["UserID"])
-
-                guild = self.bot.get_guild(GUILD_ID)
-                if not guild:
-                    return
-
-                all_ids = set(get_all_reader_ids(guild))
-                missing_ids = list(all_ids - updated_ids)
-
-                mentions = await get_user_mentions([int(uid) for uid in missing_ids], self.bot)
-                if mentions:
-                    msg = (
-                        f"⏰ Reminder ({start_of_week.date()} → {end_of_week.date()}):\n"
-                        f"{', '.join(mentions)} — you haven’t updated your reading log this week! 📚"
-                    )
-                    channel = self.bot.get_channel(CHANNEL_ID)
-                    if isinstance(channel, discord.TextChannel):
-                        await channel.send(msg)
-            except Exception as e:
-                if DEBUG:
-                    print(f"⚠️ Error in weekly_reminder_loop: {e}")
+            logger.info(f"⏰ Running weekly reminder for week {week_id} at {now.time()}")
+
+            for guild_id in GUILD_IDS:
+                await self.post_weekly_reminder(guild_id, now)
+
+    async def post_weekly_reminder(self, guild_id: int, now: datetime):
+        try:
+            df = await read_excel_async(guild_excel_path(guild_id))
+            df["LastUpdated"] = pd.to_datetime(df["LastUpdated"])
+            df["UserID"] = df["UserID"].astype(str)
+
+            start_of_week, end_of_week = get_week_bounds(now)
+            updated_ids = set(df[(df["LastUpdated"] >= start_of_week) & (df["LastUpdated"] <= end_of_week)]["UserID"])
+
+            guild = self.bot.get_guild(guild_id)
+            if not guild:
+                return
+
+            all_ids = set(get_all_reader_ids(guild))
+            missing_ids = list(all_ids - updated_ids)
+
+            mentions = await get_user_mentions([int(uid) for uid in missing_ids], self.bot, guild_id)
+            if mentions:
+                msg = (
+                    f"⏰ Reminder ({start_of_week.date()} → {end_of_week.date()}):\n"
+                    f"{', '.join(mentions)} — you haven’t updated your reading log this week! 📚"
+                )
+                channel = self.bot.get_channel(summary_channel_id(guild_id))
+                if isinstance(channel, discord.TextChannel):
+                    await channel.send(msg)
+        except Exception as e:
+            logger.error(f"⚠️ Error in weekly_reminder_loop for guild {guild_id}: {e}", extra={"guild_id": guild_id}, exc_info=True)
 
 async def setup(bot):
     await bot.add_cog(SummaryCog(bot))
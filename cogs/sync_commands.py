@@ -0,0 +1,55 @@
+from typing import Optional
+from discord import app_commands, Interaction
+from discord.ext import commands
+from config import GUILD_IDS, GUILD_OBJECTS
+from utils.command_sync import sync_commands_if_changed
+from utils.guilds import log_channel_id
+
+
+class SyncCommandsCog(commands.Cog):
+    """
+    Cog for forcing a slash command sync.
+
+    At startup commands are only synced when their fingerprint changed (see
+    `utils.command_sync`); this command lets an admin sync anyway, e.g. after commands
+    were changed or removed on Discord's side.
+
+    Commands:
+        /sync_commands [all_servers]: Force a command sync (admin only, restricted to log channel).
+    """
+
+    def __init__(self, bot):
+        self.bot = bot
+
+    @app_commands.command(name="sync_commands", description="🔄 Force a slash command sync (admin only)")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.checks.has_permissions(administrator=True)
+    @app_commands.describe(all_servers="Sync every configured server instead of only this one.")
+    async def sync_commands(self, interaction: Interaction, all_servers: Optional[bool] = False):
+        admin_channel_id = log_channel_id(interaction.guild_id)
+        if str(interaction.channel.id) != str(admin_channel_id):
+            await interaction.response.send_message(
+                f"⛔ This command can only be used in <#{admin_channel_id}>.",
+                ephemeral=True
+            )
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        lines = []
+        for guild_id in (GUILD_IDS if all_servers else [interaction.guild_id]):
+            try:
+                _, names = await sync_commands_if_changed(self.bot.tree, guild_id, force=True)
+                lines.append(f"✅ Synced {len(names)} command(s) for guild `{guild_id}`.")
+            except Exception as e:
+                lines.append(f"❌ Failed to sync guild `{guild_id}`: {e}")
+        await interaction.followup.send("\n".join(lines), ephemeral=True)
+
+    async def cog_app_command_error(self, interaction: Interaction, error):
+        if isinstance(error, app_commands.errors.MissingPermissions):
+            await interaction.response.send_message("❌ Only administrators can use this command.", ephemeral=True)
+        else:
+            raise error
+
+
+async def setup(bot):
+    await bot.add_cog(SyncCommandsCog(bot))
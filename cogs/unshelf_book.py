@@ -1,9 +1,10 @@
 from discord import app_commands, Interaction
 from discord.ext import commands
 import discord
-from config import GUILD_ID
-from utils.excel import filter_booknames_with_user_status
+from config import GUILD_OBJECTS
+from utils.query_cache import cached_booknames
 from views.unshelf_book_view import UnShelfBookSelectView
+from utils.auto_defer import auto_defer
 
 
 class UnShelfBookCog(commands.Cog):
@@ -24,12 +25,13 @@ class UnShelfBookCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="unshelf_book", description="Unshelf a book when it's already shelved")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @auto_defer(ephemeral=False)  # The book list is posted publicly
     async def unshelf_book(self, interaction: Interaction):   
         user_id = str(interaction.user.id)
 
         try:
-            books = await filter_booknames_with_user_status(user_id, status=0)  # Status 0 = Currently shelved
+            books = await cached_booknames(interaction.guild_id, user_id, status=0, include_archived=True)  # Status 0 = Currently shelved
             
             if not books:
                 await interaction.response.send_message(
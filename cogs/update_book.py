@@ -3,10 +3,30 @@ from discord import app_commands, Interaction
 import discord
 
 from views.update_book_view import UpdateBookSelectView, UpdateAudioBookSelectView
-from utils.excel import read_excel_async, get_audiobook_excel
-from config import EXCEL_FILE, GUILD_ID
+from utils.excel import read_excel_async, get_audiobook_excel, commit_excel_async, excel_transaction
+from utils.batch_update import parse_batch_updates, apply_batch_updates
+from config import GUILD_OBJECTS
+from utils.guilds import guild_excel_path
+from utils.auto_defer import auto_defer
+from utils.query_cache import QUERY_CACHE
 import pandas as pd
 
+
+def _active_books(df: pd.DataFrame, user_id: str) -> tuple[list[str], dict[str, dict]]:
+    """Returns a user's unfinished book names (least recently updated first) and their rows."""
+    active = df[
+        (df["UserID"].astype(str) == user_id) &
+        (df["LastPage"] != df["TotalPages"]) &
+        df["BookName"].notna()
+    ].sort_values(
+        by="LastUpdated",
+        ascending=True,
+        key=lambda x: pd.to_datetime(x, errors='coerce')
+    )
+    user_books = active["BookName"].tolist()
+    return user_books, dict(zip(user_books, active.to_dict("records")))
+
+
 class UpdateBookCog(commands.Cog):
     """
     Cog for updating user progress for a book via a Discord slash command.
@@ -16,28 +36,27 @@ class UpdateBookCog(commands.Cog):
         self.bot = bot
 
     @app_commands.command(name="update_book", description="Update your progress for a book")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @auto_defer()
     async def update_book(self, interaction: Interaction):
         """
         Slash command to update the user's progress for a book.
         Shows a dropdown of active books for the user to select and update.
+        The list (and the rows passed to the view, so opening the modal needs no I/O) is
+        cached until the user's books change.
         """
+        async def load_active_books():
+            df = await read_excel_async(guild_excel_path(interaction.guild_id))
+            return _active_books(df, str(interaction.user.id))
+
         try:
-            df = await read_excel_async(EXCEL_FILE)
-            df["UserID"] = df["UserID"].astype(str)
+            user_books, prefetched = await QUERY_CACHE.get_or_compute(
+                "active_titles", interaction.guild_id, str(interaction.user.id), load_active_books
+            )
         except FileNotFoundError:
             await interaction.response.send_message("📁 No books logged yet.", ephemeral=True)
             return
 
-        user_books = df[
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["LastPage"] != df["TotalPages"])
-        ].sort_values(
-            by="LastUpdated",
-            ascending=True,
-            key=lambda x: pd.to_datetime(x, errors='coerce')
-        )["BookName"].dropna().tolist()
-
         if not user_books:
             await interaction.response.send_message(
                 "📖 You haven’t added any active books yet.",
@@ -47,32 +66,30 @@ class UpdateBookCog(commands.Cog):
 
         await interaction.response.send_message(
             "📘 Select a book to update:",
-            view=UpdateBookSelectView(user_books),
+            view=UpdateBookSelectView(user_books, prefetched),
             ephemeral=True
         )
 
     @app_commands.command(name="update_audiobook", description="Update your progress for an audiobook")
-    @app_commands.guilds(discord.Object(id=GUILD_ID))
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @auto_defer()
     async def update_audiobook(self, interaction: Interaction):
         """
         Slash command to update the user's progress for an audiobook.
         Shows a dropdown of active audiobooks for the user to select and update.
         """
+        async def load_active_audiobooks():
+            df = await get_audiobook_excel(guild_excel_path(interaction.guild_id))
+            return _active_books(df, str(interaction.user.id))
+
         try:
-            df = await get_audiobook_excel()
+            user_books, prefetched = await QUERY_CACHE.get_or_compute(
+                "active_audio_titles", interaction.guild_id, str(interaction.user.id), load_active_audiobooks
+            )
         except FileNotFoundError:
             await interaction.response.send_message("📁 No audiobooks logged yet.", ephemeral=True)
             return
 
-        user_books = df[
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["LastPage"] != df["TotalPages"])
-        ].sort_values(
-            by="LastUpdated",
-            ascending=True,
-            key=lambda x: pd.to_datetime(x, errors='coerce')
-        )["BookName"].dropna().tolist()
-
         if not user_books:
             await interaction.response.send_message(
                 "📖 You haven’t added any active audiobooks yet.",
@@ -82,9 +99,43 @@ class UpdateBookCog(commands.Cog):
 
         await interaction.response.send_message(
             "📘 Select an audiobook to update:",
-            view=UpdateAudioBookSelectView(user_books),
+            view=UpdateAudioBookSelectView(user_books, prefetched),
             ephemeral=True
         )
 
+    @app_commands.command(name="update_many", description="Update progress for several books at once")
+    @app_commands.guilds(*GUILD_OBJECTS)
+    @app_commands.describe(updates="e.g. Good Omens = 120; Dune = 300; 🎧 Project Hail Mary = 5h30m")
+    async def update_many(self, interaction: Interaction, updates: str):
+        """
+        Slash command to update several books in one go.
+
+        All entries are validated together and committed as a single write; if any entry
+        is invalid, nothing is changed and every problem is reported at once.
+        """
+        await interaction.response.defer(ephemeral=True)
+
+        entries, errors = parse_batch_updates(updates)
+        if not entries and not errors:
+            errors.append("No updates given. Use `title = page; title = page`.")
+        if errors:
+            await interaction.followup.send("⚠️ Nothing was updated:\n" + "\n".join(errors), ephemeral=True)
+            return
+
+        async with excel_transaction(interaction.guild_id):
+            df = await read_excel_async(guild_excel_path(interaction.guild_id))
+            df["UserID"] = df["UserID"].astype(str)
+            removed, added, messages, errors = apply_batch_updates(df, str(interaction.user.id), entries)
+            if not errors:
+                await commit_excel_async(df, interaction.guild_id, removed=removed, added=added)
+        if errors:
+            await interaction.followup.send("⚠️ Nothing was updated:\n" + "\n".join(errors), ephemeral=True)
+            return
+
+        await interaction.followup.send(
+            f"✅ **{interaction.user.mention}** updated {len(messages)} book(s):\n" + "\n".join(messages),
+            ephemeral=False
+        )
+
 async def setup(bot):
     await bot.add_cog(UpdateBookCog(bot))
@@ -5,7 +5,11 @@ import discord
 from discord import Member
 from discord.ext import commands
 from PIL import Image, ImageDraw, ImageFont
-from config import DEBUG, ENTRY_ROLE_NAME, WELCOME_CHANNEL_ID, TEMPLATE_PATH
+from config import ENTRY_ROLE_NAME, TEMPLATE_PATH
+from utils.guilds import is_allowed_guild, welcome_channel_id
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
 
 
 class WelcomeCog(commands.Cog):
@@ -44,11 +48,11 @@ class WelcomeCog(commands.Cog):
         else:
             self.font_large = self.font_small = ImageFont.load_default()
 
-    def get_welcome_channel(self):
+    def get_welcome_channel(self, guild_id: int):
         """
-        Returns the Discord channel object for sending welcome messages.
+        Returns the Discord channel object for sending welcome messages in the given guild.
         """
-        return self.bot.get_channel(WELCOME_CHANNEL_ID)
+        return self.bot.get_channel(welcome_channel_id(guild_id))
 
     async def generate_welcome_image(self, member: Member) -> discord.File:
         """
@@ -93,14 +97,16 @@ class WelcomeCog(commands.Cog):
         - Assigns the entry role to the new member.
         - Sends a DM with rules and bot usage instructions.
         """
+        if not is_allowed_guild(member.guild.id):
+            return
+
         # Send welcome image in server
-        channel = self.get_welcome_channel()
+        channel = self.get_welcome_channel(member.guild.id)
         if channel:
             try:
                 await channel.send(file=await self.generate_welcome_image(member))
             except Exception as e:
-                if DEBUG:
-                    print(f"⚠️ Image gen failed: {e}")
+                logger.warning(f"⚠️ Image gen failed: {e}")
                 await channel.send(f"Whoa! A new reader arrived! ❤️\nWelcome {member.mention}!")
 
         # Assign Reader role
@@ -108,11 +114,9 @@ class WelcomeCog(commands.Cog):
         if role:
             try:
                 await member.add_roles(role, reason="Auto-assigned on join")
-                if DEBUG:
-                    print(f"✅ Assigned '{ENTRY_ROLE_NAME}' to {member}")
+                logger.info(f"✅ Assigned '{ENTRY_ROLE_NAME}' to {member}")
             except Exception as e:
-                if DEBUG:
-                    print(f"❌ Failed role assignment: {e}")
+                logger.error(f"❌ Failed role assignment: {e}", exc_info=True)
 
         # Send DM with rules and bot usage
         try:
@@ -153,8 +157,7 @@ class WelcomeCog(commands.Cog):
             dm.set_footer(text="Let the reading begin! 📖✨")
             await member.send(embed=dm)
         except Exception as e:
-            if DEBUG:
-                print(f"⚠️ Failed to DM rules: {e}")
+            logger.warning(f"⚠️ Failed to DM rules: {e}")
 
 async def setup(bot):
     await bot.add_cog(WelcomeCog(bot))
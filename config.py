@@ -6,7 +6,10 @@ from dotenv import load_dotenv
 load_dotenv(".env")
 DEBUG: bool = os.getenv("DEBUG", False) in ("True", "true", "1")
 TOKEN: str = os.getenv("DISCORD_BOT_TOKEN") or ""
-GUILD_ID: int = int(os.getenv("ALLOWED_GUILD_ID") or 0)
+GUILD_ID: int = int(os.getenv("ALLOWED_GUILD_ID") or 0)  # Primary guild
+GUILD_IDS: list[int] = list(dict.fromkeys(
+    [GUILD_ID] + [int(gid) for gid in (os.getenv("ADDITIONAL_GUILD_IDS") or "").split(",") if gid.strip()]
+))
 LOG_CHANNEL_ID: int = int(os.getenv("LOG_CHANNEL_ID") or 0)
 CHANNEL_ID: int = int(os.getenv("ALLOWED_TEXT_CHANNEL_ID") or 0)
 WELCOME_CHANNEL_ID: int = int(os.getenv("WELCOME_CHANNEL_ID") or 0)
@@ -17,12 +20,40 @@ GOOGLE_SHEET_WORKSHEET = os.getenv("GOOGLE_SHEET_WORKSHEET", "Sheet1")
 # ----------------- Constants ----------------
 EXCEL_FILE: str = "data/reading_data.xlsx"
 GENRE_FILE: str = "data/genres.csv"
+GUILD_CONFIG_FILE: str = "data/guilds.json"  # Per-guild channel/data overrides
+GUILD_DATA_DIR: str = "data/guilds"  # Data partitions of non-primary guilds
+COMMAND_FINGERPRINT_FILE: str = "data/command_tree.json"  # Hash of the last synced commands per guild
 MAX_FIELDS: int = 25  # Max fields per embed in progress command
 DATE_CUTOFF_DAYS: int = 45  # 45 days in progress command
+ARCHIVE_AFTER_DAYS: int = max(int(os.getenv("ARCHIVE_AFTER_DAYS", 180)), DATE_CUTOFF_DAYS)  # Finished/shelved books untouched this long move to the archive
+MAX_ACTIVE_BOOKS: int = 25  # Books a user can be reading at the same time
+MAX_IMPORT_ROWS: int = 20000  # Rows accepted by a single /import_log upload
 STATUS_MAP: dict[int, str] = {0: "Shelved", 1: "Reading", 2: "Finished"}
 ENTRY_ROLE_NAME = "Reader"
 TEMPLATE_PATH = "resources/template.jpeg"
+CHART_CACHE_SIZE: int = 256  # Rendered chart PNGs kept in memory
+REPORT_WORKERS: int = 1  # Worker processes for exports, reports and charts; jobs beyond this wait in line
+REPORT_PROGRESS_SECONDS: float = 2.0  # How often a running report's progress message is refreshed
+QUERY_CACHE_SIZE: int = 1024  # Per-user query results (progress, book pickers) kept in memory
+BACKUP_DIR: str = os.getenv("BACKUP_DIR") or "data/backups"  # Rotating local backups of every data file
+BACKUP_INTERVAL_MINUTES: int = int(os.getenv("BACKUP_INTERVAL_MINUTES", 60))  # Minimum time between backups of a file
+BACKUP_DELTAS_PER_FULL: int = 24  # Incremental backups before a new full backup
+BACKUP_FULLS_KEPT: int = 3  # Full backups (with their deltas) kept per file
+LOG_FILE: str = "data/logs/bot.jsonl"  # Structured (JSON lines) log, rotated by size
+LOG_FILE_MAX_BYTES: int = 5 * 1024 * 1024
+LOG_FILE_BACKUPS: int = 5
+LOG_CHANNEL_FLUSH_SECONDS: int = 60  # Warnings/errors are posted to the log channel at most this often
+LOG_CHANNEL_BUFFER_SIZE: int = 500  # Warnings/errors buffered between posts (oldest dropped beyond this)
+AUTO_DEFER_AFTER_SECONDS: float = 2.0  # Slow handlers are deferred this long after the interaction was created
+HEALTH_HOST: str = "127.0.0.1"  # The health/metrics server only listens locally
+HEALTH_PORT: int = int(os.getenv("HEALTH_PORT") or 0)  # 0 disables /healthz, /readyz and /metrics
+HEALTH_MAX_HEARTBEAT_AGE: float = 90.0  # Seconds without a gateway heartbeat ack before /healthz fails
+RECORD_INTERACTIONS_FILE: str = os.getenv("RECORD_INTERACTIONS_FILE") or ""  # Opt-in interaction recording for loadtest.replay
+DATA_LOCK_TIMEOUT_SECONDS: float = 30.0  # How long to wait for a data file locked by another process
+DATA_LOCK_LEASE_SECONDS: float = 60.0  # How long a process expects to hold a data file's lock
+DATA_CHANGE_CHECK_SECONDS: int = 15  # How often data files are checked for changes made by other processes
 
 # ---------------- Bot Setup ----------------
 INTENTS = discord.Intents.default()
 INTENTS.members = True
+GUILD_OBJECTS: list[discord.Object] = [discord.Object(id=gid) for gid in GUILD_IDS]
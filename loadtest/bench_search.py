@@ -0,0 +1,98 @@
+"""
+Micro-benchmark of `/search` lookups (`utils.search_index.SearchIndex`) on a synthetic
+reading log held in memory, against a full scan of the log for comparison.
+
+Usage:
+    python -m loadtest.bench_search --works 18000 --rows 100000
+
+Titles and authors are drawn from a shared vocabulary so that words repeat across books,
+and readers favour popular books. For each query it reports the median and p95 time of
+the index lookup, and the median of a case-insensitive `str.contains` scan of every title
+and author (roughly what a search without the index would cost).
+"""
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime
+import pandas as pd
+from utils.excel import LOG_COLUMNS
+from utils.search_index import SearchIndex
+
+GUILD_ID = 1
+WORDS = 3000  # Distinct words titles and authors are drawn from
+
+
+def synthetic_log(works: int, rows: int, seed: int = 7) -> pd.DataFrame:
+    """Returns a log of `rows` rows spread over `works` distinct books, popular books logged most."""
+    rng = random.Random(seed)
+    vocabulary = [f"w{index:04d}" for index in range(WORDS)]
+    catalogue = [
+        (" ".join(rng.choices(vocabulary, k=rng.randint(1, 4))), " ".join(rng.choices(vocabulary, k=2)))
+        for _ in range(works)
+    ]
+    weights = [1 / (rank + 1) for rank in range(works)]
+    picks = rng.choices(range(works), weights=weights, k=rows)
+    now = datetime.now()
+    return pd.DataFrame({
+        "Date": [now] * rows,
+        "UserID": [str(100000 + index) for index in range(rows)],
+        "UserName": [f"reader{index}" for index in range(rows)],
+        "BookName": [catalogue[pick][0] for pick in picks],
+        "Author": [catalogue[pick][1] for pick in picks],
+        "Genres": ["fantasy"] * rows,
+        "LastPage": [0] * rows,
+        "TotalPages": [300] * rows,
+        "LastUpdated": [now] * rows,
+        "Status": [1] * rows,
+    }, columns=LOG_COLUMNS)
+
+
+def queries(df: pd.DataFrame) -> dict[str, str]:
+    """Returns queries by kind, taken from the log so that they match something."""
+    title, author = df.at[0, "BookName"], df.at[0, "Author"]
+    first_word = title.split()[0]
+    return {
+        "exact title": title,
+        "title and author": f"{title} {author.split()[0]}",
+        "one word": first_word,
+        "partial word": first_word[:3],
+        "broad prefix": "w",
+        "no match": "zzz",
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /search lookups.")
+    parser.add_argument("--works", type=int, default=18000, help="Distinct books (default 18000)")
+    parser.add_argument("--rows", type=int, default=100000, help="Rows in the synthetic log (default 100000)")
+    parser.add_argument("--repeat", type=int, default=200, help="Lookups per query (default 200)")
+    args = parser.parse_args()
+
+    df = synthetic_log(args.works, args.rows)
+    index = SearchIndex()
+    start = time.perf_counter()
+    index.rebuild(GUILD_ID, df)
+    print(f"{args.rows} rows, {df.groupby(['BookName', 'Author']).ngroups} works, index built in {time.perf_counter() - start:.2f} s")
+
+    text = (df["BookName"] + " " + df["Author"]).str.lower()
+    for kind, query in queries(df).items():
+        times = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            results = index.search(GUILD_ID, query)
+            times.append((time.perf_counter() - start) * 1000)
+        scans = []
+        for _ in range(5):
+            start = time.perf_counter()
+            text.str.contains(query.lower(), regex=False)
+            scans.append((time.perf_counter() - start) * 1000)
+        p95 = sorted(times)[int(len(times) * 0.95) - 1]
+        print(
+            f"  {kind:<17} {len(results):>2} results  index p50 {statistics.median(times):7.3f} ms"
+            f"  p95 {p95:7.3f} ms  scan {statistics.median(scans):7.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
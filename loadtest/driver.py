@@ -0,0 +1,282 @@
+"""
+End-to-end load test: runs the real bot (cogs, modals, storage) against `FakeDiscord`
+and fires synthetic slash-command and modal interactions at it.
+
+Usage:
+    python -m loadtest.driver --users 20 --books 3 --rounds 5 --concurrency 16 --latency-ms 40
+
+Every virtual user adds `--books` books through `/add_book` and its modal, then sends
+`--rounds` rounds of `/update_many` setting all of them to the round number. The report
+gives throughput, acknowledgement latency, missed 3-second acknowledgements and lost
+updates (changes the bot confirmed that are not in the reading log afterwards).
+Data, snapshots and backups are written to a temporary directory, never to `data/`; the
+report's `data_changes` lists any file under `data/` the run touched anyway.
+"""
+import argparse
+import asyncio
+import json
+import os
+import secrets
+import statistics
+import tempfile
+import time
+from loadtest.fake_discord import FakeDiscord, InteractionRecord, next_snowflake
+
+INTERACTION_COMMAND = 2
+INTERACTION_MODAL_SUBMIT = 5
+
+
+def configure_environment(guild_id: int, channel_id: int, data_dir: str):
+    """
+    Points the bot's guild and channel settings at the fake guild, and its backups at the
+    run's temporary data directory, for the driver and the replay.
+
+    Must run before `config` is imported: it reads these once at import time, and
+    load_dotenv() never overrides variables that are already set.
+    """
+    os.environ["ALLOWED_GUILD_ID"] = str(guild_id)
+    os.environ["ADDITIONAL_GUILD_IDS"] = ""
+    for name in ("LOG_CHANNEL_ID", "ALLOWED_TEXT_CHANNEL_ID", "WELCOME_CHANNEL_ID"):
+        os.environ[name] = str(channel_id)
+    os.environ["BACKUP_DIR"] = os.path.join(data_dir, "backups")
+
+
+def data_files(directory: str = "data") -> dict[str, tuple[int, int]]:
+    """Returns the (mtime_ns, size) of every file under `directory`, to check a run left it alone."""
+    files = {}
+    for root, _, names in os.walk(directory):
+        for name in names:
+            path = os.path.join(root, name)
+            stat = os.stat(path)
+            files[path] = (stat.st_mtime_ns, stat.st_size)
+    return files
+
+
+def changed_files(before: dict[str, tuple[int, int]], after: dict[str, tuple[int, int]]) -> list[str]:
+    """Returns the files created, changed or deleted between two `data_files` listings."""
+    return sorted(path for path in before.keys() | after.keys() if before.get(path) != after.get(path))
+
+
+class LoadTest:
+    """
+    Drives synthetic users through the bot and collects the results.
+
+    Args:
+        users (int): Number of virtual users.
+        books (int): Books each user adds.
+        rounds (int): `/update_many` rounds per user.
+        concurrency (int): Maximum interactions in flight at once.
+        latency_ms (float): Artificial latency of every fake Discord request.
+        timeout (float): Seconds to wait for an interaction's final response.
+    """
+
+    def __init__(self, users: int, books: int, rounds: int, concurrency: int, latency_ms: float, timeout: float):
+        self.users = users
+        self.books = books
+        self.rounds = rounds
+        self.timeout = timeout
+        self.semaphore = asyncio.Semaphore(concurrency)
+        self.fake = FakeDiscord(latency_ms)
+        self.guild_id = next_snowflake()
+        self.channel_id = next_snowflake()
+        self.user_ids = [next_snowflake() for _ in range(users)]
+        self.records: list[InteractionRecord] = []
+        self.timeouts = 0
+        self.confirmed_adds: set[tuple[str, str]] = set()
+        self.confirmed_pages: dict[tuple[str, str], int] = {}
+        self.bot = None
+        self.data_changes: list[str] = []  # Files under data/ the run touched (should stay empty)
+
+    def _dispatch(self, user_id: int, kind: str, interaction_type: int, data: dict, message: dict | None = None) -> InteractionRecord:
+        interaction_id = next_snowflake()
+        token = secrets.token_urlsafe(24)
+        record = self.fake.register_interaction(interaction_id, token, kind, interaction_type)
+        self.records.append(record)
+        self.bot._connection.parse_interaction_create({
+            "id": str(interaction_id),
+            "application_id": str(self.fake.application_id),
+            "type": interaction_type,
+            "token": token,
+            "version": 1,
+            "guild_id": str(self.guild_id),
+            "channel_id": str(self.channel_id),
+            "channel": {"id": str(self.channel_id), "type": 0, "guild_id": str(self.guild_id), "name": "channel-0"},
+            "member": self.fake.members[self.guild_id][user_id],
+            "data": data,
+            "app_permissions": "0",
+            "locale": "en-US",
+            "guild_locale": "en-US",
+            "entitlements": [],
+            "authorizing_integration_owners": {"0": str(self.guild_id)},
+            "context": 0,
+            **({"message": message} if message is not None else {}),
+        })
+        return record
+
+    async def _run(self, user_id: int, kind: str, interaction_type: int, data: dict, message: dict | None = None) -> InteractionRecord:
+        async with self.semaphore:
+            record = self._dispatch(user_id, kind, interaction_type, data, message)
+            try:
+                await asyncio.wait_for(record.done.wait(), self.timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+            return record
+
+    async def command(self, user_id: int, name: str, **options: str) -> InteractionRecord:
+        return await self._run(user_id, f"/{name}", INTERACTION_COMMAND, {
+            "id": str(next_snowflake()),
+            "name": name,
+            "type": 1,
+            "guild_id": str(self.guild_id),
+            "options": [{"name": key, "type": 3, "value": value} for key, value in options.items()],
+        })
+
+    async def submit_modal(self, user_id: int, kind: str, modal: dict, values: dict[str, str]) -> InteractionRecord:
+        """Submits a modal the bot sent, filling text inputs by label (others keep their default)."""
+        rows = [
+            {
+                "type": 1,
+                "components": [
+                    {"type": 4, "custom_id": item["custom_id"], "value": values.get(item.get("label"), item.get("value") or "")}
+                    for item in row["components"]
+                ],
+            }
+            for row in modal["components"]
+        ]
+        return await self._run(user_id, f"modal:{kind}", INTERACTION_MODAL_SUBMIT, {
+            "custom_id": modal["custom_id"],
+            "components": rows,
+        })
+
+    @staticmethod
+    def _reply(record: InteractionRecord) -> str:
+        return "\n".join(str(message.get("content") or "") for message in record.messages)
+
+    async def virtual_user(self, index: int, genre: str):
+        user_id = self.user_ids[index]
+        titles = [f"load test book {index}-{k}" for k in range(self.books)]
+
+        for title in titles:
+            opened = await self.command(user_id, "add_book")
+            if not opened.modal:
+                continue
+            submitted = await self.submit_modal(user_id, "add_book", opened.modal, {
+                "Book Name": title,
+                "Author(s) (Comma-separated)": "load tester",
+                "Genres (comma-separated)": genre,
+                "Last Page Read": "0",
+                "Total Pages": str(self.rounds + 100),
+            })
+            if "🎉" in self._reply(submitted):
+                self.confirmed_adds.add((str(user_id), title))
+
+        for page in range(1, self.rounds + 1):
+            record = await self.command(user_id, "update_many", updates="; ".join(f"{title} = {page}" for title in titles))
+            if self._reply(record).startswith("✅"):
+                for title in titles:
+                    self.confirmed_pages[(str(user_id), title)] = page
+
+    async def run(self) -> dict:
+        before = data_files()
+        with tempfile.TemporaryDirectory(prefix="booktracker-loadtest-") as data_dir:
+            configure_environment(self.guild_id, self.channel_id, data_dir)
+            # Imported here so the bot picks up the environment configured above.
+            import discord
+            import discord.webhook.async_
+            import bot as bot_module
+            import utils.genres
+            from utils import guilds
+            from utils.excel import read_excel_async, warm_guild_async
+
+            excel_path = os.path.join(data_dir, "reading_data.xlsx")
+            guilds.GUILD_CONFIG[self.guild_id] = {"excel_file": excel_path}
+
+            base_url = await self.fake.start()
+            discord.http.Route.BASE = base_url
+            discord.webhook.async_.Route.BASE = base_url
+
+            self.bot = bot_module.bot
+            await bot_module.load_cogs()
+            await self.bot.login("loadtest-token")
+            for i, user_id in enumerate(self.user_ids):
+                self.fake.make_member(self.guild_id, user_id, f"reader{i}")
+            self.bot._connection._add_guild_from_data(self.fake.make_guild(self.guild_id, [self.channel_id]))
+            await warm_guild_async(self.guild_id)
+
+            genre = next(g for g in utils.genres.GENRE_LIST if g != "audiobook")
+            started = time.perf_counter()
+            await asyncio.gather(*(self.virtual_user(i, genre) for i in range(self.users)))
+            elapsed = time.perf_counter() - started
+
+            df = await read_excel_async(excel_path)
+            pages = {
+                (str(user_id), str(name)): int(page)
+                for user_id, name, page in zip(df["UserID"], df["BookName"], df["LastPage"])
+            }
+            await self.bot.close()
+            await self.fake.stop()
+
+        self.data_changes = changed_files(before, data_files())
+        return self.report(elapsed, pages)
+
+    def report(self, elapsed: float, pages: dict[tuple[str, str], int]) -> dict:
+        """Summarizes the run; `pages` is the final LastPage of every (user, book) in the log."""
+        latencies = sorted(r.ack_latency * 1000 for r in self.records if r.ack_latency is not None)
+        completed = sum(1 for r in self.records if r.completed_at is not None)
+        missed = sum(1 for r in self.records if r.missed_ack)
+        lost_adds = sum(1 for key in self.confirmed_adds if key not in pages)
+        lost_updates = sum(1 for key, page in self.confirmed_pages.items() if pages.get(key) != page)
+        failed = sum(1 for r in self.records if any(mark in self._reply(r) for mark in ("❌", "⚠️")))
+
+        def percentile(p: float) -> float:
+            return latencies[min(int(len(latencies) * p), len(latencies) - 1)] if latencies else 0.0
+
+        return {
+            "interactions": len(self.records),
+            "completed": completed,
+            "timed_out": self.timeouts,
+            "elapsed_s": round(elapsed, 3),
+            "throughput_per_s": round(completed / elapsed, 2) if elapsed else 0.0,
+            "ack_ms_p50": round(statistics.median(latencies), 1) if latencies else 0.0,
+            "ack_ms_p95": round(percentile(0.95), 1),
+            "ack_ms_max": round(latencies[-1], 1) if latencies else 0.0,
+            "missed_acks": missed,
+            "missed_ack_rate": round(missed / len(self.records), 4) if self.records else 0.0,
+            "error_replies": failed,
+            "confirmed_adds": len(self.confirmed_adds),
+            "lost_adds": lost_adds,
+            "confirmed_updates": len(self.confirmed_pages),
+            "lost_updates": lost_updates,
+            "unhandled_routes": {
+                route: count for route, count in self.fake.request_counts.items() if "{tail}" in route
+            },
+            "data_changes": self.data_changes,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the bot against a local fake Discord API.")
+    parser.add_argument("--users", type=int, default=20, help="Virtual users (default 20)")
+    parser.add_argument("--books", type=int, default=3, help="Books added per user (default 3)")
+    parser.add_argument("--rounds", type=int, default=5, help="/update_many rounds per user (default 5)")
+    parser.add_argument("--concurrency", type=int, default=16, help="Interactions in flight (default 16)")
+    parser.add_argument("--latency-ms", type=float, default=40, help="Fake API latency per request (default 40)")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for each response (default 60)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the report as JSON to PATH")
+    args = parser.parse_args()
+
+    test = LoadTest(args.users, args.books, args.rounds, args.concurrency, args.latency_ms, args.timeout)
+    report = asyncio.run(test.run())
+
+    print("📊 Load test report")
+    for key, value in report.items():
+        print(f"  {key:<20} {value}")
+    if report["data_changes"]:
+        print(f"⚠️ The run changed files under data/: {', '.join(report['data_changes'])}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,328 @@
+import asyncio
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from aiohttp import web
+
+API_PREFIX = "/api/v10"
+ACK_DEADLINE_SECONDS: float = 3.0  # Discord drops interactions that are not acknowledged in time
+
+# Interaction callback types (https://discord.com/developers/docs/interactions/receiving-and-responding)
+CALLBACK_MESSAGE = 4
+CALLBACK_DEFERRED_MESSAGE = 5
+CALLBACK_DEFERRED_UPDATE = 6
+CALLBACK_UPDATE_MESSAGE = 7
+CALLBACK_MODAL = 9
+
+_snowflakes = itertools.count(1_300_000_000_000_000_000)
+
+
+def next_snowflake() -> int:
+    """Returns a new unique Discord-style ID."""
+    return next(_snowflakes)
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    # discord.py only decodes bodies whose Content-Type is exactly "application/json";
+    # aiohttp's json_response appends "; charset=utf-8".
+    return web.Response(body=json.dumps(data).encode(), status=status, content_type="application/json")
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+@dataclass
+class InteractionRecord:
+    """
+    Everything the fake server saw for one synthetic interaction.
+
+    Attributes:
+        interaction_id (int): The interaction's ID.
+        token (str): The interaction token used in callback and webhook URLs.
+        kind (str): Label of what was sent, e.g. "/update_many" or "modal:add_book".
+        sent_at (float): `time.perf_counter()` when the driver dispatched the interaction.
+        interaction_type (int): 2 for slash commands, 3 for components, 5 for modal submits.
+        acked_at (float | None): When the initial callback arrived.
+        callback_type (int | None): Type of the initial callback (4, 5, 6, 7 or 9).
+        completed_at (float | None): When the interaction produced its final visible response.
+        modal (dict | None): The modal payload, if the bot answered with a modal.
+        messages (list[dict]): Every message payload sent for the interaction.
+        sent (list[dict]): The message objects (with IDs) returned for those payloads, so a
+            later component interaction can refer to the message it was clicked on.
+    """
+    interaction_id: int
+    token: str
+    kind: str
+    sent_at: float
+    interaction_type: int = 2
+    acked_at: float | None = None
+    callback_type: int | None = None
+    completed_at: float | None = None
+    modal: dict | None = None
+    messages: list[dict] = field(default_factory=list)
+    sent: list[dict] = field(default_factory=list)
+    done: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def ack_latency(self) -> float | None:
+        return None if self.acked_at is None else self.acked_at - self.sent_at
+
+    @property
+    def missed_ack(self) -> bool:
+        return self.ack_latency is None or self.ack_latency > ACK_DEADLINE_SECONDS
+
+    def complete(self):
+        if self.completed_at is None:
+            self.completed_at = time.perf_counter()
+        self.done.set()
+
+
+class FakeDiscord:
+    """
+    A local stand-in for the Discord REST endpoints the bot uses, built on aiohttp.
+
+    It answers login, interaction callbacks, followups and original-response edits, channel
+    messages, and user/member fetches, and records the timing of every interaction response.
+    There is no gateway: the driver feeds interactions straight into the bot's connection state.
+
+    Args:
+        latency_ms (float, optional): Artificial delay added to every request, to mimic the
+            round trip to Discord. Defaults to 0.
+
+    Attributes:
+        bot_user (dict): The bot's user payload returned by `/users/@me`.
+        application_id (int): The application ID the bot logs in with.
+        users (dict[int, dict]): Known user payloads by ID.
+        members (dict[int, dict[int, dict]]): Member payloads by guild ID and user ID.
+        interactions (dict[str, InteractionRecord]): Records by interaction token.
+        channel_messages (list[dict]): Messages posted to channels (summaries, log channel, ...).
+        request_counts (dict[str, int]): Requests served per route, including unknown routes.
+    """
+
+    def __init__(self, latency_ms: float = 0):
+        self.latency = latency_ms / 1000
+        self.application_id = next_snowflake()
+        self.bot_user = self.make_user(self.application_id, "LoadTestBot", bot=True)
+        self.users: dict[int, dict] = {self.application_id: self.bot_user}
+        self.members: dict[int, dict[int, dict]] = {}
+        self.interactions: dict[str, InteractionRecord] = {}
+        self.channel_messages: list[dict] = []
+        self.request_counts: dict[str, int] = {}
+        self._runner: web.AppRunner | None = None
+        self.base_url = ""
+
+    # ---------------- Payload builders ----------------
+
+    @staticmethod
+    def make_user(user_id: int, name: str, bot: bool = False) -> dict:
+        return {
+            "id": str(user_id), "username": name, "global_name": name, "discriminator": "0",
+            "avatar": None, "bot": bot, "public_flags": 0,
+        }
+
+    def make_member(self, guild_id: int, user_id: int, name: str, permissions: int = 0) -> dict:
+        user = self.users.setdefault(user_id, self.make_user(user_id, name))
+        member = {
+            "user": user, "roles": [], "joined_at": _now_iso(), "deaf": False, "mute": False,
+            "nick": None, "pending": False, "flags": 0, "permissions": str(permissions),
+        }
+        self.members.setdefault(guild_id, {})[user_id] = member
+        return member
+
+    def make_guild(self, guild_id: int, channel_ids: list[int], name: str = "Load Test Guild") -> dict:
+        """Returns a guild payload with one text channel per ID, for the bot's guild cache."""
+        channels = [
+            {
+                "id": str(channel_id), "type": 0, "name": f"channel-{i}", "position": i,
+                "guild_id": str(guild_id), "permission_overwrites": [], "nsfw": False, "parent_id": None,
+            }
+            for i, channel_id in enumerate(channel_ids)
+        ]
+        everyone = {
+            "id": str(guild_id), "name": "@everyone", "permissions": str(0x800 | 0x400 | 0x80000000),
+            "position": 0, "color": 0, "hoist": False, "managed": False, "mentionable": False,
+        }
+        return {
+            "id": str(guild_id), "name": name, "owner_id": str(self.application_id), "roles": [everyone],
+            "channels": channels, "members": [], "member_count": len(self.members.get(guild_id, {})),
+            "features": [], "emojis": [], "stickers": [], "premium_tier": 0, "large": False,
+        }
+
+    def _message(self, channel_id: int | str | None, payload: dict, author: dict | None = None) -> dict:
+        return {
+            "id": str(next_snowflake()), "channel_id": str(channel_id or 0), "type": 0,
+            "content": payload.get("content") or "", "author": author or self.bot_user,
+            "attachments": [], "embeds": payload.get("embeds") or [], "components": payload.get("components") or [],
+            "mentions": [], "mention_roles": [], "mention_everyone": False, "pinned": False, "tts": False,
+            "timestamp": _now_iso(), "edited_timestamp": None, "flags": payload.get("flags") or 0,
+        }
+
+    # ---------------- Interaction bookkeeping ----------------
+
+    def register_interaction(self, interaction_id: int, token: str, kind: str, interaction_type: int = 2) -> InteractionRecord:
+        """Starts tracking an interaction just before the driver dispatches it."""
+        record = InteractionRecord(interaction_id, token, kind, time.perf_counter(), interaction_type)
+        self.interactions[token] = record
+        return record
+
+    # ---------------- HTTP handlers ----------------
+
+    async def _read_payload(self, request: web.Request) -> dict:
+        if request.content_type.startswith("multipart/"):
+            payload = {}
+            async for part in await request.multipart():
+                if part.name == "payload_json":
+                    payload = json.loads(await part.text())
+                else:
+                    await part.read()  # Attached files are accepted and dropped
+            return payload
+        if request.can_read_body:
+            try:
+                return await request.json()
+            except json.JSONDecodeError:
+                return {}
+        return {}
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler):
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else "unknown"
+        key = f"{request.method} {route}"
+        self.request_counts[key] = self.request_counts.get(key, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return await handler(request)
+
+    async def _users_me(self, request: web.Request):
+        return _json_response(self.bot_user)
+
+    async def _application_me(self, request: web.Request):
+        return _json_response({
+            "id": str(self.application_id), "name": "LoadTestBot", "icon": None, "description": "",
+            "bot_public": False, "bot_require_code_grant": False, "verify_key": "0" * 64,
+            "owner": self.bot_user, "flags": 0, "team": None, "rpc_origins": [],
+        })
+
+    async def _interaction_callback(self, request: web.Request):
+        record = self.interactions.get(request.match_info["token"])
+        payload = await self._read_payload(request)
+        callback_type = int(payload.get("type", 0))
+        if record is None:
+            return _json_response({"message": "Unknown interaction", "code": 10062}, status=404)
+        if record.acked_at is not None:
+            return _json_response({"message": "Interaction has already been acknowledged.", "code": 40060}, status=400)
+
+        record.acked_at = time.perf_counter()
+        record.callback_type = callback_type
+        data = payload.get("data") or {}
+        message = None
+        if callback_type == CALLBACK_MODAL:
+            record.modal = data
+            record.complete()
+        elif callback_type in (CALLBACK_MESSAGE, CALLBACK_UPDATE_MESSAGE):
+            message = self._message(None, data)
+            record.messages.append(data)
+            record.sent.append(message)
+            record.complete()
+
+        response = {"interaction": {"id": str(record.interaction_id), "type": record.interaction_type}}
+        if message is not None:
+            response["resource"] = {"type": callback_type, "message": message}
+        return _json_response(response)
+
+    async def _webhook_message(self, request: web.Request):
+        """Followups (POST) and edits of the original response (PATCH) complete a deferred interaction."""
+        record = self.interactions.get(request.match_info["token"])
+        payload = await self._read_payload(request)
+        message = self._message(None, payload)
+        if record is not None:
+            record.messages.append(payload)
+            record.sent.append(message)
+            record.complete()
+        return _json_response(message)
+
+    async def _get_original(self, request: web.Request):
+        return _json_response(self._message(None, {}))
+
+    async def _channel_message(self, request: web.Request):
+        payload = await self._read_payload(request)
+        message = self._message(request.match_info["channel_id"], payload)
+        self.channel_messages.append(message)
+        return _json_response(message)
+
+    async def _get_user(self, request: web.Request):
+        user = self.users.get(int(request.match_info["user_id"]))
+        if user is None:
+            return _json_response({"message": "Unknown User", "code": 10013}, status=404)
+        return _json_response(user)
+
+    async def _get_member(self, request: web.Request):
+        guild_members = self.members.get(int(request.match_info["guild_id"]), {})
+        member = guild_members.get(int(request.match_info["user_id"]))
+        if member is None:
+            return _json_response({"message": "Unknown Member", "code": 10007}, status=404)
+        return _json_response(member)
+
+    async def _list_members(self, request: web.Request):
+        guild_members = self.members.get(int(request.match_info["guild_id"]), {})
+        after = int(request.query.get("after", 0))
+        limit = int(request.query.get("limit", 1000))
+        members = [member for user_id, member in sorted(guild_members.items()) if user_id > after]
+        return _json_response(members[:limit])
+
+    async def _sync_commands(self, request: web.Request):
+        commands = await self._read_payload(request) or []
+        for command in commands:
+            command.setdefault("id", str(next_snowflake()))
+            command.setdefault("application_id", str(self.application_id))
+            command.setdefault("version", "1")
+        return _json_response(commands)
+
+    async def _unknown(self, request: web.Request):
+        return _json_response({"message": "Not implemented by the fake server", "code": 0}, status=404)
+
+    # ---------------- Lifecycle ----------------
+
+    def make_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware])
+        p = API_PREFIX
+        app.router.add_get(f"{p}/users/@me", self._users_me)
+        app.router.add_get(f"{p}/oauth2/applications/@me", self._application_me)
+        app.router.add_get(f"{p}/applications/@me", self._application_me)
+        app.router.add_post(f"{p}/interactions/{{interaction_id}}/{{token}}/callback", self._interaction_callback)
+        app.router.add_post(f"{p}/webhooks/{{application_id}}/{{token}}", self._webhook_message)
+        app.router.add_patch(f"{p}/webhooks/{{application_id}}/{{token}}/messages/{{message_id}}", self._webhook_message)
+        app.router.add_get(f"{p}/webhooks/{{application_id}}/{{token}}/messages/{{message_id}}", self._get_original)
+        app.router.add_post(f"{p}/channels/{{channel_id}}/messages", self._channel_message)
+        app.router.add_get(f"{p}/users/{{user_id}}", self._get_user)
+        app.router.add_get(f"{p}/guilds/{{guild_id}}/members/{{user_id}}", self._get_member)
+        app.router.add_get(f"{p}/guilds/{{guild_id}}/members", self._list_members)
+        app.router.add_put(f"{p}/applications/{{application_id}}/guilds/{{guild_id}}/commands", self._sync_commands)
+        app.router.add_route("*", "/{tail:.*}", self._unknown)
+        return app
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """
+        Starts serving and returns the API base URL to point the bot at.
+
+        Args:
+            host (str, optional): Interface to bind. Defaults to localhost.
+            port (int, optional): Port to bind; 0 picks a free port.
+
+        Returns:
+            str: e.g. "http://127.0.0.1:54321/api/v10".
+        """
+        self._runner = web.AppRunner(self.make_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        bound_port = site._server.sockets[0].getsockname()[1]
+        self.base_url = f"http://{host}:{bound_port}{API_PREFIX}"
+        return self.base_url
+
+    async def stop(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
@@ -0,0 +1,396 @@
+"""
+Replays a recording of real interactions (see `utils.recorder`) through the real bot
+(cogs, modals, views, storage) against `FakeDiscord` and a copy of the data.
+
+Usage:
+    python -m loadtest.replay recording.jsonl --data data/reading_data.xlsx --speed 10
+
+Record by starting the bot with `RECORD_INTERACTIONS_FILE=data/recording.jsonl`. Each
+user's interactions are replayed in order, a modal submit filling the modal the bot last
+opened for that user and a component click going to the same position in the message
+the bot last sent them. `--speed 1` keeps the original pacing, `--speed 10` runs ten
+times faster and `--speed 0` sends each interaction as soon as the previous one of that
+user is answered.
+
+The report gives per-interaction timings and a hash of the final data (timestamps left
+out), so a storage change can be checked for both speed and identical results: replay
+the same recording before and after, and compare. Use `--serial` for runs whose results
+must not depend on how concurrent users interleave.
+
+The data, its snapshots and its backups live in a temporary directory; the report's
+`data_changes` lists any file under `data/` the replay touched anyway.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from collections import Counter, defaultdict
+from loadtest.driver import (
+    LoadTest, INTERACTION_COMMAND, INTERACTION_MODAL_SUBMIT, configure_environment, data_files, changed_files
+)
+from loadtest.fake_discord import InteractionRecord, next_snowflake
+
+INTERACTION_COMPONENT = 3
+OPTION_USER = 6
+OPTION_MENTIONABLE = 9
+OPTION_ATTACHMENT = 11
+ADMINISTRATOR = 0x8
+VOLATILE_COLUMNS = ("Date", "LastUpdated")  # Set from the clock, so they differ between replays
+
+
+def load_recording(path: str) -> tuple[dict, list[dict]]:
+    """Returns the header and the interactions of a recording, oldest first."""
+    header, events = {}, []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("kind") == "header":
+                header = header or record
+            else:
+                events.append(record)
+    events.sort(key=lambda event: event["t"])
+    return header, events
+
+
+def _canonical(value) -> str:
+    if value is None or value != value:  # None or NaN
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def state_hash(frames: list) -> str:
+    """
+    Hashes reading logs independently of row order, number formatting and timestamps.
+
+    Args:
+        frames (list[pandas.DataFrame]): The data files' contents (e.g. hot log and archive).
+
+    Returns:
+        str: A SHA-256 hex digest.
+    """
+    digest = hashlib.sha256()
+    for df in frames:
+        stable = df.drop(columns=[column for column in VOLATILE_COLUMNS if column in df.columns])
+        rows = sorted(
+            tuple(_canonical(value) for value in row)
+            for row in stable.itertuples(index=False, name=None)
+        )
+        digest.update(json.dumps([list(stable.columns), rows]).encode())
+    return digest.hexdigest()
+
+
+class Replay(LoadTest):
+    """
+    Feeds recorded interactions of one guild through the bot.
+
+    Args:
+        header (dict): The recording's header (channel configuration of the recorded guilds).
+        events (list[dict]): The recorded interactions, oldest first.
+        data_path (str): The reading log to replay against; it is copied, never modified.
+        guild_id (int): The recorded guild to replay.
+        speed (float): Pacing relative to the recording; 0 replays without waiting.
+        serial (bool): Replay one interaction at a time in recorded order.
+        latency_ms (float): Artificial latency of every fake Discord request.
+        timeout (float): Seconds to wait for an interaction's first visible response.
+    """
+
+    def __init__(
+        self,
+        header: dict,
+        events: list[dict],
+        data_path: str,
+        guild_id: int,
+        speed: float,
+        serial: bool,
+        latency_ms: float,
+        timeout: float
+    ):
+        super().__init__(users=0, books=0, rounds=0, concurrency=1 if serial else 64, latency_ms=latency_ms, timeout=timeout)
+        self.events = [event for event in events if int(event["guild"]) == guild_id]
+        self.skipped_other_guilds = len(events) - len(self.events)
+        self.data_path = data_path
+        self.guild_id = guild_id
+        self.speed = speed
+        self.serial = serial
+        channels = header.get("guilds", {}).get(str(guild_id), {})
+        self.log_channel_id = int(channels.get("log_channel_id") or 0)
+        self.summary_channel_id = int(channels.get("summary_channel_id") or 0)
+        self.channel_ids = sorted(
+            {int(event["channel"]) for event in self.events} | {self.log_channel_id, self.summary_channel_id} - {0}
+        ) or [next_snowflake()]
+        self.channel_id = self.channel_ids[0]
+        self.admins = {int(event["user"]) for event in self.events if event.get("admin")}
+        self.user_ids = sorted({int(event["user"]) for event in self.events} | self._mentioned_users())
+        self.history: dict[int, list[InteractionRecord]] = defaultdict(list)
+        self.results: list[dict] = []
+        self.admin_role_id = next_snowflake()
+
+    def _mentioned_users(self) -> set[int]:
+        users = set()
+
+        def walk(options):
+            for option in options:
+                walk(option.get("options", []))
+                if option["type"] in (OPTION_USER, OPTION_MENTIONABLE) and str(option.get("value", "")).isdigit():
+                    users.add(int(option["value"]))
+
+        for event in self.events:
+            walk(event.get("options", []))
+        return users
+
+    # ---------------- Building payloads ----------------
+
+    def _command_data(self, event: dict) -> dict:
+        resolved = {"users": {}, "members": {}}
+
+        def walk(options):
+            for option in options:
+                walk(option.get("options", []))
+                if option["type"] in (OPTION_USER, OPTION_MENTIONABLE) and "value" in option:
+                    member = self.fake.members[self.guild_id].get(int(option["value"]))
+                    if member is not None:
+                        resolved["users"][str(option["value"])] = member["user"]
+                        resolved["members"][str(option["value"])] = {k: v for k, v in member.items() if k != "user"}
+
+        walk(event.get("options", []))
+        return {
+            "id": str(next_snowflake()),
+            "name": event["name"],
+            "type": 1,
+            "guild_id": str(self.guild_id),
+            "options": event.get("options", []),
+            "resolved": resolved,
+        }
+
+    @staticmethod
+    def _modal_data(modal: dict, fields: list[str]) -> dict:
+        position = 0
+        rows = []
+        for row in modal["components"]:
+            components = []
+            for item in row.get("components") or [row.get("component") or {}]:
+                value = fields[position] if position < len(fields) else item.get("value") or ""
+                components.append({"type": 4, "custom_id": item.get("custom_id"), "value": value})
+                position += 1
+            rows.append({"type": 1, "components": components})
+        return {"custom_id": modal["custom_id"], "components": rows}
+
+    def _clicked_message(self, user_id: int, event: dict) -> tuple[InteractionRecord, dict, str] | None:
+        """Finds the message the user last received with a component at the recorded position."""
+        position = event.get("position") or {"row": 0, "index": 0}
+        for record in reversed(self.history[user_id]):
+            for message in reversed(record.sent):
+                rows = message.get("components") or []
+                if position["row"] >= len(rows):
+                    continue
+                items = rows[position["row"]].get("components") or []
+                if position["index"] < len(items) and items[position["index"]].get("custom_id"):
+                    return record, message, items[position["index"]]["custom_id"]
+        return None
+
+    def _with_metadata(self, record: InteractionRecord, message: dict, user_id: int) -> dict:
+        # Views are stored against the interaction that sent them; Discord links the message back to it.
+        return {
+            **message,
+            "interaction_metadata": {
+                "id": str(record.interaction_id),
+                "type": record.interaction_type,
+                "user": self.fake.members[self.guild_id][user_id]["user"],
+                "authorizing_integration_owners": {"0": str(self.guild_id)},
+            },
+        }
+
+    # ---------------- Replaying ----------------
+
+    def _has_attachment(self, options: list[dict]) -> bool:
+        return any(option["type"] == OPTION_ATTACHMENT or self._has_attachment(option.get("options", [])) for option in options)
+
+    async def replay_event(self, index: int, event: dict) -> dict:
+        user_id = int(event["user"])
+        result = {"index": index, "user": event["user"], "kind": event["kind"]}
+        record = None
+        if event["kind"] == "command":
+            result["kind"] = f"/{event['name']}"
+            if self._has_attachment(event.get("options", [])):
+                return {**result, "skipped": "attachments are not recorded"}
+            record = await self._run(user_id, result["kind"], INTERACTION_COMMAND, self._command_data(event))
+        elif event["kind"] == "modal":
+            opened = next((r for r in reversed(self.history[user_id]) if r.modal), None)
+            if opened is None:
+                return {**result, "skipped": "no modal was opened"}
+            result["kind"] = f"modal:{opened.kind.lstrip('/')}"
+            record = await self._run(user_id, result["kind"], INTERACTION_MODAL_SUBMIT, self._modal_data(opened.modal, event.get("fields", [])))
+        elif event["kind"] == "component":
+            found = self._clicked_message(user_id, event)
+            if found is None:
+                return {**result, "skipped": "no message with that component"}
+            source, message, custom_id = found
+            result["kind"] = f"component:{source.kind.lstrip('/')}"
+            record = await self._run(user_id, result["kind"], INTERACTION_COMPONENT, {
+                "custom_id": custom_id,
+                "component_type": event.get("component_type", 2),
+                "values": event.get("values", []),
+            }, self._with_metadata(source, message, user_id))
+
+        self.history[user_id].append(record)
+        reply = self._reply(record)
+        return {
+            **result,
+            "ack_ms": round(record.ack_latency * 1000, 1) if record.ack_latency is not None else None,
+            "done_ms": round((record.completed_at - record.sent_at) * 1000, 1) if record.completed_at else None,
+            "callback_type": record.callback_type,
+            "reply": reply[:120],
+        }
+
+    async def _replay_sequence(self, events: list[tuple[int, dict]], started: float, first_t: float):
+        for index, event in events:
+            if self.speed > 0:
+                delay = started + (event["t"] - first_t) / self.speed - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            self.results.append(await self.replay_event(index, event))
+
+    async def run(self) -> dict:
+        before = data_files()
+        with tempfile.TemporaryDirectory(prefix="booktracker-replay-") as data_dir:
+            configure_environment(self.guild_id, self.channel_id, data_dir)
+            os.environ["RECORD_INTERACTIONS_FILE"] = ""  # Never record the replay itself
+            os.environ["HEALTH_PORT"] = ""
+            import discord
+            import discord.webhook.async_
+            import bot as bot_module
+            from utils import guilds
+            from utils.excel import read_excel_async, warm_guild_async
+
+            excel_path = os.path.join(data_dir, "reading_data.xlsx")
+            shutil.copyfile(self.data_path, excel_path)
+            root, ext = os.path.splitext(self.data_path)
+            if os.path.exists(f"{root}_archive{ext}"):
+                shutil.copyfile(f"{root}_archive{ext}", os.path.join(data_dir, f"reading_data_archive{ext}"))
+            guilds.GUILD_CONFIG[self.guild_id] = {
+                "excel_file": excel_path,
+                "log_channel_id": self.log_channel_id or self.channel_id,
+                "summary_channel_id": self.summary_channel_id or self.channel_id,
+            }
+
+            base_url = await self.fake.start()
+            discord.http.Route.BASE = base_url
+            discord.webhook.async_.Route.BASE = base_url
+
+            self.bot = bot_module.bot
+            await bot_module.load_cogs()
+            await self.bot.login("replay-token")
+            for user_id in self.user_ids:
+                admin = user_id in self.admins
+                member = self.fake.make_member(self.guild_id, user_id, f"reader{user_id}", ADMINISTRATOR if admin else 0)
+                if admin:
+                    member["roles"] = [str(self.admin_role_id)]
+            guild = self.fake.make_guild(self.guild_id, self.channel_ids)
+            guild["roles"].append({
+                "id": str(self.admin_role_id), "name": "Admin", "permissions": str(ADMINISTRATOR), "position": 1,
+                "color": 0, "hoist": False, "managed": False, "mentionable": False,
+            })
+            self.bot._connection._add_guild_from_data(guild)
+            await warm_guild_async(self.guild_id)
+
+            indexed = list(enumerate(self.events))
+            first_t = self.events[0]["t"] if self.events else 0.0
+            started = time.perf_counter()
+            if self.serial:
+                await self._replay_sequence(indexed, started, first_t)
+            else:
+                by_user = defaultdict(list)
+                for index, event in indexed:
+                    by_user[event["user"]].append((index, event))
+                await asyncio.gather(*(self._replay_sequence(events, started, first_t) for events in by_user.values()))
+            elapsed = time.perf_counter() - started
+
+            frames = [await read_excel_async(excel_path)]
+            archive_path = guilds.guild_archive_path(self.guild_id)
+            if os.path.exists(archive_path):
+                frames.append(await read_excel_async(archive_path))
+            await self.bot.close()
+            await self.fake.stop()
+
+        self.data_changes = changed_files(before, data_files())
+        return self.replay_report(elapsed, frames)
+
+    def replay_report(self, elapsed: float, frames: list) -> dict:
+        """Summarizes timings per kind of interaction and fingerprints the final data."""
+        self.results.sort(key=lambda result: result["index"])
+        replayed = [result for result in self.results if "skipped" not in result]
+        by_kind = defaultdict(list)
+        for result in replayed:
+            if result["done_ms"] is not None:
+                by_kind[result["kind"]].append(result["done_ms"])
+
+        def summary(values: list[float]) -> dict:
+            values = sorted(values)
+            return {
+                "count": len(values),
+                "p50_ms": round(statistics.median(values), 1),
+                "p95_ms": values[min(int(len(values) * 0.95), len(values) - 1)],
+                "max_ms": values[-1],
+            }
+
+        return {
+            "interactions": len(self.events),
+            "replayed": len(replayed),
+            "skipped": dict(Counter(result["skipped"] for result in self.results if "skipped" in result)),
+            "skipped_other_guilds": self.skipped_other_guilds,
+            "timed_out": self.timeouts,
+            "data_changes": self.data_changes,
+            "missed_acks": sum(1 for result in replayed if result["ack_ms"] is None or result["ack_ms"] > 3000),
+            "elapsed_s": round(elapsed, 3),
+            "rows": sum(len(frame) for frame in frames),
+            "state_hash": state_hash(frames),
+            "by_kind": {kind: summary(values) for kind, values in sorted(by_kind.items())},
+            "slowest": sorted(replayed, key=lambda result: result["done_ms"] or 0, reverse=True)[:10],
+            "results": self.results,
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay recorded interactions against a copy of the data.")
+    parser.add_argument("recording", help="JSON lines file written with RECORD_INTERACTIONS_FILE")
+    parser.add_argument("--data", required=True, help="Reading log to replay against (copied, never modified)")
+    parser.add_argument("--guild", type=int, help="Recorded guild to replay (default: the one with most interactions)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Pacing relative to the recording; 0 = no waiting (default 1)")
+    parser.add_argument("--serial", action="store_true", help="One interaction at a time, in recorded order")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Fake API latency per request (default 0)")
+    parser.add_argument("--timeout", type=float, default=60, help="Seconds to wait for each response (default 60)")
+    parser.add_argument("--json", metavar="PATH", help="Also write the full report, with every interaction, as JSON")
+    args = parser.parse_args()
+
+    header, events = load_recording(args.recording)
+    if not events:
+        parser.error("The recording has no interactions.")
+    guild_id = args.guild or int(Counter(event["guild"] for event in events).most_common(1)[0][0])
+
+    replay = Replay(header, events, args.data, guild_id, args.speed, args.serial, args.latency_ms, args.timeout)
+    report = asyncio.run(replay.run())
+
+    print("🔁 Replay report")
+    for key in ("interactions", "replayed", "skipped", "skipped_other_guilds", "timed_out", "missed_acks", "elapsed_s", "rows", "state_hash", "data_changes"):
+        print(f"  {key:<20} {report[key]}")
+    if report["data_changes"]:
+        print(f"⚠️ The replay changed files under data/: {', '.join(report['data_changes'])}")
+    print("  Per interaction kind:")
+    for kind, stats in report["by_kind"].items():
+        print(f"    {kind:<28} n={stats['count']:<5} p50={stats['p50_ms']}ms p95={stats['p95_ms']}ms max={stats['max_ms']}ms")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+
+
+if __name__ == "__main__":
+    main()
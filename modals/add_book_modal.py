@@ -1,16 +1,28 @@
 # modals/add_book_modal.py
 
-from discord import ui, Interaction
+from discord import ui, Interaction, AllowedMentions
 from datetime import datetime
 import pandas as pd
 
-from utils.excel import read_excel_async, write_excel_async, filter_booknames_with_user_status
+from utils.excel import read_excel_async, commit_excel_async, count_user_books, excel_transaction, append_rows
 from utils.time_data import parse_time_to_minutes
 import utils.genres
-from config import EXCEL_FILE, GUILD_ID
+from config import MAX_ACTIVE_BOOKS
+from utils.guilds import guild_excel_path, is_allowed_guild
+from utils.book_index import BOOKS
+from utils.readers import READERS, format_readers
+from utils.lock_replies import DataLockModal
 
 
-class AddBookModal(ui.Modal):
+def other_readers_line(guild_id: int, user_id: str, title: str, author: str) -> str:
+    """Returns a "who else has this book" line for the add confirmation, or "" if nobody does."""
+    readers = READERS.get(guild_id, title, author, exclude=str(user_id))
+    if not readers:
+        return ""
+    return f"\n👥 Also on this book: {format_readers(readers)}. Say hi and compare notes!"
+
+
+class AddBookModal(DataLockModal):
     """A Discord UI Modal for adding a new book to the user's reading list.
 
     This modal collects information about a book, including its name, author(s), genres,
@@ -25,12 +37,18 @@ class AddBookModal(ui.Modal):
         genres (ui.TextInput): The genres of the book, comma-separated.
         lastpage (ui.TextInput): The last page read by the user.
         totalpages (ui.TextInput): The total number of pages in the book.
+
+    Args:
+        prefill (dict | None, optional): A catalogue entry (see `utils.catalogue`) whose title,
+            author, genres and total pages are filled in.
     """
 
-    def __init__(self):
+    def __init__(self, prefill: dict | None = None):
         super().__init__(title="📚 Add a new book")
+        prefill = prefill or {}
         self.bookname = ui.TextInput(
             label="Book Name",
+            default=prefill.get("title", "").title() or None,
             placeholder="e.g. Good Omens",
             required=True,
             max_length=150,
@@ -38,6 +56,7 @@ class AddBookModal(ui.Modal):
         )
         self.author = ui.TextInput(
             label="Author(s) (Comma-separated)",
+            default=prefill.get("author", "").title() or None,
             placeholder="e.g. Neil Gaiman, Terry Pratchett",
             required=True,
             max_length=100,
@@ -45,6 +64,7 @@ class AddBookModal(ui.Modal):
         )
         self.genres = ui.TextInput(
             label="Genres (comma-separated)",
+            default=", ".join(prefill.get("genres", [])) or None,
             placeholder=", ".join(utils.genres.GENRE_LIST[:5]) + ", ...",
             required=True,
             max_length=200,
@@ -60,6 +80,7 @@ class AddBookModal(ui.Modal):
         )
         self.totalpages = ui.TextInput(
             label="Total Pages",
+            default=str(prefill["total"]) if prefill.get("total") else None,
             placeholder="e.g. 300",
             required=True,
             max_length=10,
@@ -79,20 +100,11 @@ class AddBookModal(ui.Modal):
         """
         await interaction.response.defer(ephemeral=True)
 
-        if not interaction.guild or interaction.guild.id != GUILD_ID:
+        if not interaction.guild or not is_allowed_guild(interaction.guild.id):
             await interaction.followup.send("This is not the allowed server.", ephemeral=True)
             return
-        
-        user_books = await filter_booknames_with_user_status(str(interaction.user.id), 1)
-        if len(user_books) >= 25:
-            await interaction.followup.send(
-                "⚠️ You have reached the limit of 25 active books. Please shelve some books using `/shelf_book` before adding new ones.",
-                ephemeral=True
-            )
-            return
 
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str)
+        excel_path = guild_excel_path(interaction.guild.id)
 
         genre_values = list(set([g.strip().lower() for g in self.genres.value.split(",")]))
         invalid_genres = [g for g in genre_values if g not in utils.genres.GENRE_SET]
@@ -150,24 +162,31 @@ class AddBookModal(ui.Modal):
                 "Status": 1
             }
 
-        match = (
-            (df["UserID"] == new_entry["UserID"]) &
-            (df["BookName"].str.lower() == new_entry["BookName"].lower()) &
-            (~df["Genres"].str.contains("audiobook", na=False))
-        )
-        if match.any():
+        # Both checks run under the lock, so concurrent adds can't both pass them.
+        async with excel_transaction(interaction.guild.id):
+            at_limit = count_user_books(interaction.guild.id, new_entry["UserID"], 1) >= MAX_ACTIVE_BOOKS
+            exists = BOOKS.contains(interaction.guild.id, new_entry["UserID"], new_entry["BookName"], is_audio=False)
+            if not at_limit and not exists:
+                df = await read_excel_async(excel_path)
+                df = append_rows(df, pd.DataFrame([new_entry]))
+                await commit_excel_async(df, interaction.guild.id, added=df.tail(1))
+
+        if at_limit:
+            await interaction.followup.send(
+                f"⚠️ You have reached the limit of {MAX_ACTIVE_BOOKS} active books. Please shelve some books using `/shelf_book` before adding new ones.",
+                ephemeral=True
+            )
+        elif exists:
             await interaction.followup.send(
                 f"⚠️ **{self.bookname.value.title()}** already exists. Use `/update_book` to update progress.",
                 ephemeral=True
             )
         else:
-             
-            df = pd.concat([df, pd.DataFrame([new_entry])], ignore_index=True)
-             
-            await write_excel_async(df, EXCEL_FILE)
+            others = other_readers_line(interaction.guild.id, new_entry["UserID"], new_entry["BookName"], new_entry["Author"])
             await interaction.followup.send(
-                f"🎉 **{interaction.user.mention}** added **{self.bookname.value.title()}** by *{self.author.value.title()}*! Happy reading! 📚",
-                ephemeral=False
+                f"🎉 **{interaction.user.mention}** added **{self.bookname.value.title()}** by *{self.author.value.title()}*! Happy reading! 📚{others}",
+                ephemeral=False,
+                allowed_mentions=AllowedMentions(users=[interaction.user])
             )
             if finished_reading:
                 await interaction.followup.send(
@@ -177,7 +196,7 @@ class AddBookModal(ui.Modal):
                 )
 
 
-class AddAudioBookModal(ui.Modal):
+class AddAudioBookModal(DataLockModal):
     """A Discord UI Modal for adding a new audiobook to the user's reading list.
 
     This modal collects information about an audiobook, including its name, author(s), genres,
@@ -192,12 +211,18 @@ class AddAudioBookModal(ui.Modal):
         genres (ui.TextInput): The genres of the audiobook, comma-separated.
         minutesread (ui.TextInput): Number of minutes the user heard the audiobook.
         totalminutes (ui.TextInput): Total no of minutes the audiobook lasts.
+
+    Args:
+        prefill (dict | None, optional): A catalogue entry (see `utils.catalogue`) whose title,
+            author, genres and total minutes are filled in.
     """
 
-    def __init__(self):
+    def __init__(self, prefill: dict | None = None):
         super().__init__(title="📚 Add a new audiobook")
+        prefill = prefill or {}
         self.bookname = ui.TextInput(
             label="AudioBook Name",
+            default=prefill.get("title", "").title() or None,
             placeholder="e.g. The Great Gatsby",
             required=True,
             max_length=150,
@@ -205,6 +230,7 @@ class AddAudioBookModal(ui.Modal):
         )
         self.author = ui.TextInput(
             label="Author(s) (Comma-separated)",
+            default=prefill.get("author", "").title() or None,
             placeholder="e.g. F Scott Fitzgerald",
             required=True,
             max_length=100,
@@ -212,6 +238,7 @@ class AddAudioBookModal(ui.Modal):
         )
         self.genres = ui.TextInput(
             label="Genres (comma-separated)",
+            default=", ".join(prefill.get("genres", [])) or None,
             placeholder=", ".join(utils.genres.GENRE_LIST[:5]) + ", ...",
             required=True,
             max_length=200,
@@ -227,6 +254,7 @@ class AddAudioBookModal(ui.Modal):
         )
         self.totalminutes = ui.TextInput(
             label="Total Minutes",
+            default=str(prefill["total"]) if prefill.get("total") else None,
             placeholder="e.g. 9h30m or 570m or 570",
             required=True,
             max_length=10,
@@ -246,19 +274,11 @@ class AddAudioBookModal(ui.Modal):
         """
         await interaction.response.defer(ephemeral=True)
 
-        if not interaction.guild or interaction.guild.id != GUILD_ID:
+        if not interaction.guild or not is_allowed_guild(interaction.guild.id):
             await interaction.followup.send("This is not the allowed server.", ephemeral=True)
             return
-        
-        user_books = await filter_booknames_with_user_status(str(interaction.user.id), 1)
-        if len(user_books) >= 25:
-            await interaction.followup.send(
-                "⚠️ You have reached the limit of 25 active books. Please shelve some books using `/shelf_book` before adding new ones.",
-                ephemeral=True
-            )
-            return
 
-        df = await read_excel_async(EXCEL_FILE)
+        excel_path = guild_excel_path(interaction.guild.id)
 
         user_genre_list = [g.strip().lower() for g in set(self.genres.value.split(","))]
         user_genre_list.append("audiobook")
@@ -325,24 +345,31 @@ class AddAudioBookModal(ui.Modal):
                 "Status": 1
             }
 
-        match = (
-            (df["UserID"] == new_entry["UserID"]) &
-            (df["BookName"].str.lower() == new_entry["BookName"].lower()) &
-            (df["Genres"].str.contains("audiobook", na=False))
-        )
-        if match.any():
+        # Both checks run under the lock, so concurrent adds can't both pass them.
+        async with excel_transaction(interaction.guild.id):
+            at_limit = count_user_books(interaction.guild.id, new_entry["UserID"], 1) >= MAX_ACTIVE_BOOKS
+            exists = BOOKS.contains(interaction.guild.id, new_entry["UserID"], new_entry["BookName"], is_audio=True)
+            if not at_limit and not exists:
+                df = await read_excel_async(excel_path)
+                df = append_rows(df, pd.DataFrame([new_entry]))
+                await commit_excel_async(df, interaction.guild.id, added=df.tail(1))
+
+        if at_limit:
+            await interaction.followup.send(
+                f"⚠️ You have reached the limit of {MAX_ACTIVE_BOOKS} active books. Please shelve some books using `/shelf_book` before adding new ones.",
+                ephemeral=True
+            )
+        elif exists:
             await interaction.followup.send(
                 f"⚠️ **{self.bookname.value.title()}** already exists. Use `/update_audiobook` to update progress.",
                 ephemeral=True
             )
         else:
-             
-            df = pd.concat([df, pd.DataFrame([new_entry])], ignore_index=True)
-             
-            await write_excel_async(df, EXCEL_FILE)
+            others = other_readers_line(interaction.guild.id, new_entry["UserID"], new_entry["BookName"], new_entry["Author"])
             await interaction.followup.send(
-                f"🎉 **{interaction.user.mention}** added **{self.bookname.value.title()}** by *{self.author.value.title()}*! Happy reading! 🎧📚",
-                ephemeral=False
+                f"🎉 **{interaction.user.mention}** added **{self.bookname.value.title()}** by *{self.author.value.title()}*! Happy reading! 🎧📚{others}",
+                ephemeral=False,
+                allowed_mentions=AllowedMentions(users=[interaction.user])
             )
             if finished_reading:
                 await interaction.followup.send(
@@ -2,10 +2,13 @@ import string
 from datetime import datetime
 import discord
 from discord import Interaction
-from config import EXCEL_FILE, DEBUG
-from utils.excel import read_excel_async, write_excel_async
+from utils.excel import update_entry
+from utils.lock_replies import DataLockModal
+from utils.logs import get_logger
 
-class ShelfBookModal(discord.ui.Modal):
+logger = get_logger(__name__)
+
+class ShelfBookModal(DataLockModal):
     """
     A Discord UI Modal for shelving a book in the user's reading log.
     This modal prompts the user to provide a reason for shelving a selected book.
@@ -45,37 +48,31 @@ class ShelfBookModal(discord.ui.Modal):
             
             strip_chars = string.digits + string.whitespace + string.punctuation
             if not self.reason.value.strip(strip_chars):
-                if DEBUG:
-                    print("⚠️ No reason provided.")
+                logger.debug("⚠️ No reason provided.")
                 await interaction.followup.send("⚠️ Please provide a reason.", ephemeral=True)
                 return
 
-            df = await read_excel_async(EXCEL_FILE)
-            df["UserID"] = df["UserID"].astype(str)
-
-            match = (
-                (df["UserID"] == str(interaction.user.id)) &
-                (df["BookName"].str.lower() == self.selected_book.lower())
+            updated = await update_entry(
+                interaction.guild_id,
+                interaction.user.id,
+                self.selected_book,
+                {"Status": 0, "LastUpdated": datetime.now()}
             )
 
-            if not match.any():
+            if not updated:
                 await interaction.followup.send(
                     "⚠️ Book not found in your reading log. Please add it first using `/add_book`.",
                     ephemeral=True
                 )
                 return
 
-            df.loc[match, ["Status", "LastUpdated"]] = [0, datetime.now()]
-            await write_excel_async(df, EXCEL_FILE)
-
             await interaction.followup.send(
                 f"📚 <@{interaction.user.id}> shelved **{self.selected_book}**.\nReason: _{self.reason.value}_",
                 ephemeral=False
             )
 
         except Exception as e:
-            if DEBUG:
-                print("❌ Error in modal on_submit:", e)
+            logger.error(f"❌ Error in modal on_submit: {e}", exc_info=True)
             await interaction.followup.send(
                 f"❌ Something went wrong: {e}",
                 ephemeral=True
@@ -1,17 +1,19 @@
 from datetime import datetime
 from discord import ui, Interaction
-from utils.excel import read_excel_async, write_excel_async
+from utils.excel import update_entry
+from utils.lock_replies import DataLockModal
 from utils.time_data import parse_time_to_minutes
-from config import EXCEL_FILE
+from utils.book_index import BOOKS
+from utils.text import normalize_title
 import utils.genres
 
 
 
-class UpdateBookModal(ui.Modal, title="✏️ Update book progress."):
+class UpdateBookModal(DataLockModal, title="✏️ Update book progress."):
     """
     UpdateBookModal is a Discord UI modal for updating the progress of a book in a user's reading log.
     Args:
-        book (dict): A dictionary containing the book's current details, including "BookName", "Author", "Genres", "LastPage", and "TotalPages".
+        book (ReadingEntry | dict): The book's current details (a `utils.entries.ReadingEntry` or a row dict), including "BookName", "Author", "Genres", "LastPage", and "TotalPages".
     Attributes:
         selected_book (str): The name of the book being updated.
         bookname (ui.TextInput): Input field for the book's name.
@@ -51,14 +53,15 @@ class UpdateBookModal(ui.Modal, title="✏️ Update book progress."):
     async def on_submit(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str) 
-
-        match = (
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["BookName"].str.lower() == self.selected_book.lower()) &
-            (~df["Genres"].str.contains("audiobook", na=False))
-        )
+        new_name = self.bookname.value.strip()
+        if normalize_title(new_name) != normalize_title(self.selected_book) and BOOKS.contains(
+            interaction.guild_id, interaction.user.id, new_name, is_audio=False
+        ):
+            await interaction.followup.send(
+                f"⚠️ You already have **{new_name.title()}** in your reading log.",
+                ephemeral=True
+            )
+            return
         
         genre_values = [genre.strip().lower() for genre in set(self.genres.value.split(","))]
         invalid_genres = [genre for genre in genre_values if genre not in utils.genres.GENRE_SET]
@@ -96,29 +99,23 @@ class UpdateBookModal(ui.Modal, title="✏️ Update book progress."):
         
         finished_reading: bool = int(self.lastpage.value.strip()) == int(self.totalpages.value.strip())
 
-         
+        changes = {
+            "BookName": self.bookname.value.strip(),
+            "Author": self.author.value.strip(),
+            "Genres": ", ".join([genre for genre in genre_values]),
+            "LastPage": last_page,
+            "TotalPages": total_pages,
+            "LastUpdated": datetime.now(),
+        }
         if finished_reading:
-            df.loc[match, ["BookName", "Author", "Genres", "LastPage", "TotalPages", "LastUpdated", "Status"]] = [
-                self.bookname.value.strip(),
-                self.author.value.strip(),
-                ", ".join([genre for genre in genre_values]),
-                last_page,
-                total_pages,
-                datetime.now(),
-                2
-            ]
-        else:
-            df.loc[match, ["BookName", "Author", "Genres", "LastPage", "TotalPages", "LastUpdated"]] = [
-                self.bookname.value.strip(),
-                self.author.value.strip(),
-                ", ".join([genre for genre in genre_values]),
-                last_page,
-                total_pages,
-                datetime.now()
-            ]
-         
+            changes["Status"] = 2
 
-        await write_excel_async(df, EXCEL_FILE)
+        updated = await update_entry(
+            interaction.guild_id, interaction.user.id, self.selected_book, changes, is_audio=False
+        )
+        if not updated:
+            await interaction.followup.send("⚠️ Book not found in your reading log.", ephemeral=True)
+            return
 
         if finished_reading:
             msg = (
@@ -135,11 +132,11 @@ class UpdateBookModal(ui.Modal, title="✏️ Update book progress."):
 
 
 
-class UpdateAudioBookModal(ui.Modal, title="✏️ Update book progress."):
+class UpdateAudioBookModal(DataLockModal, title="✏️ Update book progress."):
     """
     UpdateBookModal is a Discord UI modal for updating the progress of a book in a user's reading log.
     Args:
-        book (dict): A dictionary containing the book's current details, including "BookName", "Author", "Genres", "LastPage", and "TotalPages".
+        book (ReadingEntry | dict): The book's current details (a `utils.entries.ReadingEntry` or a row dict), including "BookName", "Author", "Genres", "LastPage", and "TotalPages".
     Attributes:
         selected_book (str): The name of the audiobook being updated.
         bookname (ui.TextInput): The name of the audiobook.
@@ -179,14 +176,15 @@ class UpdateAudioBookModal(ui.Modal, title="✏️ Update book progress."):
     async def on_submit(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
 
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str) 
-
-        match = (
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["BookName"].str.lower() == self.selected_book.lower()) &
-            (df["Genres"].str.contains("audiobook", na=False))
-        )
+        new_name = self.bookname.value.strip()
+        if normalize_title(new_name) != normalize_title(self.selected_book) and BOOKS.contains(
+            interaction.guild_id, interaction.user.id, new_name, is_audio=True
+        ):
+            await interaction.followup.send(
+                f"⚠️ You already have **{new_name.title()}** in your reading log.",
+                ephemeral=True
+            )
+            return
         
         user_genre_list = [g.strip().lower() for g in set(self.genres.value.split(","))]
         user_genre_list.append("audiobook")
@@ -226,29 +224,23 @@ class UpdateAudioBookModal(ui.Modal, title="✏️ Update book progress."):
         
         finished_reading: bool = (last_minute == total_minutes)
 
-         
+        changes = {
+            "BookName": self.bookname.value.strip(),
+            "Author": self.author.value.strip(),
+            "Genres": ", ".join([genre for genre in genre_values]),
+            "LastPage": last_minute,
+            "TotalPages": total_minutes,
+            "LastUpdated": datetime.now(),
+        }
         if finished_reading:
-            df.loc[match, ["BookName", "Author", "Genres", "LastPage", "TotalPages", "LastUpdated", "Status"]] = [
-                self.bookname.value.strip(),
-                self.author.value.strip(),
-                ", ".join([genre for genre in genre_values]),
-                last_minute,
-                total_minutes,
-                datetime.now(),
-                2
-            ]
-        else:
-            df.loc[match, ["BookName", "Author", "Genres", "LastPage", "TotalPages", "LastUpdated"]] = [
-                self.bookname.value.strip(),
-                self.author.value.strip(),
-                ", ".join([genre for genre in genre_values]),
-                last_minute,
-                total_minutes,
-                datetime.now()
-            ]
-         
+            changes["Status"] = 2
 
-        await write_excel_async(df, EXCEL_FILE)
+        updated = await update_entry(
+            interaction.guild_id, interaction.user.id, self.selected_book, changes, is_audio=True
+        )
+        if not updated:
+            await interaction.followup.send("⚠️ Book not found in your reading log.", ephemeral=True)
+            return
 
         if finished_reading:
             msg = (
@@ -0,0 +1,90 @@
+from datetime import datetime, timedelta
+import pandas as pd
+from config import ARCHIVE_AFTER_DAYS
+from utils.excel import (
+    read_excel_async, write_excel_async, commit_excel_async,
+    read_archive_async, as_archived, excel_transaction, append_rows
+)
+from utils.guilds import guild_excel_path, guild_archive_path
+from utils.book_index import BOOKS
+
+
+def stale_rows_mask(df: pd.DataFrame, days: int = ARCHIVE_AFTER_DAYS, now: datetime | None = None) -> pd.Series:
+    """
+    Returns a mask of rows that belong in the cold tier: finished or shelved books
+    that have not been updated in the last `days` days.
+    """
+    cutoff = (now or datetime.now()) - timedelta(days=days)
+    updated = pd.to_datetime(df["LastUpdated"], errors="coerce")
+    return df["Status"].isin([0, 2]) & (updated < cutoff)
+
+
+async def archive_stale_rows_async(guild_id: int, days: int = ARCHIVE_AFTER_DAYS) -> int:
+    """
+    Moves a guild's stale finished or shelved books from the hot reading log to the archive.
+
+    The archive is written before the hot log, so an interrupted run leaves a row in both
+    tiers rather than in neither. Indexes see the move as rows removed from the hot log and
+    added to the archive, so totals are unchanged.
+
+    Args:
+        guild_id (int): The guild whose reading log is archived.
+        days (int, optional): Minimum age in days of the last update. Defaults to ARCHIVE_AFTER_DAYS.
+
+    Returns:
+        int: The number of rows moved.
+    """
+    async with excel_transaction(guild_id):
+        hot = await read_excel_async(guild_excel_path(guild_id))
+        stale = stale_rows_mask(hot, days)
+        if not stale.any():
+            return 0
+
+        cold = await read_archive_async(guild_id)
+        moved = hot[stale]
+        cold = append_rows(cold, moved)
+        await write_excel_async(cold, guild_archive_path(guild_id))
+        await commit_excel_async(
+            hot[~stale],
+            guild_id,
+            removed=moved,
+            added=as_archived(cold).tail(len(moved))
+        )
+        return len(moved)
+
+
+async def restore_archived_async(guild_id: int, user_id: str, title: str, is_audio: bool | None = None) -> int:
+    """
+    Moves a user's archived book back to the hot reading log, e.g. before it is unshelved or deleted.
+
+    Args:
+        guild_id (int): The guild.
+        user_id (str): The user who owns the book.
+        title (str): The book title.
+        is_audio (bool | None, optional): Media type, or None to restore books and audiobooks.
+
+    Returns:
+        int: The number of rows restored (0 if the book is not archived).
+    """
+    async with excel_transaction(guild_id):
+        cold = await read_archive_async(guild_id)
+        labels = BOOKS.locate_by_scan(cold, user_id, title, is_audio)
+        if not labels:
+            return 0
+
+        hot = await read_excel_async(guild_excel_path(guild_id))
+        restored = cold.loc[labels]
+        hot = append_rows(hot, restored)
+        await commit_excel_async(
+            hot,
+            guild_id,
+            removed=as_archived(cold).loc[[-(label + 1) for label in labels]],
+            added=hot.tail(len(restored))
+        )
+        await write_excel_async(cold.drop(index=labels), guild_archive_path(guild_id))
+        return len(restored)
+
+
+def archived_booknames(guild_id: int, user_id: str, status: int) -> list[str]:
+    """Returns the names of a user's archived books with the given status, most recent first."""
+    return [str(entry.book_name) for entry in BOOKS.archived_entries(guild_id, user_id, status) if pd.notna(entry.book_name)]
@@ -0,0 +1,166 @@
+import asyncio
+import functools
+from collections import Counter
+import discord
+from config import AUTO_DEFER_AFTER_SECONDS
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+ACK_DEADLINE_SECONDS = 3.0  # Discord drops interactions that aren't acknowledged within this
+UNKNOWN_INTERACTION = 10062  # Error code Discord returns for an acknowledgement after the deadline
+
+# (event, handler) -> count, e.g. ("auto_deferred", "UpdateBookCog.update_book").
+# Events: "handled", "auto_deferred", "missed_deadline" and "modal_too_late".
+ACK_METRICS: Counter = Counter()
+
+
+def seconds_since_created(interaction: discord.Interaction) -> float:
+    """Returns how long ago Discord created the interaction (0 if the local clock is behind)."""
+    return max((discord.utils.utcnow() - interaction.created_at).total_seconds(), 0.0)
+
+
+class AutoDeferResponse(discord.InteractionResponse):
+    """
+    An `InteractionResponse` that can acknowledge the interaction on the handler's behalf.
+
+    Once auto-deferred, the handler's `send_message` goes to a followup and `edit_message`
+    edits the deferred message instead, so handlers keep using `interaction.response` as usual.
+    A lock keeps the deferral and the handler's own response from both acknowledging.
+    """
+
+    def __init__(self, parent: discord.Interaction, handler: str, ephemeral: bool, thinking: bool):
+        super().__init__(parent)
+        self.handler = handler
+        self.ephemeral = ephemeral
+        self.thinking = thinking
+        self.auto_deferred = False
+        self.missed = False
+        self._lock = asyncio.Lock()
+        self._task: asyncio.Task | None = None
+
+    def _count_missed(self):
+        if self.missed:
+            return
+        self.missed = True
+        ACK_METRICS[("missed_deadline", self.handler)] += 1
+        logger.warning(
+            f"⌛ `{self.handler}` was not acknowledged within {ACK_DEADLINE_SECONDS:.0f} seconds.",
+            extra={"guild_id": self._parent.guild_id}
+        )
+
+    async def _acknowledge(self, method, *args, **kwargs):
+        try:
+            return await method(*args, **kwargs)
+        except discord.NotFound as e:
+            if e.code == UNKNOWN_INTERACTION:
+                self._count_missed()
+            raise
+
+    def start_auto_defer(self):
+        self._task = asyncio.create_task(self._auto_defer())
+
+    async def _auto_defer(self):
+        async with self._lock:
+            if self.is_done():
+                return
+            try:
+                await self._acknowledge(super().defer, ephemeral=self.ephemeral, thinking=self.thinking)
+            except discord.HTTPException as e:
+                if e.code != UNKNOWN_INTERACTION:
+                    logger.warning(f"⚠️ Could not auto-defer `{self.handler}`: {e}", extra={"guild_id": self._parent.guild_id})
+                return
+            self.auto_deferred = True
+        ACK_METRICS[("auto_deferred", self.handler)] += 1
+        logger.debug(f"⏱️ Auto-deferred `{self.handler}` after {seconds_since_created(self._parent):.2f}s.")
+
+    async def defer(self, **kwargs):
+        async with self._lock:
+            if self.auto_deferred:
+                return None
+            return await self._acknowledge(super().defer, **kwargs)
+
+    async def send_message(self, content=None, **kwargs):
+        async with self._lock:
+            if not self.auto_deferred:
+                return await self._acknowledge(super().send_message, content, **kwargs)
+        kwargs.pop("delete_after", None)  # Followups can't auto-delete
+        return await self._parent.followup.send(content, **{key: value for key, value in kwargs.items() if value is not None})
+
+    async def edit_message(self, **kwargs):
+        async with self._lock:
+            if not self.auto_deferred:
+                return await self._acknowledge(super().edit_message, **kwargs)
+        kwargs.pop("delete_after", None)
+        kwargs.pop("suppress_embeds", None)
+        if self.thinking:
+            # A "thinking" deferral created a new message; edit the component's message itself.
+            return await self._parent.followup.edit_message(self._parent.message.id, **kwargs)
+        return await self._parent.edit_original_response(**kwargs)
+
+    async def send_modal(self, modal: discord.ui.Modal):
+        async with self._lock:
+            if not self.auto_deferred:
+                return await self._acknowledge(super().send_modal, modal)
+        # A deferred interaction can't open a modal any more.
+        ACK_METRICS[("modal_too_late", self.handler)] += 1
+        logger.warning(f"⌛ `{self.handler}` took too long to open its modal.", extra={"guild_id": self._parent.guild_id})
+        await self._parent.followup.send("⌛ That took a little too long. Please try again.", ephemeral=True)
+
+
+def auto_defer(ephemeral: bool = True, thinking: bool = True, opens_modal: bool = False):
+    """
+    Decorator for slash commands and component/modal callbacks that guarantees the
+    3-second acknowledgement.
+
+    If the handler hasn't responded `AUTO_DEFER_AFTER_SECONDS` after Discord created the
+    interaction, it is deferred automatically and the handler's later
+    `interaction.response.send_message` calls are sent as followups.
+
+    Example:
+        @app_commands.command(name="update_book", description="...")
+        @app_commands.guilds(*GUILD_OBJECTS)
+        @auto_defer()
+        async def update_book(self, interaction: Interaction): ...
+
+    Args:
+        ephemeral (bool, optional): Whether the automatic deferral (and therefore the
+            handler's first reply) is only visible to the user. Defaults to True.
+        thinking (bool, optional): For components, show a "thinking..." message (True) or
+            silently defer an update of the component's message (False). Defaults to True.
+        opens_modal (bool, optional): The handler responds with `send_modal`, which can't
+            follow a deferral, so nothing is deferred; only missed deadlines are counted.
+            Such handlers should prefetch what the modal needs so they never block.
+
+    Notes:
+        - Must be the innermost decorator (below `app_commands.command`, `guilds`, `describe`...).
+        - Counts are kept in `ACK_METRICS`.
+    """
+    def decorator(func):
+        handler = func.__qualname__
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            interaction = next((arg for arg in (*args, *kwargs.values()) if isinstance(arg, discord.Interaction)), None)
+            current = getattr(interaction, "_cs_response", None)
+            if interaction is None or isinstance(current, AutoDeferResponse) or (current is not None and current.is_done()):
+                return await func(*args, **kwargs)
+
+            response = AutoDeferResponse(interaction, handler, ephemeral, thinking)
+            interaction._cs_response = response  # The slot behind the cached `Interaction.response`
+            ACK_METRICS[("handled", handler)] += 1
+
+            timer = None
+            if not opens_modal:
+                delay = max(AUTO_DEFER_AFTER_SECONDS - seconds_since_created(interaction), 0.0)
+                timer = asyncio.get_running_loop().call_later(delay, response.start_auto_defer)
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                if timer is not None:
+                    timer.cancel()
+                if not response.is_done() and seconds_since_created(interaction) > ACK_DEADLINE_SECONDS:
+                    response._count_missed()
+
+        return wrapper
+    return decorator
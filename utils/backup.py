@@ -0,0 +1,172 @@
+import gzip
+import json
+import os
+from collections import Counter
+from datetime import datetime, timedelta
+import pandas as pd
+from config import BACKUP_DIR, BACKUP_INTERVAL_MINUTES, BACKUP_DELTAS_PER_FULL, BACKUP_FULLS_KEPT
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+# Per data file: row hashes of the last backed-up state, when it was taken and the chain length.
+_states: dict[str, dict] = {}
+
+
+def backup_dir_for(path: str) -> str:
+    """Returns the backup directory of a data file, e.g. data/backups/data_guilds_123_reading_data."""
+    name = os.path.splitext(os.path.relpath(path))[0].replace(os.sep, "_").replace(".", "_")
+    return os.path.join(BACKUP_DIR, name)
+
+
+def _row_hashes(df: pd.DataFrame) -> list[int]:
+    # Hash the string form of every row, so dtype differences between reads don't change hashes.
+    return [int(h) for h in pd.util.hash_pandas_object(df.astype(str), index=False)]
+
+
+def _records(df: pd.DataFrame) -> list[dict]:
+    return json.loads(json.dumps(df.to_dict("records"), default=str))
+
+
+def _write_json_gz(path: str, data: dict):
+    tmp = f"{path}.tmp"
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+
+def _read_json_gz(path: str) -> dict:
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def list_backups(path: str) -> list[str]:
+    """Returns the backup names of a data file, oldest first (e.g. "20250101T120000-full")."""
+    directory = backup_dir_for(path)
+    if not os.path.isdir(directory):
+        return []
+    return sorted(name[:-len(".json.gz")] for name in os.listdir(directory) if name.endswith(".json.gz"))
+
+
+def _rotate(path: str):
+    """Deletes the oldest chains so that at most BACKUP_FULLS_KEPT full backups remain."""
+    names = list_backups(path)
+    fulls = [name for name in names if name.endswith("-full")]
+    if len(fulls) <= BACKUP_FULLS_KEPT:
+        return
+    oldest_kept = fulls[-BACKUP_FULLS_KEPT]
+    for name in names:
+        if name < oldest_kept:
+            os.remove(os.path.join(backup_dir_for(path), f"{name}.json.gz"))
+
+
+def take_backup(df: pd.DataFrame, path: str, force_full: bool = False) -> str | None:
+    """
+    Records a backup of a data file's new contents, if one is due.
+
+    The first backup of a chain stores every row; later ones store only the rows removed
+    (as hashes) and added since the previous backup, so backup size and I/O grow with the
+    amount of change. A new full backup starts every BACKUP_DELTAS_PER_FULL deltas (and
+    after every restart), and only the newest BACKUP_FULLS_KEPT chains are kept.
+
+    Args:
+        df (pandas.DataFrame): The contents just written to `path`.
+        path (str): The data file being backed up.
+        force_full (bool, optional): Start a new chain regardless of the schedule.
+
+    Returns:
+        str | None: The name of the backup written, or None if none was due or nothing changed.
+
+    Note:
+        Must be called while holding the file's lock (it runs inside `write_excel_async`).
+    """
+    key = os.path.abspath(path)
+    state = _states.get(key)
+    now = datetime.now()
+    if state and not force_full and now - state["taken"] < timedelta(minutes=BACKUP_INTERVAL_MINUTES):
+        return None
+
+    hashes = _row_hashes(df)
+    full = force_full or state is None or state["deltas"] >= BACKUP_DELTAS_PER_FULL
+    if full:
+        data = {"kind": "full", "columns": list(df.columns), "hashes": hashes, "rows": _records(df)}
+    else:
+        previous, current = Counter(state["hashes"]), Counter(hashes)
+        removed = previous - current
+        budget = current - previous
+        added = []
+        for position, h in enumerate(hashes):
+            if budget[h] > 0:
+                budget[h] -= 1
+                added.append(position)
+        if not removed and not added:
+            state["taken"] = now
+            return None
+        data = {
+            "kind": "delta",
+            "removed": [[h, count] for h, count in removed.items()],
+            "hashes": [hashes[position] for position in added],
+            "rows": _records(df.iloc[added]),
+        }
+
+    name = f"{now:%Y%m%dT%H%M%S%f}-{data['kind']}"
+    os.makedirs(backup_dir_for(path), exist_ok=True)
+    _write_json_gz(os.path.join(backup_dir_for(path), f"{name}.json.gz"), data)
+    _states[key] = {"hashes": hashes, "taken": now, "deltas": 0 if full else state["deltas"] + 1}
+    if full:
+        _rotate(path)
+    logger.info(f"💾 Wrote {data['kind']} backup `{name}` of `{path}` ({len(data['rows'])} row(s)).")
+    return name
+
+
+def load_backup(path: str, name: str | None = None) -> pd.DataFrame:
+    """
+    Reconstructs a data file's contents as of a backup by replaying its chain.
+
+    Args:
+        path (str): The data file whose backups are read.
+        name (str | None, optional): The backup to restore; defaults to the newest.
+
+    Returns:
+        pandas.DataFrame: The reading log as it was when the backup was taken.
+
+    Raises:
+        ValueError: If there are no backups, the name is unknown or its chain has no full backup.
+    """
+    names = list_backups(path)
+    if not names:
+        raise ValueError("No backups found.")
+    name = name or names[-1]
+    if name not in names:
+        raise ValueError(f"Unknown backup `{name}`.")
+    chain = names[:names.index(name) + 1]
+    starts = [i for i, n in enumerate(chain) if n.endswith("-full")]
+    if not starts:
+        raise ValueError(f"Backup `{name}` has no full backup to start from.")
+
+    rows: list[dict] = []
+    hashes: list[int] = []
+    columns: list[str] = []
+    for n in chain[starts[-1]:]:
+        data = _read_json_gz(os.path.join(backup_dir_for(path), f"{n}.json.gz"))
+        if data["kind"] == "full":
+            rows, hashes, columns = data["rows"], data["hashes"], data["columns"]
+            continue
+        pending = Counter({h: count for h, count in data["removed"]})
+        kept_rows, kept_hashes = [], []
+        for row, h in zip(rows, hashes):
+            if pending[h] > 0:
+                pending[h] -= 1
+                continue
+            kept_rows.append(row)
+            kept_hashes.append(h)
+        rows = kept_rows + data["rows"]
+        hashes = kept_hashes + data["hashes"]
+
+    df = pd.DataFrame(rows, columns=columns)
+    for column in ("Date", "LastUpdated"):
+        if column in df:
+            df[column] = pd.to_datetime(df[column], errors="coerce")
+    if "UserID" in df:
+        df["UserID"] = df["UserID"].astype(str)
+    return df
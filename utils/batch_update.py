@@ -0,0 +1,120 @@
+import re
+from datetime import datetime
+import pandas as pd
+from utils.time_data import parse_time_to_minutes
+from utils.text import normalize_title
+
+AUDIO_PREFIX = "🎧"
+MAX_BATCH_UPDATES: int = 25
+_SEPARATOR = re.compile(r"\s*(?:=|->|→)\s*")
+
+
+def parse_batch_updates(text: str) -> tuple[list[tuple[str, bool, str]], list[str]]:
+    """
+    Parses the compact `/update_many` syntax into (title, is_audiobook, value) entries.
+
+    Entries are separated by `;` or new lines and written as `title = value` (`->` and `→`
+    work too); the value follows the last separator, so a title may contain one. A leading 🎧
+    marks an audiobook, whose value may use the `1h30m` format.
+
+    Example:
+        >>> parse_batch_updates("Good Omens = 120; 🎧 Dune -> 5h30m")
+        ([('good omens', False, '120'), ('dune', True, '5h30m')], [])
+
+    Returns:
+        tuple: (entries, errors) where errors describe entries that could not be parsed.
+    """
+    entries, errors = [], []
+    for part in re.split(r"[;\n]", text):
+        part = part.strip()
+        if not part:
+            continue
+        separators = list(_SEPARATOR.finditer(part))
+        value = part[separators[-1].end():].strip() if separators else ""
+        if not value:
+            errors.append(f"`{part}`: expected `title = page`.")
+            continue
+        title = part[:separators[-1].start()].strip()
+        is_audio = title.startswith(AUDIO_PREFIX)
+        title = title.removeprefix(AUDIO_PREFIX).strip().lower()
+        if not title:
+            errors.append(f"`{part}`: missing title.")
+            continue
+        entries.append((title, is_audio, value))
+    if len(entries) > MAX_BATCH_UPDATES:
+        errors.append(f"At most {MAX_BATCH_UPDATES} books can be updated at once.")
+    return entries, errors
+
+
+def apply_batch_updates(
+    df: pd.DataFrame,
+    user_id: str,
+    entries: list[tuple[str, bool, str]]
+) -> tuple[pd.DataFrame, pd.DataFrame, list[str], list[str]]:
+    """
+    Validates all entries against the user's active books and applies them to the log together.
+
+    Nothing is changed unless every entry is valid, so the caller can commit the result as
+    one atomic mutation.
+
+    Args:
+        df (pandas.DataFrame): The guild's reading log. Modified in place on success.
+        user_id (str): The user whose books are updated.
+        entries (list): Parsed entries from `parse_batch_updates`.
+
+    Returns:
+        tuple: (removed, added, messages, errors)
+            removed/added: The affected rows before and after the update, for the commit.
+            messages: One progress line per updated book.
+            errors: Validation errors; if non-empty, df was not modified.
+    """
+    user_rows = df[(df["UserID"].astype(str) == user_id) & (df["LastPage"] != df["TotalPages"])]
+    is_audio = user_rows["Genres"].str.contains("audiobook", na=False)
+    labels = {
+        (normalize_title(name), bool(audio)): label
+        for label, name, audio in zip(user_rows.index, user_rows["BookName"], is_audio)
+    }
+
+    updates, errors, seen = [], [], set()
+    for title, audio, value in entries:
+        key = normalize_title(title)
+        label = labels.get((key, audio))
+        if label is None and not audio and (key, True) in labels:
+            label, audio = labels[(key, True)], True
+        if label is None:
+            errors.append(f"**{title.title()}** is not one of your active {'audiobooks' if audio else 'books'}.")
+            continue
+        if label in seen:
+            errors.append(f"**{title.title()}** is listed more than once.")
+            continue
+        seen.add(label)
+        try:
+            progress = parse_time_to_minutes(value) if audio else int(value)
+        except ValueError:
+            errors.append(f"**{title.title()}**: `{value}` is not a valid {'time' if audio else 'page number'}.")
+            continue
+        total = pd.to_numeric(df.at[label, "TotalPages"], errors="coerce")
+        if pd.isna(total):
+            errors.append(f"**{title.title()}** has no valid total {'duration' if audio else 'page count'}; fix it with `/update_{'audiobook' if audio else 'book'}`.")
+            continue
+        total = int(total)
+        if progress < 0 or progress > total:
+            errors.append(f"**{title.title()}**: progress must be between 0 and {total}.")
+            continue
+        updates.append((label, title, audio, progress, total))
+
+    if errors:
+        return df.iloc[0:0], df.iloc[0:0], [], errors
+
+    changed = [label for label, *_ in updates]
+    removed = df.loc[changed].copy()
+    now = datetime.now()
+    messages = []
+    for label, title, audio, progress, total in updates:
+        df.loc[label, ["LastPage", "LastUpdated"]] = [progress, now]
+        if progress == total:
+            df.loc[label, "Status"] = 2
+            messages.append(f"🏆 **{title.title()}** finished! 🎉")
+        else:
+            messages.append(f"{'🎧' if audio else '📖'} **{title.title()}** — {progress * 100 / total:.2f}% done")
+    return removed, df.loc[changed], messages, errors
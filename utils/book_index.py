@@ -0,0 +1,206 @@
+import sys
+from bisect import bisect_left, bisect_right, insort
+import pandas as pd
+from utils.entries import ReadingEntry
+from utils.indexes import RowIndex, register_index
+from utils.text import normalize_title
+
+BookKey = tuple[str, str, bool]
+COMPACT_AFTER_DELETES: int = 1024  # Deleted positions remembered before stored positions are renumbered
+
+
+def book_key(user_id, title: str, is_audio: bool) -> BookKey:
+    """Returns the index key of a user's book: (user ID, normalized title, is audiobook)."""
+    return sys.intern(str(user_id)), normalize_title(title), bool(is_audio)
+
+
+class BookIndex(RowIndex):
+    """
+    Hash index from (user, normalized title, media type) to a row of the reading log.
+
+    For every guild the index keeps the row's position in the log file and its values as a
+    `utils.entries.ReadingEntry`, which serves duplicate checks, select-menu lookups and locating the row to mutate
+    in O(1). Positions are the index labels of a freshly read log; rows passed to a commit
+    keep the labels they had in that frame, and deletions shift later rows up in the file.
+    Archived rows (see `utils.archive`) carry negative labels: they still count for duplicate
+    checks but are not located in the hot log.
+
+    Stored positions are not renumbered on every delete. The index remembers the deleted
+    positions (sorted) and translates between stored and current positions with a binary
+    search, so a delete costs O(log d) for d deletes since the last renumbering. After
+    `COMPACT_AFTER_DELETES` deletes, every position is renumbered once, so the O(n) pass is
+    spread over that many deletes.
+    """
+
+    def __init__(self):
+        self._positions: dict[int, dict[BookKey, int]] = {}  # Stored positions; see `_current`
+        self._records: dict[int, dict[BookKey, ReadingEntry]] = {}
+        self._deleted: dict[int, list[int]] = {}  # Sorted stored positions of deleted rows
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._positions[guild_id] = {}
+        self._records[guild_id] = {}
+        self._deleted[guild_id] = []
+        self._add_rows(guild_id, df)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        positions = self._positions.setdefault(guild_id, {})
+        records = self._records.setdefault(guild_id, {})
+        deleted = self._deleted.setdefault(guild_id, [])
+
+        # Rows that were removed without being re-added were deleted: later rows move up.
+        added_labels = set(added.index) if not added.empty else set()
+        gone = [
+            self._stored(guild_id, label) for label in (removed.index if not removed.empty else [])
+            if label >= 0 and label not in added_labels
+        ]
+        for key in self._keys(removed):
+            positions.pop(key, None)
+            records.pop(key, None)
+        for stored in gone:
+            insort(deleted, stored)
+        if len(deleted) > COMPACT_AFTER_DELETES:
+            self._compact(guild_id)
+
+        self._add_rows(guild_id, added)
+
+    def _current(self, guild_id: int, stored: int) -> int:
+        """Translates a stored position to the row's current position in the log."""
+        if stored < 0:
+            return stored
+        return stored - bisect_left(self._deleted.get(guild_id, []), stored)
+
+    def _stored(self, guild_id: int, current: int) -> int:
+        """Translates a current position in the log to the position stored for that row."""
+        current = int(current)
+        if current < 0:
+            return current
+        deleted = self._deleted.get(guild_id, [])
+        stored = current
+        while True:  # The smallest stored position with `current` live positions before it
+            shifted = current + bisect_right(deleted, stored)
+            if shifted == stored:
+                return stored
+            stored = shifted
+
+    def _compact(self, guild_id: int):
+        positions = self._positions[guild_id]
+        for key, stored in positions.items():
+            positions[key] = self._current(guild_id, stored)
+        self._deleted[guild_id] = []
+
+    def _keys(self, df: pd.DataFrame) -> list[BookKey]:
+        if df.empty:
+            return []
+        is_audio = df["Genres"].str.contains("audiobook", na=False)
+        return [book_key(uid, name, audio) for uid, name, audio in zip(df["UserID"], df["BookName"], is_audio)]
+
+    def _add_rows(self, guild_id: int, df: pd.DataFrame):
+        positions = self._positions.setdefault(guild_id, {})
+        records = self._records.setdefault(guild_id, {})
+        if df.empty:
+            return
+        for key, label, record in zip(self._keys(df), df.index, df.to_dict("records")):
+            if label < 0 and positions.get(key, -1) >= 0:
+                continue  # A hot row wins over an archived copy of the same book.
+            positions[key] = self._stored(guild_id, label)
+            records[key] = ReadingEntry.from_record(record)
+
+    def _candidate_keys(self, user_id, title: str, is_audio: bool | None) -> list[BookKey]:
+        if is_audio is None:
+            return [book_key(user_id, title, False), book_key(user_id, title, True)]
+        return [book_key(user_id, title, is_audio)]
+
+    def contains(self, guild_id: int, user_id, title: str, is_audio: bool) -> bool:
+        """Returns True if the user already has this book (or audiobook) in their log."""
+        return book_key(user_id, title, is_audio) in self._positions.get(guild_id, {})
+
+    def size(self, guild_id: int) -> int:
+        """Returns how many rows of a guild (hot and archived) are indexed."""
+        return len(self._positions.get(guild_id, {}))
+
+    def get(self, guild_id: int, user_id, title: str, is_audio: bool) -> dict | None:
+        """Returns a copy of the row's values, or None if the user has no such book."""
+        entry = self._records.get(guild_id, {}).get(book_key(user_id, title, is_audio))
+        return entry.to_record() if entry else None
+
+    def entry(self, guild_id: int, user_id, title: str, is_audio: bool) -> ReadingEntry | None:
+        """Returns the row as a ReadingEntry without copying it (entries are never changed in place)."""
+        return self._records.get(guild_id, {}).get(book_key(user_id, title, is_audio))
+
+    def locate(self, df: pd.DataFrame, guild_id: int, user_id, title: str, is_audio: bool | None = None) -> list[int]:
+        """
+        Returns the labels of the user's rows for a title in a freshly read log.
+
+        Args:
+            df (pandas.DataFrame): The reading log as read from storage.
+            guild_id (int): The guild.
+            user_id: The user who owns the row.
+            title (str): The book title as typed or selected.
+            is_audio (bool | None): Media type, or None to match books and audiobooks.
+
+        Returns:
+            list[int]: Matching labels (empty if none). Positions are verified against the
+            frame; if the index is stale (e.g. the file was edited by hand), it falls back
+            to a normalized scan and rebuilds the index for the guild.
+        """
+        positions = self._positions.get(guild_id, {})
+        labels = []
+        for key in self._candidate_keys(user_id, title, is_audio):
+            position = positions.get(key)
+            if position is None or position < 0:
+                continue
+            position = self._current(guild_id, position)
+            if position not in df.index or self._row_key(df, position) != key:
+                self._rebuild_hot(guild_id, df)
+                return self.locate_by_scan(df, user_id, title, is_audio)
+            labels.append(position)
+        return labels
+
+    @staticmethod
+    def _row_key(df: pd.DataFrame, label: int) -> BookKey:
+        """Returns the key of one row, reading its cells rather than slicing the frame."""
+        genres = df.at[label, "Genres"]
+        return book_key(df.at[label, "UserID"], df.at[label, "BookName"], isinstance(genres, str) and "audiobook" in genres)
+
+    def is_archived(self, guild_id: int, user_id, title: str, is_audio: bool | None = None) -> bool:
+        """Returns True if the user's book only exists in the archive (cold tier)."""
+        positions = self._positions.get(guild_id, {})
+        found = [positions.get(key) for key in self._candidate_keys(user_id, title, is_audio)]
+        found = [position for position in found if position is not None]
+        return bool(found) and all(position < 0 for position in found)
+
+    def archived_entries(self, guild_id: int, user_id, status: int) -> list[ReadingEntry]:
+        """Returns a user's archived rows with the given status, most recently updated first."""
+        positions = self._positions.get(guild_id, {})
+        records = self._records.get(guild_id, {})
+        user_id = str(user_id)
+        entries = [
+            records[key] for key, position in positions.items()
+            if position < 0 and key[0] == user_id and records[key].status == status
+        ]
+        return sorted(entries, key=lambda entry: pd.to_datetime(entry.last_updated, errors="coerce"), reverse=True)
+
+    def _rebuild_hot(self, guild_id: int, df: pd.DataFrame):
+        """Rebuilds the hot entries from a fresh log, keeping the archived ones."""
+        positions = self._positions.get(guild_id, {})
+        records = self._records.get(guild_id, {})
+        archived = {key: position for key, position in positions.items() if position < 0}
+        self.rebuild(guild_id, df)
+        for key, position in archived.items():
+            if key not in self._positions[guild_id]:
+                self._positions[guild_id][key] = position
+                self._records[guild_id][key] = records[key]
+
+    def locate_by_scan(self, df: pd.DataFrame, user_id, title: str, is_audio: bool | None = None) -> list[int]:
+        """Finds the user's rows for a title with a full normalized scan (fallback only)."""
+        match = (df["UserID"].astype(str) == str(user_id)) & (
+            df["BookName"].map(normalize_title) == normalize_title(title)
+        )
+        if is_audio is not None:
+            audio = df["Genres"].str.contains("audiobook", na=False)
+            match &= audio if is_audio else ~audio
+        return df.index[match].tolist()
+
+
+BOOKS = register_index(BookIndex())
@@ -0,0 +1,156 @@
+import itertools
+import sys
+from collections import Counter
+import pandas as pd
+from utils.book_index import BookKey, book_key
+from utils.indexes import RowIndex, register_index
+from utils.text import normalize_title
+
+CatalogueKey = tuple[str, str, bool]  # (normalized title, normalized author, is audiobook)
+
+
+def _intern(value) -> str:
+    return sys.intern(value.strip()) if isinstance(value, str) else ""
+
+
+class Catalogue(RowIndex):
+    """
+    Guild-wide catalogue of canonical books, derived from the reading log.
+
+    Every distinct book (normalized title and author; books and audiobooks apart) gets one
+    entry with an id, its most common page count (or duration), its usual genres and the
+    number of rows it was built from. The entry's strings are interned, so the catalogue
+    holds a book logged by many readers once. The add commands use it to pre-fill a known
+    book's details.
+
+    Log rows keep their own title, author and genre columns rather than a catalogue id: the
+    workbook is also the export and Google Sheets format, and xlsx already stores repeated
+    strings once in its shared strings table.
+    """
+
+    def __init__(self):
+        self._ids = itertools.count(1)
+        self._keys: dict[int, dict[CatalogueKey, int]] = {}
+        self._entries: dict[int, dict[int, dict]] = {}
+        self._row_ids: dict[int, dict[BookKey, tuple[int, int | None, list[str]]]] = {}  # id, total, genres
+        self._by_title: dict[int, dict[tuple[str, bool], set[int]]] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._keys[guild_id] = {}
+        self._entries[guild_id] = {}
+        self._row_ids[guild_id] = {}
+        self._by_title[guild_id] = {}
+        self._add_rows(guild_id, df)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        if not removed.empty:
+            is_audio = removed["Genres"].str.contains("audiobook", na=False)
+            for user_id, name, audio in zip(removed["UserID"], removed["BookName"], is_audio):
+                self._remove(guild_id, book_key(user_id, name, audio))
+        self._add_rows(guild_id, added)
+
+    def _add_rows(self, guild_id: int, df: pd.DataFrame):
+        if df.empty:
+            return
+        keys = self._keys.setdefault(guild_id, {})
+        entries = self._entries.setdefault(guild_id, {})
+        row_ids = self._row_ids.setdefault(guild_id, {})
+        by_title = self._by_title.setdefault(guild_id, {})
+        is_audio = df["Genres"].str.contains("audiobook", na=False)
+        for row, audio in zip(df.to_dict("records"), is_audio):
+            audio = bool(audio)
+            row_key = book_key(row["UserID"], row["BookName"], audio)
+            self._remove(guild_id, row_key)
+            key = (normalize_title(row["BookName"]), normalize_title(row["Author"]), audio)
+            if not key[0]:
+                continue
+            entry_id = keys.get(key)
+            if entry_id is None:
+                entry_id = keys[key] = next(self._ids)
+                entries[entry_id] = {
+                    "id": entry_id,
+                    "title": _intern(row["BookName"]),
+                    "author": _intern(row["Author"]),
+                    "is_audio": audio,
+                    "rows": 0,
+                    "totals": Counter(),
+                    "genres": Counter(),
+                }
+                by_title.setdefault((key[0], audio), set()).add(entry_id)
+            entry = entries[entry_id]
+            total, genres = self._total(row), self._genres(row)
+            entry["rows"] += 1
+            entry["totals"][total] += 1
+            entry["genres"].update(genres)
+            row_ids[row_key] = (entry_id, total, genres)
+
+    def _remove(self, guild_id: int, row_key: BookKey):
+        reference = self._row_ids.get(guild_id, {}).pop(row_key, None)
+        if reference is None:
+            return
+        entry_id, total, genres = reference
+        entry = self._entries[guild_id][entry_id]
+        entry["rows"] -= 1
+        entry["totals"][total] -= 1
+        entry["genres"].subtract(genres)
+        if entry["rows"] <= 0:
+            del self._entries[guild_id][entry_id]
+            key = (normalize_title(entry["title"]), normalize_title(entry["author"]), entry["is_audio"])
+            self._keys[guild_id].pop(key, None)
+            same_title = self._by_title[guild_id].get((key[0], key[2]), set())
+            same_title.discard(entry_id)
+            if not same_title:
+                self._by_title[guild_id].pop((key[0], key[2]), None)
+
+    @staticmethod
+    def _total(row: dict) -> int | None:
+        total = pd.to_numeric(row.get("TotalPages"), errors="coerce")
+        return None if pd.isna(total) else int(total)
+
+    @staticmethod
+    def _genres(row: dict) -> list[str]:
+        genres = row.get("Genres")
+        if not isinstance(genres, str):
+            return []
+        return [sys.intern(g.strip().lower()) for g in genres.split(",") if g.strip() and g.strip().lower() != "audiobook"]
+
+    def _public(self, entry: dict) -> dict:
+        totals = [(count, total) for total, count in entry["totals"].items() if count > 0 and total is not None]
+        genres = [genre for genre, count in entry["genres"].most_common() if count * 2 >= entry["rows"]]
+        return {
+            "id": entry["id"],
+            "title": entry["title"],
+            "author": entry["author"],
+            "is_audio": entry["is_audio"],
+            "total": max(totals)[1] if totals else None,
+            "genres": genres or [genre for genre, count in entry["genres"].most_common(3) if count > 0],
+            "readers": entry["rows"],
+        }
+
+    def lookup(self, guild_id: int, title: str, is_audio: bool, author: str | None = None) -> dict | None:
+        """
+        Returns the catalogue entry of a book, or None if nobody in the guild logged it.
+
+        Args:
+            guild_id (int): The guild.
+            title (str): The book's title.
+            is_audio (bool): Look up the audiobook rather than the book.
+            author (str | None, optional): Picks the entry with this author; otherwise the
+                most logged entry with the title is returned.
+
+        Returns:
+            dict | None: {"id", "title", "author", "is_audio", "total", "genres", "readers"},
+                where total is the most common TotalPages (minutes for audiobooks).
+        """
+        entries = self._entries.get(guild_id, {})
+        if author:
+            entry_id = self._keys.get(guild_id, {}).get((normalize_title(title), normalize_title(author), is_audio))
+            if entry_id is not None:
+                return self._public(entries[entry_id])
+        same_title = self._by_title.get(guild_id, {}).get((normalize_title(title), is_audio), ())
+        if not same_title:
+            return None
+        return self._public(max((entries[entry_id] for entry_id in same_title), key=lambda entry: entry["rows"]))
+
+
+CATALOGUE = register_index(Catalogue())
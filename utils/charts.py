@@ -0,0 +1,194 @@
+import asyncio
+import io
+from pathlib import Path
+from datetime import datetime, timedelta
+import pandas as pd
+from cachetools import LRUCache
+from PIL import Image, ImageDraw, ImageFont
+from config import CHART_CACHE_SIZE
+from utils.excel import read_excel_async
+from utils.guilds import guild_excel_path
+from utils.jobs import REPORTS, JobContext
+from utils.stats import STATS
+from utils.versions import VERSIONS
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+COMMON_FONTS = [
+    "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    "/usr/share/fonts/truetype/freefont/FreeSans.ttf",
+]
+CHART_WIDTH = 900
+ROW_HEIGHT = 44
+HEADER_HEIGHT = 80
+LABEL_WIDTH = 300
+BAR_COLOR = (124, 92, 196)
+TRACK_COLOR = (230, 226, 240)
+TEXT_COLOR = (30, 30, 30)
+
+_chart_cache: LRUCache = LRUCache(maxsize=CHART_CACHE_SIZE)
+_fonts: dict[int, ImageFont.ImageFont] = {}
+
+
+def _font(size: int):
+    if size not in _fonts:
+        for path in COMMON_FONTS:
+            if Path(path).exists():
+                try:
+                    _fonts[size] = ImageFont.truetype(path, size)
+                    break
+                except Exception:
+                    pass
+        else:
+            _fonts[size] = ImageFont.load_default()
+    return _fonts[size]
+
+
+def _render_bars(title: str, rows: list[tuple[str, float, str]]) -> bytes:
+    """
+    Renders a horizontal bar chart as PNG bytes.
+
+    Args:
+        title (str): Chart title.
+        rows (list[tuple[str, float, str]]): (label, fill fraction 0..1, value text) per bar.
+
+    Returns:
+        bytes: The encoded PNG.
+    """
+    height = HEADER_HEIGHT + ROW_HEIGHT * max(len(rows), 1) + 20
+    image = Image.new("RGB", (CHART_WIDTH, height), "white")
+    draw = ImageDraw.Draw(image)
+    draw.text((20, 20), title, font=_font(30), fill=TEXT_COLOR)
+
+    bar_left = LABEL_WIDTH
+    bar_right = CHART_WIDTH - 140
+    label_font = _font(20)
+    if not rows:
+        draw.text((20, HEADER_HEIGHT), "No data yet.", font=label_font, fill=TEXT_COLOR)
+
+    for i, (label, fraction, value) in enumerate(rows):
+        top = HEADER_HEIGHT + i * ROW_HEIGHT
+        if len(label) > 24:
+            label = label[:23] + "…"
+        draw.text((20, top + 8), label, font=label_font, fill=TEXT_COLOR)
+        draw.rectangle((bar_left, top + 6, bar_right, top + ROW_HEIGHT - 10), fill=TRACK_COLOR)
+        fill_right = bar_left + int((bar_right - bar_left) * min(max(fraction, 0.0), 1.0))
+        if fill_right > bar_left:
+            draw.rectangle((bar_left, top + 6, fill_right, top + ROW_HEIGHT - 10), fill=BAR_COLOR)
+        draw.text((bar_right + 12, top + 8), value, font=label_font, fill=TEXT_COLOR)
+
+    buffer = io.BytesIO()
+    image.save(buffer, format="PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def render_genre_chart(title: str, genre_counts: list[tuple[str, int]]) -> bytes:
+    """Renders a user's most read genres as a bar chart (runs in a worker process)."""
+    highest = max((count for _, count in genre_counts), default=1)
+    rows = [(genre.title(), count / highest, f"{count} book{'s' if count != 1 else ''}") for genre, count in genre_counts]
+    return _render_bars(title, rows)
+
+
+def render_progress_chart(title: str, books: list[tuple[str, int, int, bool]]) -> bytes:
+    """Renders per-book progress bars (runs in a worker process)."""
+    rows = []
+    for name, last_page, total_pages, is_audio in books:
+        fraction = last_page / total_pages if total_pages else 0.0
+        unit = "min" if is_audio else "p"
+        rows.append((name.title(), fraction, f"{fraction * 100:.0f}% ({last_page}/{total_pages}{unit})"))
+    return _render_bars(title, rows)
+
+
+def _render_job(ctx: JobContext, fn, *args) -> bytes:
+    return fn(*args)
+
+
+async def _render(cache_key: tuple, fn, *args) -> bytes:
+    cached = _chart_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    # Rendered by the report workers, so charts count against the same cap as exports.
+    png = await REPORTS.submit("Chart", _render_job, fn, *args).result()
+    _chart_cache[cache_key] = png
+    return png
+
+
+async def get_genre_chart(guild_id: int, user_id: str, display_name: str) -> bytes:
+    """
+    Returns a user's genre chart, rendering it only if their data changed since the last render.
+
+    Args:
+        guild_id (int): The guild.
+        user_id (str): The user whose genres are charted.
+        display_name (str): Name shown in the chart title.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    key = ("genres", guild_id, str(user_id), display_name, VERSIONS.get(guild_id, user_id))
+    genre_counts = STATS.get(guild_id, str(user_id), "all")["genres"].most_common(10)
+    return await _render(key, render_genre_chart, f"{display_name}'s favourite genres", genre_counts)
+
+
+async def get_progress_chart(guild_id: int, user_id: str, display_name: str, df: pd.DataFrame | None = None) -> bytes:
+    """
+    Returns a chart of a user's active books, rendering it only if their data changed.
+
+    Args:
+        guild_id (int): The guild.
+        user_id (str): The user whose books are charted.
+        display_name (str): Name shown in the chart title.
+        df (pandas.DataFrame, optional): An already loaded reading log, to avoid re-reading it.
+
+    Returns:
+        bytes: The PNG image.
+    """
+    key = ("progress", guild_id, str(user_id), display_name, VERSIONS.get(guild_id, user_id))
+    cached = _chart_cache.get(key)
+    if cached is not None:
+        return cached
+
+    if df is None:
+        df = await read_excel_async(guild_excel_path(guild_id))
+    user_books = df[(df["UserID"].astype(str) == str(user_id)) & (df["Status"] == 1)].sort_values(
+        by="LastUpdated",
+        ascending=False,
+        key=lambda x: pd.to_datetime(x, errors='coerce')
+    ).head(25)
+    # Hand-edited logs can have empty or non-numeric page cells.
+    last_pages = pd.to_numeric(user_books["LastPage"], errors="coerce").fillna(0).astype(int)
+    total_pages = pd.to_numeric(user_books["TotalPages"], errors="coerce").fillna(0).astype(int)
+    books = [
+        (str(name), int(last_page), int(total), "audiobook" in str(genres))
+        for name, last_page, total, genres in zip(user_books["BookName"], last_pages, total_pages, user_books["Genres"])
+    ]
+    return await _render(key, render_progress_chart, f"{display_name}'s books in progress", books)
+
+
+async def precompute_charts(guild_id: int, names: dict[str, str], days: int = 7) -> int:
+    """
+    Renders the genre and progress charts of every user active in the last `days` days,
+    so they are served from the cache later (e.g. in the weekly summary).
+
+    Args:
+        guild_id (int): The guild.
+        names (dict[str, str]): Display names by user ID. Users without one are skipped, since
+            charts are cached per title and would never be requested under their ID.
+        days (int, optional): How far back a user counts as active. Defaults to 7.
+
+    Returns:
+        int: The number of users whose charts were prepared.
+    """
+    df = await read_excel_async(guild_excel_path(guild_id))
+    updated = pd.to_datetime(df["LastUpdated"], errors="coerce")
+    active_ids = df.loc[updated >= datetime.now() - timedelta(days=days), "UserID"].astype(str).unique()
+    active_ids = [user_id for user_id in active_ids if user_id in names]
+    for user_id in active_ids:
+        name = names[user_id]
+        try:
+            await get_genre_chart(guild_id, user_id, name)
+            await get_progress_chart(guild_id, user_id, name, df)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to precompute charts for {user_id}: {e}")
+    return len(active_ids)
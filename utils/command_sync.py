@@ -0,0 +1,76 @@
+import hashlib
+import json
+import os
+import discord
+from discord import app_commands
+from config import COMMAND_FINGERPRINT_FILE
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+def _load_fingerprints() -> dict[str, str]:
+    try:
+        with open(COMMAND_FINGERPRINT_FILE, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"⚠️ Could not read `{COMMAND_FINGERPRINT_FILE}`, commands will be synced: {e}")
+        return {}
+
+
+def _save_fingerprints(fingerprints: dict[str, str]):
+    os.makedirs(os.path.dirname(COMMAND_FINGERPRINT_FILE) or ".", exist_ok=True)
+    tmp = f"{COMMAND_FINGERPRINT_FILE}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(fingerprints, f, indent=2)
+    os.replace(tmp, COMMAND_FINGERPRINT_FILE)
+
+
+def _command_payload(command, tree: app_commands.CommandTree) -> dict:
+    try:
+        return command.to_dict(tree)
+    except TypeError:  # discord.py before 2.4 takes no tree argument
+        return command.to_dict()
+
+
+def command_fingerprint(tree: app_commands.CommandTree, guild_id: int) -> str:
+    """
+    Returns a hash of the commands the tree would sync to a guild.
+
+    The hash covers the same serialized payload `tree.sync` sends (names, descriptions,
+    options, permissions), so any change that needs a sync changes the fingerprint.
+    """
+    commands = tree.get_commands(guild=discord.Object(id=guild_id))
+    payload = sorted((_command_payload(command, tree) for command in commands), key=lambda c: c["name"])
+    return hashlib.sha256(json.dumps(payload, sort_keys=True, default=str).encode()).hexdigest()
+
+
+async def sync_commands_if_changed(
+    tree: app_commands.CommandTree,
+    guild_id: int,
+    force: bool = False
+) -> tuple[bool, list[str]]:
+    """
+    Syncs a guild's commands only if they changed since the last sync (or if forced).
+
+    Args:
+        tree (app_commands.CommandTree): The bot's command tree.
+        guild_id (int): The guild to sync.
+        force (bool, optional): Sync even if the fingerprint is unchanged.
+
+    Returns:
+        tuple: (synced, command names) where synced is False if the sync was skipped.
+    """
+    fingerprint = command_fingerprint(tree, guild_id)
+    fingerprints = _load_fingerprints()
+    guild = discord.Object(id=guild_id)
+
+    if not force and fingerprints.get(str(guild_id)) == fingerprint:
+        return False, [command.name for command in tree.get_commands(guild=guild)]
+
+    synced = await tree.sync(guild=guild)
+    fingerprints[str(guild_id)] = fingerprint
+    _save_fingerprints(fingerprints)
+    return True, [command.name for command in synced]
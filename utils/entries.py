@@ -0,0 +1,100 @@
+import pandas as pd
+
+# Reading log column -> ReadingEntry attribute, in the workbook's column order.
+ENTRY_FIELDS: dict[str, str] = {
+    "Date": "date",
+    "UserID": "user_id",
+    "UserName": "user_name",
+    "BookName": "book_name",
+    "Author": "author",
+    "Genres": "genres",
+    "LastPage": "last_page",
+    "TotalPages": "total_pages",
+    "LastUpdated": "last_updated",
+    "Status": "status",
+}
+
+
+class ReadingEntry:
+    """
+    One row of the reading log as a plain record.
+
+    Point operations (opening a book's modal, shelving, unshelving, deleting) only touch one
+    row, so they pass entries around instead of one-row DataFrames. Entries use `__slots__`
+    and are never changed in place: `replace` returns an updated copy, which is what lets the
+    book index hand out its entries without copying them. Entries can also be indexed by
+    column name (`entry["BookName"]`), like the row dicts they replace.
+
+    Attributes:
+        date, user_id, user_name, book_name, author, genres, last_page, total_pages,
+        last_updated, status: The row's values (see `ENTRY_FIELDS` for the columns).
+    """
+
+    __slots__ = tuple(ENTRY_FIELDS.values())
+
+    def __init__(
+        self,
+        date=None,
+        user_id: str = "",
+        user_name=None,
+        book_name=None,
+        author=None,
+        genres=None,
+        last_page=None,
+        total_pages=None,
+        last_updated=None,
+        status=None,
+    ):
+        self.date = date
+        self.user_id = user_id
+        self.user_name = user_name
+        self.book_name = book_name
+        self.author = author
+        self.genres = genres
+        self.last_page = last_page
+        self.total_pages = total_pages
+        self.last_updated = last_updated
+        self.status = status
+
+    @classmethod
+    def from_record(cls, record: dict) -> "ReadingEntry":
+        """Builds an entry from a row dict keyed by column name (missing columns are None)."""
+        return cls(*(record.get(column) for column in ENTRY_FIELDS))
+
+    @classmethod
+    def from_row(cls, df: pd.DataFrame, label) -> "ReadingEntry":
+        """Reads one row of a log frame cell by cell, without materializing the row."""
+        return cls(*(df.at[label, column] if column in df.columns else None for column in ENTRY_FIELDS))
+
+    def to_record(self) -> dict:
+        """Returns the entry as a row dict keyed by column name."""
+        return {column: getattr(self, attribute) for column, attribute in ENTRY_FIELDS.items()}
+
+    def replace(self, changes: dict) -> "ReadingEntry":
+        """Returns a copy with some columns changed, e.g. `entry.replace({"Status": 0})`."""
+        values = self.to_record()
+        values.update(changes)
+        return ReadingEntry.from_record(values)
+
+    @property
+    def is_audio(self) -> bool:
+        return isinstance(self.genres, str) and "audiobook" in self.genres
+
+    def __getitem__(self, column: str):
+        return getattr(self, ENTRY_FIELDS[column])
+
+    def get(self, column: str, default=None):
+        attribute = ENTRY_FIELDS.get(column)
+        return getattr(self, attribute) if attribute else default
+
+    def __repr__(self) -> str:
+        return f"ReadingEntry(user_id={self.user_id!r}, book_name={self.book_name!r}, status={self.status!r})"
+
+
+def entries_frame(entries: list[ReadingEntry], labels: list) -> pd.DataFrame:
+    """Returns entries as a small frame with the given labels, for `commit_excel_async`."""
+    return pd.DataFrame.from_records(
+        [tuple(getattr(entry, attribute) for attribute in ENTRY_FIELDS.values()) for entry in entries],
+        index=labels,
+        columns=list(ENTRY_FIELDS),
+    )
@@ -1,13 +1,207 @@
 import pandas as pd
 import asyncio
-from config import EXCEL_FILE, DEBUG
+import hashlib
+import io
+import os
+import time
+from contextlib import asynccontextmanager
+from config import EXCEL_FILE
+from utils.snapshot import load_snapshot, write_snapshot, snapshots_enabled
+from utils.backup import take_backup, load_backup
+from utils.guilds import guild_excel_path, guild_archive_path
+from utils.indexes import rebuild_indexes, apply_to_indexes
+from utils.status_counts import STATUS_COUNTS
+from utils.book_index import BOOKS
+from utils.entries import ReadingEntry, entries_frame
+from utils.file_lock import FileLease, file_stamp, file_digest
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+LOG_COLUMNS: list[str] = [
+    "Date", "UserID", "UserName", "BookName", "Author",
+    "Genres", "LastPage", "TotalPages", "LastUpdated",
+    "Status"
+]
+
+# One lock per data file, so guilds with separate partitions never wait on each other.
+_excel_locks: dict[str, asyncio.Lock] = {}
+_pending_writes = 0  # Writes waiting for or holding a file lock
+# The task holding each file's lock, so reads and writes inside `locked_file` don't re-lock.
+_lock_owners: dict[str, asyncio.Task] = {}
+# (mtime_ns, size, sha256) of each data file as this process last read or wrote it.
+_known_versions: dict[str, tuple[int, int, str]] = {}
+
+
+def pending_writes() -> int:
+    """Returns how many workbook writes are queued or in progress."""
+    return _pending_writes
+
+
+def get_excel_lock(path: str = EXCEL_FILE) -> asyncio.Lock:
+    """Returns the lock that serializes access to the given Excel file."""
+    key = os.path.abspath(path)
+    if key not in _excel_locks:
+        _excel_locks[key] = asyncio.Lock()
+    return _excel_locks[key]
+
+
+@asynccontextmanager
+async def locked_file(path: str = EXCEL_FILE):
+    """
+    Locks a data file against other tasks of this process (`get_excel_lock`) and against
+    other processes (`utils.file_lock.FileLease`): other bot workers and admin tools.
+
+    Re-entrant within a task, so a read-modify-write can hold the lock throughout while
+    `read_excel_async` and `write_excel_async` inside it don't lock again. When locking
+    several files, lock the reading log before the archive.
+
+    Raises:
+        DataLockTimeout: If another process keeps the file locked past the lock timeout.
+    """
+    key = os.path.abspath(path)
+    task = asyncio.current_task()
+    if _lock_owners.get(key) is task:
+        yield
+        return
+    async with get_excel_lock(key):
+        async with FileLease(key):
+            _lock_owners[key] = task
+            try:
+                yield
+            finally:
+                del _lock_owners[key]
+
+
+def _remember_version(path: str, digest: str | None = None):
+    """Records a data file's current version; pass the digest if the caller already has it."""
+    key = os.path.abspath(path)
+    stamp = file_stamp(key)
+    if stamp is None:
+        _known_versions.pop(key, None)
+    else:
+        _known_versions[key] = (*stamp, digest or file_digest(key))
+
+
+def _changed_externally(path: str, verify: bool = True) -> bool:
+    """
+    Returns True if a data file differs from the version this process last read or wrote.
+
+    The mtime and size are compared first; the contents are only hashed when those differ,
+    so a file that was merely touched (or rewritten with the same data) is not a change.
+    With `verify=False`, any mtime or size difference counts (no hashing).
+    """
+    key = os.path.abspath(path)
+    known = _known_versions.get(key)
+    if known is None:
+        return False  # Never loaded, so nothing in memory can be stale
+    stamp = file_stamp(key)
+    if stamp == known[:2]:
+        return False
+    if stamp is None or not verify:
+        return True
+    digest = file_digest(key)
+    if digest != known[2]:
+        return True
+    _known_versions[key] = (*stamp, digest)
+    return False
+
+
+def _read_excel_sync(path, **kwargs) -> pd.DataFrame:
+    if not kwargs:
+        df = load_snapshot(path)
+        if df is not None:
+            return df
+    try:
+        df = pd.read_excel(path, **kwargs)
+        df["UserID"] = df["UserID"].astype(str)
+        if not kwargs:
+            write_snapshot(df, path)
+        return df
+    except FileNotFoundError:
+        df_new = pd.DataFrame(columns=LOG_COLUMNS)
+        _atomic_to_excel(df_new, path)
+        write_snapshot(df_new, path)
+        return df_new
+
+
+def _fsync_dir(directory: str):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return  # Directories can't be opened on Windows; the rename is still atomic there.
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _atomic_to_excel(df, path, **kwargs) -> str:
+    """
+    Writes the workbook to a temporary file, fsyncs it and renames it over `path`,
+    so a crash mid-write leaves either the old or the new file, never a corrupt one.
+
+    Returns:
+        str: The SHA-256 of the written bytes, hashed in memory before they are written.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp = f"{path}.tmp"
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False, engine='openpyxl', **kwargs)
+    data = buffer.getbuffer()
+    digest = hashlib.sha256(data).hexdigest()
+    try:
+        with open(tmp, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+    finally:
+        data.release()
+    _fsync_dir(directory)
+    return digest
+
+
+def _write_excel_sync(df, path, **kwargs):
+    _remember_version(path, _atomic_to_excel(df, path, **kwargs))
+    write_snapshot(df, path)
+    try:
+        take_backup(df, path)
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to back up `{path}`: {e}")
+
+
+def read_excel_readonly(path: str) -> pd.DataFrame:
+    """
+    Reads a data file without creating or rewriting anything, for report jobs running in
+    worker processes (see `utils.jobs`).
+
+    The Arrow snapshot is memory-mapped if it is up to date; otherwise the workbook is
+    parsed (the bot rebuilds the snapshot on its next read). A missing file is an empty log.
+    """
+    df = load_snapshot(path)
+    if df is not None:
+        return df
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=LOG_COLUMNS)
+    df = pd.read_excel(path)
+    df["UserID"] = df["UserID"].astype(str)
+    return df
 
-excel_lock = asyncio.Lock()
 
 async def read_excel_async(path=EXCEL_FILE, **kwargs) -> pd.DataFrame:
     """
     Asynchronously reads an Excel file into a pandas DataFrame.
 
+    If an up-to-date Arrow snapshot of the file exists, it is memory-mapped instead of parsing
+    the workbook. A missing or stale snapshot is rebuilt from the workbook after reading it.
     If the specified Excel file does not exist, creates a new DataFrame with predefined columns,
     writes it to the file, and returns the new DataFrame.
 
@@ -23,29 +217,22 @@ async def read_excel_async(path=EXCEL_FILE, **kwargs) -> pd.DataFrame:
 
     Note:
         The function ensures that the "UserID" column is of string type.
-        Access to the Excel file is synchronized using `excel_lock`.
+        Access to the Excel file is synchronized using the file's lock (`locked_file`),
+        and the parsing runs in a worker thread so other guilds' commands keep running.
     """
-    async with excel_lock:
-        try:
-            df = pd.read_excel(path, **kwargs)
-            df["UserID"] = df["UserID"].astype(str)
-            return df
-        except FileNotFoundError:
-            cols = [
-                "Date", "UserID", "UserName", "BookName", "Author",
-                "Genres", "LastPage", "TotalPages", "LastUpdated",
-                "Status"
-            ]
-            df_new = pd.DataFrame(columns=cols)
-            df_new.to_excel(path, index=False, engine='openpyxl')
-            return df_new
+    async with locked_file(path):
+        return await asyncio.to_thread(_read_excel_sync, path, **kwargs)
 
 async def write_excel_async(df, path=EXCEL_FILE, **kwargs):
     """
     Asynchronously writes a pandas DataFrame to an Excel file.
 
-    This function acquires an asynchronous lock to ensure thread-safe writing
-    to the specified Excel file. It uses the 'openpyxl' engine by default.
+    This function acquires the file's lock (`locked_file`) to ensure safe writing
+    to the specified Excel file, also against other processes. It uses the 'openpyxl' engine by default.
+    The workbook is written to a temporary file, fsynced and atomically renamed over the
+    original. Then an Arrow snapshot of the same data is written next to it so subsequent
+    reads can skip parsing the xlsx, and an incremental backup is recorded if one is due
+    (see `utils.backup`).
 
     Args:
         df (pandas.DataFrame): The DataFrame to write to the Excel file.
@@ -59,63 +246,330 @@ async def write_excel_async(df, path=EXCEL_FILE, **kwargs):
     Note:
         This function must be called within an async context.
     """
-    async with excel_lock:
-        df.to_excel(path, index=False, engine='openpyxl', **kwargs)
+    global _pending_writes
+    _pending_writes += 1
+    try:
+        async with locked_file(path):
+            await asyncio.to_thread(_write_excel_sync, df, path, **kwargs)
+    finally:
+        _pending_writes -= 1
+
 
+def append_rows(df: pd.DataFrame, rows: pd.DataFrame) -> pd.DataFrame:
+    """
+    Appends rows to a log, labelling them by position like a freshly read log.
 
-async def filter_booknames_with_user_status(user_id: str, status: int) -> list[str]:
+    An empty log (e.g. a new guild's) is not concatenated, since pandas would otherwise
+    guess the result's dtypes from its all-empty columns.
     """
-    Filters and returns a list book names for a given user and reading status.
+    if df.empty:
+        return rows.reindex(columns=df.columns.union(rows.columns, sort=False)).reset_index(drop=True)
+    if rows.empty:
+        return df
+    return pd.concat([df, rows], ignore_index=True)
+
+
+async def commit_excel_async(df, guild_id: int, removed=None, added=None):
+    """
+    Writes a guild's mutated reading log and applies the change to the in-memory indexes.
 
     Args:
-        user_id (str): The ID of the user whose books are to be filtered.
-        status (int): The reading status to filter by.
-            - 0: Shelved
-            - 1: Reading
-            - 2: Completed
+        df (pandas.DataFrame): The full reading log after the mutation.
+        guild_id (int): The guild whose data partition is written.
+        removed (pandas.DataFrame, optional): The affected rows as they were before the mutation.
+        added (pandas.DataFrame, optional): The affected rows as they are after the mutation.
+
+    Note:
+        Every mutation of the reading log should go through this function rather than
+        `write_excel_async`, otherwise indexes such as the stats rollups drift out of sync.
+        `removed` and `added` rows must keep the index labels they have in `df` (a freshly
+        read log is labelled by row position), which is how the book index tracks positions.
+    """
+    await write_excel_async(df, guild_excel_path(guild_id))
+    apply_to_indexes(guild_id, removed, added)
+
+
+@asynccontextmanager
+async def excel_transaction(guild_id: int):
+    """
+    Holds a guild's reading log lock across a read-modify-write, so no other task or
+    process can write in between and have its change overwritten.
+
+    If another process changed the data since this one last saw it, the indexes are
+    reloaded first (see `reload_if_changed`), so lookups inside the transaction match the file.
+
+    Example:
+        async with excel_transaction(guild_id):
+            df = await read_excel_async(guild_excel_path(guild_id))
+            ...
+            await commit_excel_async(df, guild_id, added=df.tail(1))
+    """
+    async with locked_file(guild_excel_path(guild_id)):
+        await reload_if_changed(guild_id)
+        yield
+
+
+def may_have_changed(guild_id: int) -> bool:
+    """
+    Cheaply checks (mtime and size only, no locking) whether a guild's data files differ from
+    the versions this process last read or wrote. A True result is confirmed by
+    `reload_if_changed`, e.g. by entering an `excel_transaction`.
+    """
+    return any(
+        _changed_externally(path, verify=False)
+        for path in (guild_excel_path(guild_id), guild_archive_path(guild_id))
+    )
+
+
+async def reload_if_changed(guild_id: int) -> bool:
+    """
+    Reloads a guild's data and rebuilds its indexes if another process (a second bot worker,
+    an admin tool or a hand edit) changed the reading log or the archive.
+
+    Call it while holding the reading log's lock (see `excel_transaction`); otherwise a
+    write of this process that is still in progress can look like an external change.
 
     Returns:
-        list[str]: A list of book names matching the user and status criteria.
-                   Returns an empty list if the user_id is invalid, the status is out of range,
-                   or if an error occurs during processing.
+        bool: True if the data was reloaded.
+    """
+    paths = [guild_excel_path(guild_id), guild_archive_path(guild_id)]
+    changed = [path for path in paths if await asyncio.to_thread(_changed_externally, path)]
+    if not changed:
+        return False
+    logger.warning(
+        f"🔄 {', '.join(f'`{path}`' for path in changed)} changed outside this process, reloading.",
+        extra={"guild_id": guild_id}
+    )
+    await warm_guild_async(guild_id)
+    return True
 
-    Raises:
-        None. All exceptions are caught and logged if DEBUG is enabled.
-
-    Notes:
-        - The function expects the existence of a global EXCEL_FILE variable and a read_excel_async function.
-        - The DataFrame is expected to have "UserID", "Status", and "BookName" columns.
-        - If DEBUG is enabled, error and warning messages are printed to the console.
-    """
-    if (not user_id) or (status > 2) or (status < 0):
-        return []
-    if not isinstance(status, int) or status not in [0, 1, 2]:
-        if DEBUG:
-            print("⚠️ Invalid status provided. Must be 0 (Shelved), 1 (Reading), or 2 (Completed).")
-        return []
+
+async def get_entry(guild_id: int, user_id, title: str, is_audio: bool) -> ReadingEntry | None:
+    """
+    Returns one of a user's books from the reading log.
+
+    The row is served from the book index; the log is only read if the book is not indexed
+    (e.g. the guild is still warming up).
+
+    Args:
+        guild_id (int): The guild.
+        user_id: The user who owns the book.
+        title (str): The book title as typed or selected.
+        is_audio (bool): Whether the audiobook is meant.
+
+    Returns:
+        ReadingEntry | None: The row, or None if the user has no such book.
+    """
+    entry = BOOKS.entry(guild_id, user_id, title, is_audio)
+    if entry is not None:
+        return entry
+    df = await read_excel_async(guild_excel_path(guild_id))
+    labels = BOOKS.locate_by_scan(df, user_id, title, is_audio)
+    return ReadingEntry.from_row(df, labels[0]) if labels else None
+
+
+async def update_entry(guild_id: int, user_id, title: str, changes: dict, is_audio: bool | None = None) -> list[ReadingEntry]:
+    """
+    Changes some columns of one of a user's books and commits the change.
+
+    The row is located through the book index and its cells are changed in place, and the
+    indexes receive the change as ReadingEntries rather than slices of the log. The log is
+    still read and the workbook rewritten in full: xlsx has no row-level update.
+
+    Args:
+        guild_id (int): The guild.
+        user_id: The user who owns the book.
+        title (str): The book title as typed or selected.
+        changes (dict): New values keyed by column, e.g. {"Status": 0, "LastUpdated": now}.
+        is_audio (bool | None, optional): Media type, or None to update both the book and
+            the audiobook with this title.
+
+    Returns:
+        list[ReadingEntry]: The updated rows (empty if the user has no such book in the hot log).
+    """
+    async with excel_transaction(guild_id):
+        df = await read_excel_async(guild_excel_path(guild_id))
+        labels = BOOKS.locate(df, guild_id, user_id, title, is_audio)
+        if not labels:
+            return []
+        before = [ReadingEntry.from_row(df, label) for label in labels]
+        after = [entry.replace(changes) for entry in before]
+        for label in labels:
+            for column, value in changes.items():
+                df.at[label, column] = value
+        await commit_excel_async(df, guild_id, removed=entries_frame(before, labels), added=entries_frame(after, labels))
+    return after
+
+
+async def delete_entry(guild_id: int, user_id, title: str, is_audio: bool | None = None) -> list[ReadingEntry]:
+    """
+    Deletes one of a user's books from the reading log and commits the change (the workbook
+    is rewritten in full).
+
+    Args:
+        guild_id (int): The guild.
+        user_id: The user who owns the book.
+        title (str): The book title as typed or selected.
+        is_audio (bool | None, optional): Media type, or None to delete both the book and
+            the audiobook with this title.
+
+    Returns:
+        list[ReadingEntry]: The deleted rows (empty if the user has no such book in the hot log).
+    """
+    async with excel_transaction(guild_id):
+        df = await read_excel_async(guild_excel_path(guild_id))
+        labels = BOOKS.locate(df, guild_id, user_id, title, is_audio)
+        if not labels:
+            return []
+        removed = [ReadingEntry.from_row(df, label) for label in labels]
+        await commit_excel_async(df.drop(index=labels), guild_id, removed=entries_frame(removed, labels))
+    return removed
+
+
+def as_archived(cold: pd.DataFrame) -> pd.DataFrame:
+    """
+    Labels rows of the cold tier for the indexes: archived row i gets label -(i + 1), so it
+    never collides with a position in the hot reading log.
+    """
+    return cold.set_axis(pd.RangeIndex(-1, -len(cold) - 1, -1), axis=0)
+
+
+async def read_archive_async(guild_id: int) -> pd.DataFrame:
+    """
+    Reads a guild's cold tier: finished or shelved books moved out of the working set
+    by `utils.archive`. Returns an empty log if nothing has been archived yet.
+    """
+    path = guild_archive_path(guild_id)
+    if not os.path.exists(path):
+        return pd.DataFrame(columns=LOG_COLUMNS)
+    return await read_excel_async(path)
+
+
+async def read_full_log_async(guild_id: int) -> pd.DataFrame:
+    """
+    Reads a guild's complete history: the hot reading log followed by the archived rows.
+
+    Use this for exports and other queries that need every row ever logged; commands that
+    only look at recent or active books should keep using the hot log from `read_excel_async`.
+
+    Returns:
+        pandas.DataFrame: Both tiers with a fresh RangeIndex (not suitable for commits).
+    """
+    hot = await read_excel_async(guild_excel_path(guild_id))
+    cold = await read_archive_async(guild_id)
+    if cold.empty:
+        return hot
+    return pd.concat([hot, cold], ignore_index=True)
+
+
+async def warm_guild_async(guild_id: int) -> str:
+    """
+    Loads a guild's reading log once at startup so the snapshot is mapped (or rebuilt)
+    and the in-memory indexes are built before the first command arrives. Also used to
+    reload a guild after its data was restored or changed by another process.
+
+    The indexes are built over both tiers, so totals and duplicate checks include archived rows.
+
+    Args:
+        guild_id (int): The guild whose data partition is loaded.
+
+    Returns:
+        str: A startup log line describing how the data was loaded.
+    """
+    path = guild_excel_path(guild_id)
+    started = time.perf_counter()
     try:
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str)
-        filtered = df[(df["UserID"] == user_id) & (df["Status"] == status)]
-        filtered = filtered.sort_values(
-            by="LastUpdated",
-            ascending=True,
-            key=lambda x: pd.to_datetime(x, errors='coerce')
-        )
-        return filtered["BookName"].dropna().tolist()
+        # Both files are locked while reading, so the versions remembered for change detection match the data indexed.
+        async with locked_file(path), locked_file(guild_archive_path(guild_id)):
+            hot = await read_excel_async(path)
+            cold = await read_archive_async(guild_id)
+            await asyncio.to_thread(_remember_version, path)
+            await asyncio.to_thread(_remember_version, guild_archive_path(guild_id))
     except Exception as e:
-        if DEBUG:
-            print(f"⚠️ Error fetching books for {user_id}: {e}")
-        return []
+        return f"❌ Failed to load `{path}`: {e}"
+    load_ms = (time.perf_counter() - started) * 1000
+    rebuild_indexes(guild_id, pd.concat([hot, as_archived(cold)]) if not cold.empty else hot)
+    index_ms = (time.perf_counter() - started) * 1000 - load_ms
+    archive_path = guild_archive_path(guild_id)
+    archive_kb = os.path.getsize(archive_path) / 1024 if os.path.exists(archive_path) else 0
+    msg = (
+        f"✅ Loaded `{path}` in {load_ms:.0f} ms (hot: {len(hot)} row(s), "
+        f"archive: {len(cold)} row(s), {archive_kb:.0f} KB), built indexes in {index_ms:.0f} ms."
+    )
+    if not snapshots_enabled():
+        msg += " ⚠️ pyarrow is not installed, reads parse the xlsx directly."
+    return msg
+
+
+def _restore_backup_sync(path: str, name: str | None) -> int:
+    restored = load_backup(path, name)
+    take_backup(_read_excel_sync(path), path, force_full=True)  # So the restore itself can be undone
+    _write_excel_sync(restored, path)
+    return len(restored)
+
+
+async def restore_backup_async(guild_id: int, name: str | None = None, archive: bool = False) -> int:
+    """
+    Restores a guild's reading log (or its archive) from a backup and reloads the indexes.
+
+    The current contents are backed up first, so a restore can itself be undone.
+
+    Args:
+        guild_id (int): The guild whose data is restored.
+        name (str | None, optional): The backup to restore (see `utils.backup.list_backups`);
+            defaults to the newest.
+        archive (bool, optional): Restore the archive (cold tier) instead of the reading log.
+
+    Returns:
+        int: The number of rows restored.
+
+    Raises:
+        ValueError: If the backup does not exist.
+    """
+    path = guild_archive_path(guild_id) if archive else guild_excel_path(guild_id)
+    async with locked_file(path):
+        rows = await asyncio.to_thread(_restore_backup_sync, path, name)
+    await warm_guild_async(guild_id)
+    return rows
+
+
+def count_user_books(guild_id: int, user_id: str, status: int) -> int:
+    """
+    Returns how many books a user has with the given status, from the in-memory counters.
+
+    Args:
+        guild_id (int): The guild whose reading log is counted.
+        user_id (str): The user whose books are counted.
+        status (int): 0 (Shelved), 1 (Reading) or 2 (Completed).
+
+    Returns:
+        int: The number of matching books (0 for an unknown user or status).
+    """
+    return STATUS_COUNTS.get(guild_id, user_id).get(status, 0)
+
+
+def get_user_status_counts(guild_id: int, user_id: str) -> dict[int, int]:
+    """Returns a user's book counts for every status, keyed by status value."""
+    return STATUS_COUNTS.get(guild_id, user_id)
+
+
+def booknames_with_status(df: pd.DataFrame, user_id: str, status: int) -> list[str]:
+    """Returns the names of a user's books with the given status, least recently updated first."""
+    filtered = df[(df["UserID"].astype(str) == str(user_id)) & (df["Status"] == status)]
+    filtered = filtered.sort_values(
+        by="LastUpdated",
+        ascending=True,
+        key=lambda x: pd.to_datetime(x, errors='coerce')
+    )
+    return filtered["BookName"].dropna().tolist()
     
 
-async def get_audiobook_excel() -> pd.DataFrame:
-    df = await read_excel_async(EXCEL_FILE)
+async def get_audiobook_excel(path: str = EXCEL_FILE) -> pd.DataFrame:
+    df = await read_excel_async(path)
     try:
         df["UserID"] = df["UserID"].astype(str)
         df_ab = df[df["Genres"].str.contains("audiobook", na=False)]
         return df_ab
     except Exception as e:
-        if DEBUG:
-            print("⚠️ Error filtering audiobooks: {e}")
+        logger.warning(f"⚠️ Error filtering audiobooks: {e}")
         return df
\ No newline at end of file
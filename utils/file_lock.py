@@ -0,0 +1,196 @@
+"""
+Cross-process locking of data files, so the bot, its other workers and admin tools can
+share the same workbook.
+
+Run as a script to hold a data file's lock while editing it by hand:
+    python -m utils.file_lock data/reading_data.xlsx --minutes 10
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import socket
+import time
+from config import DATA_LOCK_TIMEOUT_SECONDS, DATA_LOCK_LEASE_SECONDS
+from utils.logs import get_logger
+
+try:
+    import fcntl
+except ImportError:  # Windows: locking stays per process
+    fcntl = None
+
+logger = get_logger(__name__)
+
+LOCK_POLL_SECONDS = 0.05  # First retry delay while another process holds the lock (doubles up to 0.5s)
+
+
+class DataLockTimeout(TimeoutError):
+    """Raised when another process keeps a data file locked for longer than the lock timeout."""
+
+
+def lock_path_for(path: str) -> str:
+    """Returns the path of the lock file that guards a data file."""
+    return f"{path}.lock"
+
+
+def file_stamp(path: str) -> tuple[int, int] | None:
+    """Returns the (mtime_ns, size) of a file, or None if it doesn't exist."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(path: str) -> str | None:
+    """Returns the SHA-256 of a file's contents, or None if it doesn't exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(block)
+    except FileNotFoundError:
+        return None
+    return digest.hexdigest()
+
+
+class FileLease:
+    """
+    An exclusive `fcntl.flock` lock on a data file's `.lock` file, held as a lease.
+
+    The kernel releases the lock when its holder exits, so a crashed process never leaves a
+    stale lock behind. The holder writes its PID, host and lease expiry into the lock file:
+    a waiter that gives up after `timeout` reports who is holding the file and by how much
+    they have overrun their lease, and the holder logs a warning if it kept the file longer
+    than its lease. An advisory lock can't be taken away from a live process, so an overrun
+    lease is reported rather than broken.
+
+    Without `fcntl` (Windows) this is a no-op and only the in-process lock applies.
+
+    Args:
+        path (str): The data file.
+        lease_seconds (float, optional): How long the holder expects to keep the lock.
+        timeout (float, optional): How long to wait for another holder before giving up.
+    """
+
+    def __init__(self, path: str, lease_seconds: float = DATA_LOCK_LEASE_SECONDS, timeout: float = DATA_LOCK_TIMEOUT_SECONDS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.timeout = timeout
+        self._fd: int | None = None
+        self._acquired_at = 0.0
+
+    def _try_lock(self) -> bool:
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        fd = os.open(lock_path_for(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        self._acquired_at = time.time()
+        lease = {
+            "pid": os.getpid(),
+            "host": socket.gethostname(),
+            "acquired_at": self._acquired_at,
+            "lease_until": self._acquired_at + self.lease_seconds,
+        }
+        os.ftruncate(fd, 0)
+        os.pwrite(fd, json.dumps(lease).encode(), 0)
+        return True
+
+    def holder(self) -> dict | None:
+        """Returns the lease last written to the lock file (the current holder's, if it is held)."""
+        try:
+            with open(lock_path_for(self.path), encoding="utf-8") as f:
+                return json.loads(f.read() or "null")
+        except (OSError, ValueError):
+            return None
+
+    def _describe_holder(self) -> str:
+        lease = self.holder()
+        if not lease:
+            return "another process"
+        overrun = time.time() - lease.get("lease_until", time.time())
+        description = f"process {lease.get('pid')} on {lease.get('host')}"
+        if overrun > 0:
+            description += f" (lease expired {overrun:.0f}s ago)"
+        return description
+
+    async def acquire(self):
+        """
+        Waits for the lock without blocking the event loop.
+
+        Raises:
+            DataLockTimeout: If the file is still locked by another process after `timeout`.
+        """
+        if fcntl is None:
+            return
+        deadline = time.monotonic() + self.timeout
+        delay = LOCK_POLL_SECONDS
+        while not self._try_lock():
+            if time.monotonic() >= deadline:
+                raise DataLockTimeout(f"`{self.path}` is locked by {self._describe_holder()}.")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 0.5)
+
+    def acquire_blocking(self):
+        """Waits for the lock in a synchronous context (scripts and admin tools)."""
+        if fcntl is None:
+            return
+        deadline = time.monotonic() + self.timeout
+        while not self._try_lock():
+            if time.monotonic() >= deadline:
+                raise DataLockTimeout(f"`{self.path}` is locked by {self._describe_holder()}.")
+            time.sleep(LOCK_POLL_SECONDS)
+
+    def release(self):
+        if self._fd is None:
+            return
+        held = time.time() - self._acquired_at
+        if held > self.lease_seconds:
+            logger.warning(f"⚠️ Held the lock on `{self.path}` for {held:.1f}s, past its {self.lease_seconds:g}s lease.")
+        fd, self._fd = self._fd, None
+        try:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+        finally:
+            os.close(fd)
+
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc):
+        self.release()
+
+    def __enter__(self):
+        self.acquire_blocking()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Hold a data file's lock while editing it outside the bot.")
+    parser.add_argument("path", help="The data file, e.g. data/reading_data.xlsx")
+    parser.add_argument("--minutes", type=float, default=10, help="Lease length; the lock is released after it (default 10)")
+    args = parser.parse_args()
+
+    lease_seconds = args.minutes * 60
+    with FileLease(args.path, lease_seconds=lease_seconds, timeout=DATA_LOCK_TIMEOUT_SECONDS) as lease:
+        if fcntl is None:
+            print("⚠️ File locking is not supported on this platform; the bot will not wait for you.")
+        print(f"🔒 Locked `{lease.path}` for up to {args.minutes:g} minute(s). Commands that read or change it wait, then ask users to retry.")
+        print("   Save your changes, then press Ctrl+C to release. The bot reloads the file on its next check.")
+        try:
+            time.sleep(lease_seconds)
+            print("⏰ Lease expired, releasing the lock.")
+        except KeyboardInterrupt:
+            print("🔓 Released.")
+
+
+if __name__ == "__main__":
+    main()
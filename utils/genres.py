@@ -1,6 +1,9 @@
 from typing import Set, List
 import pandas as pd
-from config import GENRE_FILE, DEBUG
+from config import GENRE_FILE
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
 
 GENRE_LIST: List[str] = []
 GENRE_SET: Set[str] = set()
@@ -15,7 +18,6 @@ def update_genres():
     except Exception as e:
         GENRE_LIST = []
         GENRE_SET = set()
-        if DEBUG:
-            print(f"⚠️ Failed to update genres from file: {e}")
+        logger.warning(f"⚠️ Failed to update genres from file: {e}")
 
 update_genres()
@@ -1,19 +1,23 @@
 import csv
 import gspread
 from gspread_dataframe import set_with_dataframe
-from config import GOOGLE_SHEETS_CRED_PATH, GOOGLE_SHEET_NAME, GOOGLE_SHEET_WORKSHEET, GENRE_FILE
-from utils.excel import read_excel_async
+from config import GOOGLE_SHEETS_CRED_PATH, GOOGLE_SHEET_NAME, GENRE_FILE, GUILD_ID
+from utils.excel import read_full_log_async
+from utils.guilds import google_sheet_worksheet
 import utils.genres
 
-async def sync_excel_to_google_sheet():
+async def sync_excel_to_google_sheet(guild_id: int = GUILD_ID):
     """
-    Syncs the main Excel sheet to a Google Sheet and updates the local genre CSV file
-    from the "Genres" worksheet in the Google Sheet.
+    Syncs a guild's Excel sheet to its worksheet in the Google Sheet and updates the local
+    genre CSV file from the "Genres" worksheet in the Google Sheet.
+
+    Args:
+        guild_id (int, optional): The guild whose data partition is synced. Defaults to GUILD_ID.
 
     Steps:
     1. Connects to Google Sheets using service account credentials.
-    2. Opens the target Google Sheet and worksheet.
-    3. Reads the Excel file asynchronously and uploads its data to the worksheet.
+    2. Opens the target Google Sheet and the guild's worksheet.
+    3. Reads the guild's Excel file asynchronously and uploads its data to the worksheet.
     4. Fetches the "Genres" worksheet, validates its format, and writes its contents
        to a local CSV file specified by GENRE_FILE.
 
@@ -28,8 +32,9 @@ async def sync_excel_to_google_sheet():
     sh = gc.open(GOOGLE_SHEET_NAME)
 
     # Sync main Excel sheet
-    worksheet = sh.worksheet(GOOGLE_SHEET_WORKSHEET) if GOOGLE_SHEET_WORKSHEET else sh.sheet1
-    df = await read_excel_async()
+    worksheet_name = google_sheet_worksheet(guild_id)
+    worksheet = sh.worksheet(worksheet_name) if worksheet_name else sh.sheet1
+    df = await read_full_log_async(guild_id)
     worksheet.clear()
     set_with_dataframe(worksheet, df)
 
@@ -0,0 +1,111 @@
+import json
+import os
+from config import (
+    GUILD_ID, GUILD_IDS, GUILD_CONFIG_FILE, GUILD_DATA_DIR, EXCEL_FILE,
+    LOG_CHANNEL_ID, CHANNEL_ID, WELCOME_CHANNEL_ID, GOOGLE_SHEET_WORKSHEET
+)
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+GUILD_CONFIG: dict[int, dict] = {}
+
+
+def load_guild_config():
+    """
+    Re-reads the per-guild configuration file and updates GUILD_CONFIG.
+
+    The file maps guild IDs to optional overrides, e.g.
+    `{"1234": {"log_channel_id": 1, "summary_channel_id": 2, "welcome_channel_id": 3,
+    "excel_file": "data/guilds/1234/reading_data.xlsx", "google_sheet_worksheet": "Guild1234"}}`.
+    Anything not configured falls back to the defaults of `get_guild_config`.
+    """
+    global GUILD_CONFIG
+    try:
+        with open(GUILD_CONFIG_FILE, encoding="utf-8") as f:
+            GUILD_CONFIG = {int(gid): values for gid, values in json.load(f).items()}
+    except FileNotFoundError:
+        GUILD_CONFIG = {}
+    except Exception as e:
+        GUILD_CONFIG = {}
+        logger.warning(f"⚠️ Failed to load guild config from file: {e}")
+
+
+def get_guild_config(guild_id: int | None) -> dict:
+    """
+    Returns the effective configuration of a guild.
+
+    The primary guild (`ALLOWED_GUILD_ID`) defaults to the channels from `.env` and the
+    original `EXCEL_FILE`, so existing single-guild deployments keep their data. Every other
+    guild gets its own partition under `GUILD_DATA_DIR` and no channels until configured.
+
+    Args:
+        guild_id (int | None): The Discord guild ID.
+
+    Returns:
+        dict: Keys `excel_file`, `log_channel_id`, `summary_channel_id`,
+        `welcome_channel_id` and `google_sheet_worksheet`.
+    """
+    guild_id = guild_id or GUILD_ID
+    if guild_id == GUILD_ID:
+        defaults = {
+            "excel_file": EXCEL_FILE,
+            "log_channel_id": LOG_CHANNEL_ID,
+            "summary_channel_id": CHANNEL_ID,
+            "welcome_channel_id": WELCOME_CHANNEL_ID,
+            "google_sheet_worksheet": GOOGLE_SHEET_WORKSHEET,
+        }
+    else:
+        defaults = {
+            "excel_file": os.path.join(GUILD_DATA_DIR, str(guild_id), os.path.basename(EXCEL_FILE)),
+            "log_channel_id": 0,
+            "summary_channel_id": 0,
+            "welcome_channel_id": 0,
+            "google_sheet_worksheet": f"{GOOGLE_SHEET_WORKSHEET}_{guild_id}",
+        }
+    return {**defaults, **GUILD_CONFIG.get(guild_id, {})}
+
+
+def is_allowed_guild(guild_id: int | None) -> bool:
+    """Returns True if the bot is configured to serve the given guild."""
+    return guild_id in GUILD_IDS
+
+
+def guild_excel_path(guild_id: int | None) -> str:
+    """Returns the path of the reading log partition that belongs to the guild."""
+    return get_guild_config(guild_id)["excel_file"]
+
+
+def guild_archive_path(guild_id: int | None) -> str:
+    """Returns the path of the guild's cold (archived) reading log partition."""
+    root, ext = os.path.splitext(guild_excel_path(guild_id))
+    return f"{root}_archive{ext}"
+
+
+def guild_progress_path(guild_id: int | None) -> str:
+    """Returns the path of the guild's progress journal (page and minute deltas, see `utils.progress_journal`)."""
+    root, _ = os.path.splitext(guild_excel_path(guild_id))
+    return f"{root}_progress.jsonl"
+
+
+def log_channel_id(guild_id: int | None) -> int:
+    """Returns the admin/log channel ID of the guild (0 if not configured)."""
+    return int(get_guild_config(guild_id)["log_channel_id"] or 0)
+
+
+def summary_channel_id(guild_id: int | None) -> int:
+    """Returns the channel ID where summaries and reminders are posted (0 if not configured)."""
+    return int(get_guild_config(guild_id)["summary_channel_id"] or 0)
+
+
+def welcome_channel_id(guild_id: int | None) -> int:
+    """Returns the welcome channel ID of the guild (0 if not configured)."""
+    return int(get_guild_config(guild_id)["welcome_channel_id"] or 0)
+
+
+def google_sheet_worksheet(guild_id: int | None) -> str:
+    """Returns the Google Sheet worksheet the guild's log is synced to."""
+    return get_guild_config(guild_id)["google_sheet_worksheet"]
+
+
+load_guild_config()
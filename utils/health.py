@@ -0,0 +1,95 @@
+import asyncio
+import os
+import resource
+import time
+from collections import Counter
+
+# (command, event) -> count, e.g. ("update_book", "invoked"). Events: "invoked" and "completed".
+COMMAND_METRICS: Counter = Counter()
+
+STORAGE_PROBE_SECONDS = 30.0  # How long a storage write check is reused
+
+
+class LoopLagMonitor:
+    """
+    Measures how late the event loop wakes up a task that sleeps for a fixed interval.
+
+    A healthy loop wakes it within a millisecond or two; anything blocking the loop (CPU
+    work, synchronous I/O) shows up as lag. The worst lag since the last scrape is kept too,
+    so short stalls between two scrapes are not missed.
+    """
+
+    def __init__(self, interval: float = 0.5):
+        self.interval = interval
+        self.last = 0.0
+        self.max_since_scrape = 0.0
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            started = loop.time()
+            await asyncio.sleep(self.interval)
+            self.last = max(loop.time() - started - self.interval, 0.0)
+            self.max_since_scrape = max(self.max_since_scrape, self.last)
+
+    def scrape(self) -> tuple[float, float]:
+        """Returns (last lag, worst lag since the previous scrape) in seconds."""
+        worst, self.max_since_scrape = max(self.max_since_scrape, self.last), 0.0
+        return self.last, worst
+
+
+def rss_bytes() -> int:
+    """Returns the process's resident memory (the peak if the current value isn't available)."""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+_storage_checks: dict[str, tuple[float, bool]] = {}
+
+
+def storage_writable(directory: str) -> bool:
+    """
+    Checks that a file can be created in a data directory (the result is reused for
+    `STORAGE_PROBE_SECONDS`, so frequent health checks don't touch the disk every time).
+    """
+    checked_at, writable = _storage_checks.get(directory, (0.0, False))
+    if time.monotonic() - checked_at < STORAGE_PROBE_SECONDS:
+        return writable
+    probe = os.path.join(directory, ".health_probe")
+    try:
+        os.makedirs(directory, exist_ok=True)
+        with open(probe, "w") as f:
+            f.write("ok")
+        os.remove(probe)
+        writable = True
+    except OSError:
+        writable = False
+    _storage_checks[directory] = (time.monotonic(), writable)
+    return writable
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def render_metrics(metrics: list[tuple[str, str, list[tuple[dict, float]]]]) -> str:
+    """
+    Renders metrics in the Prometheus text format.
+
+    Args:
+        metrics (list): (name, type, samples) per metric, where type is "gauge" or "counter"
+            and samples are (labels, value) pairs.
+
+    Returns:
+        str: The exposition text.
+    """
+    lines = []
+    for name, kind, samples in metrics:
+        lines.append(f"# TYPE {name} {kind}")
+        for labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+            lines.append(f"{name}{{{label_text}}} {value}" if label_text else f"{name} {value}")
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,242 @@
+import io
+from datetime import datetime
+from typing import Iterator
+import openpyxl
+import pandas as pd
+from config import MAX_ACTIVE_BOOKS
+from utils.time_data import parse_time_to_minutes
+from utils.text import normalize_title
+import utils.genres
+from utils.book_index import BOOKS
+from utils.excel import LOG_COLUMNS
+
+IMPORT_CHUNK_ROWS: int = 1000
+REQUIRED_COLUMNS: list[str] = ["BookName", "Author", "Genres", "LastPage", "TotalPages"]
+# Columns of the rejected-rows file sent back to the user, whatever the upload contained.
+REJECTED_COLUMNS: list[str] = REQUIRED_COLUMNS + ["Status", "Date", "LastUpdated", "Reason"]
+
+
+class ImportTooLarge(ValueError):
+    """Raised when an upload has more rows than a single import accepts."""
+
+
+def iter_upload_chunks(data: bytes, filename: str, chunk_rows: int = IMPORT_CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+    """
+    Stream-parses an uploaded CSV or xlsx file into DataFrame chunks of raw string values.
+
+    CSV files are read with pandas' chunked reader; xlsx files are read row by row with
+    openpyxl's read-only mode, so a large upload never needs a full in-memory workbook.
+
+    Args:
+        data (bytes): The uploaded file contents.
+        filename (str): The uploaded file name, used to pick the parser.
+        chunk_rows (int, optional): Rows per yielded chunk.
+
+    Yields:
+        pandas.DataFrame: Consecutive chunks with all values as strings (or NaN).
+
+    Raises:
+        ValueError: If the file type is not supported or the header is missing.
+    """
+    name = filename.lower()
+    if name.endswith(".csv"):
+        yield from pd.read_csv(io.BytesIO(data), dtype=str, chunksize=chunk_rows, skipinitialspace=True)
+        return
+    if not name.endswith(".xlsx"):
+        raise ValueError("Only .csv and .xlsx files can be imported.")
+
+    workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if not header:
+            raise ValueError("The uploaded sheet is empty.")
+        columns = [str(col).strip() if col is not None else "" for col in header]
+        batch = []
+        for row in rows:
+            batch.append([None if value is None else str(value) for value in row])
+            if len(batch) >= chunk_rows:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+        if batch:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+
+def _parse_progress(values: pd.Series, is_audio: pd.Series) -> pd.Series:
+    """Parses LastPage/TotalPages values: integers for books, durations for audiobooks."""
+    values = values.fillna("").astype(str).str.strip()
+    pages = pd.to_numeric(values.where(~is_audio), errors="coerce")
+
+    # Parse each distinct duration only once; imports repeat the same values a lot.
+    durations = {}
+    for value in values[is_audio].unique():
+        try:
+            durations[value] = parse_time_to_minutes(value)
+        except ValueError:
+            durations[value] = None
+    minutes = pd.to_numeric(values[is_audio].map(durations), errors="coerce")
+    return pages.where(~is_audio, minutes)
+
+
+def validate_chunk(chunk: pd.DataFrame, user_id: str, user_name: str) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Validates one chunk of uploaded rows with vectorized checks and converts it to log rows.
+
+    Args:
+        chunk (pandas.DataFrame): Raw uploaded rows.
+        user_id (str): The user the rows are imported for.
+        user_name (str): The user's name stored in the log.
+
+    Returns:
+        tuple: (accepted, rejected)
+            accepted: Rows in reading-log format.
+            rejected: The original rows with an added "Reason" column.
+    """
+    chunk = chunk.rename(columns=lambda col: str(col).strip())
+    missing = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise ValueError(f"Missing column(s): {', '.join(missing)}.")
+
+    reasons = pd.Series("", index=chunk.index)
+
+    def reject(mask: pd.Series, reason: str):
+        reasons[mask & (reasons == "")] = reason
+
+    book_name = chunk["BookName"].fillna("").astype(str).str.strip().str.lower()
+    author = chunk["Author"].fillna("").astype(str).str.strip().str.lower()
+    reject((book_name == "") | (author == ""), "Missing book name or author")
+
+    # Genre check: explode every row's genres once and test them all against GENRE_SET.
+    genre_lists = chunk["Genres"].fillna("").astype(str).str.lower().str.split(",")
+    exploded = genre_lists.explode().str.strip()
+    exploded = exploded[exploded != ""]
+    invalid = exploded[~exploded.isin(utils.genres.GENRE_SET)]
+    genre_errors = ("Invalid genres: " + invalid.groupby(level=0).agg(lambda g: ", ".join(sorted(set(g))))).reindex(chunk.index)
+    has_invalid = genre_errors.notna() & (reasons == "")
+    reasons[has_invalid] = genre_errors[has_invalid]
+    genres = exploded.groupby(level=0).agg(lambda g: ", ".join(dict.fromkeys(g))).reindex(chunk.index).fillna("")
+    reject(genres == "", "No genres")
+
+    is_audio = genres.str.contains("audiobook")
+    last_page = _parse_progress(chunk["LastPage"], is_audio)
+    total_pages = _parse_progress(chunk["TotalPages"], is_audio)
+    reject(last_page.isna() | total_pages.isna(), "Invalid page or time value")
+    reject((last_page < 0) | (total_pages <= 0) | (last_page > total_pages), "Invalid page values")
+
+    now = datetime.now()
+    last_updated = pd.to_datetime(chunk["LastUpdated"], errors="coerce") if "LastUpdated" in chunk else None
+    date_added = pd.to_datetime(chunk["Date"], errors="coerce") if "Date" in chunk else None
+    status = pd.to_numeric(chunk["Status"], errors="coerce") if "Status" in chunk else pd.Series(1, index=chunk.index)
+    status = status.where(status.isin([0, 1, 2]), 1)
+    status = status.where(last_page != total_pages, 2)
+
+    valid = reasons == ""
+    accepted = pd.DataFrame({
+        "Date": date_added.fillna(now) if date_added is not None else now,
+        "UserID": user_id,
+        "UserName": user_name,
+        "BookName": book_name,
+        "Author": author,
+        "Genres": genres,
+        "LastPage": last_page,
+        "TotalPages": total_pages,
+        "LastUpdated": last_updated.fillna(now) if last_updated is not None else now,
+        "Status": status,
+    }, index=chunk.index)[valid]
+    accepted = accepted.astype({"LastPage": int, "TotalPages": int, "Status": int})
+
+    rejected = chunk[~valid].assign(Reason=reasons[~valid]).reindex(columns=REJECTED_COLUMNS)
+    return accepted[LOG_COLUMNS], rejected
+
+
+def parse_upload(data: bytes, filename: str, user_id: str, user_name: str, max_rows: int) -> tuple[pd.DataFrame, pd.DataFrame, int]:
+    """
+    Parses and validates a whole upload. CPU-bound, so callers run it in a worker thread.
+
+    Args:
+        data (bytes): The uploaded file contents.
+        filename (str): The uploaded file name, used to pick the parser.
+        user_id (str): The user the rows are imported for.
+        user_name (str): The user's name stored in the log.
+        max_rows (int): The most rows a single import accepts.
+
+    Returns:
+        tuple: (accepted, rejected, total_rows), see `validate_chunk`.
+
+    Raises:
+        ImportTooLarge: If the upload has more than `max_rows` rows.
+        ValueError: If the file can't be read or lacks required columns.
+    """
+    accepted_chunks, rejected_chunks, total_rows = [], [], 0
+    for chunk in iter_upload_chunks(data, filename):
+        total_rows += len(chunk)
+        if total_rows > max_rows:
+            raise ImportTooLarge(f"Imports are limited to {max_rows} rows. Please split the file.")
+        accepted, rejected = validate_chunk(chunk, user_id, user_name)
+        accepted_chunks.append(accepted)
+        rejected_chunks.append(rejected)
+    if not accepted_chunks:
+        return pd.DataFrame(columns=LOG_COLUMNS), pd.DataFrame(columns=REJECTED_COLUMNS), 0
+    return pd.concat(accepted_chunks, ignore_index=True), pd.concat(rejected_chunks, ignore_index=True), total_rows
+
+
+def merge_import(
+    existing: pd.DataFrame,
+    accepted: pd.DataFrame,
+    rejected: pd.DataFrame,
+    user_id: str,
+    guild_id: int
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    De-duplicates validated rows against each other and the existing log with a hash join,
+    and enforces the active book limit.
+
+    Books in the archive are not in `existing`; they are found through the book index,
+    which covers both tiers.
+
+    Args:
+        existing (pandas.DataFrame): The guild's current (hot) reading log.
+        accepted (pandas.DataFrame): Validated rows in reading-log format.
+        rejected (pandas.DataFrame): Rows rejected so far (with a "Reason" column).
+        user_id (str): The user the rows are imported for.
+        guild_id (int): The guild, for the book index lookup.
+
+    Returns:
+        tuple: (accepted, rejected) after de-duplication and the limit check.
+    """
+    accepted = accepted.reset_index(drop=True)
+
+    def keys(df: pd.DataFrame) -> pd.DataFrame:
+        return pd.DataFrame({
+            "UserID": df["UserID"].astype(str),
+            "Key": df["BookName"].map(normalize_title),
+            "Audio": df["Genres"].fillna("").astype(str).str.contains("audiobook"),
+        }, index=df.index)
+
+    new_keys = keys(accepted)
+    duplicate_in_file = new_keys.duplicated(keep="last")
+
+    existing_keys = keys(existing[existing["UserID"].astype(str) == user_id]).drop_duplicates()
+    joined = new_keys.reset_index().merge(existing_keys, on=["UserID", "Key", "Audio"], how="left", indicator=True)
+    already_logged = pd.Series(joined["_merge"].eq("both").values, index=new_keys.index)
+    already_logged |= pd.Series([
+        BOOKS.contains(guild_id, user_id, title, is_audio)
+        for title, is_audio in zip(accepted["BookName"], new_keys["Audio"])
+    ], index=new_keys.index, dtype=bool)
+
+    existing_active = int(((existing["UserID"].astype(str) == user_id) & (existing["Status"] == 1)).sum())
+    keep = ~duplicate_in_file & ~already_logged
+    active_rank = (accepted["Status"].eq(1) & keep).cumsum()
+    over_limit = keep & accepted["Status"].eq(1) & (existing_active + active_rank > MAX_ACTIVE_BOOKS)
+    keep &= ~over_limit
+
+    dropped = accepted[~keep].assign(Reason="")
+    dropped.loc[over_limit[~keep].values, "Reason"] = f"Active book limit ({MAX_ACTIVE_BOOKS}) reached"
+    dropped.loc[already_logged[~keep].values, "Reason"] = "Already in your reading log"
+    dropped.loc[duplicate_in_file[~keep].values, "Reason"] = "Duplicate row in the uploaded file"
+
+    parts = [frame for frame in (rejected, dropped.reindex(columns=REJECTED_COLUMNS)) if not frame.empty]
+    rejected = pd.concat(parts, ignore_index=True) if parts else pd.DataFrame(columns=REJECTED_COLUMNS)
+    return accepted[keep], rejected
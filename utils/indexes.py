@@ -0,0 +1,69 @@
+import pandas as pd
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+
+class RowIndex:
+    """
+    Base class for in-memory structures derived from a guild's reading log.
+
+    Indexes are rebuilt from the full log when a guild is loaded and are then kept in
+    sync incrementally: every mutation reports the rows it removed and the rows it added
+    (an update is the old row removed and the new row added).
+
+    Methods:
+        rebuild(guild_id, df): Recomputes the index for a guild from its full reading log.
+        apply(guild_id, removed, added): Applies a committed mutation to the index.
+    """
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        raise NotImplementedError
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        raise NotImplementedError
+
+
+_indexes: list[RowIndex] = []
+_warmed: set[int] = set()  # Guilds whose indexes were built from their full log
+
+
+def register_index(index: RowIndex) -> RowIndex:
+    """Registers an index so it is rebuilt on load and updated on every commit."""
+    if index not in _indexes:
+        _indexes.append(index)
+    return index
+
+
+def rebuild_indexes(guild_id: int, df: pd.DataFrame):
+    """Rebuilds every registered index of a guild from its full reading log."""
+    for index in _indexes:
+        try:
+            index.rebuild(guild_id, df)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to rebuild {type(index).__name__} for guild {guild_id}: {e}", extra={"guild_id": guild_id})
+    _warmed.add(guild_id)
+
+
+def is_warmed(guild_id: int) -> bool:
+    """Returns True once a guild's indexes have been built (see `utils.excel.warm_guild_async`)."""
+    return guild_id in _warmed
+
+
+def apply_to_indexes(guild_id: int, removed: pd.DataFrame | None = None, added: pd.DataFrame | None = None):
+    """
+    Applies a committed mutation to every registered index of a guild.
+
+    Args:
+        guild_id (int): The guild whose reading log was changed.
+        removed (pandas.DataFrame | None): Rows as they were before the mutation.
+        added (pandas.DataFrame | None): Rows as they are after the mutation.
+    """
+    empty = pd.DataFrame()
+    removed = removed if removed is not None else empty
+    added = added if added is not None else empty
+    for index in _indexes:
+        try:
+            index.apply(guild_id, removed, added)
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to update {type(index).__name__} for guild {guild_id}: {e}", extra={"guild_id": guild_id})
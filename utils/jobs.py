@@ -0,0 +1,282 @@
+import asyncio
+import itertools
+import multiprocessing
+import queue
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Awaitable, Callable
+from config import REPORT_WORKERS, REPORT_PROGRESS_SECONDS
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+# Set in every worker process by `_init_worker`.
+_progress_queue = None
+_cancel_flags = None
+
+
+class JobCancelled(Exception):
+    """Raised when a job is cancelled, both inside the worker and to whoever awaits the job."""
+
+
+class JobContext:
+    """
+    Passed to every job as its first argument, in the worker process.
+
+    Jobs call `progress` between steps; that is also where a cancellation takes effect,
+    since a running worker process can't be interrupted from outside.
+    """
+
+    def __init__(self, job_id: int, slot: int):
+        self.job_id = job_id
+        self.slot = slot
+
+    def progress(self, fraction: float, message: str = ""):
+        """
+        Reports how far the job is (0..1) and what it is doing.
+
+        Raises:
+            JobCancelled: If the job was cancelled; the job should let it propagate.
+        """
+        if _cancel_flags is not None and _cancel_flags[self.slot]:
+            raise JobCancelled()
+        if _progress_queue is not None:
+            _progress_queue.put((self.job_id, min(max(fraction, 0.0), 1.0), message))
+
+
+def _init_worker(progress_queue, cancel_flags):
+    global _progress_queue, _cancel_flags
+    _progress_queue, _cancel_flags = progress_queue, cancel_flags
+
+
+def _run_job(fn, job_id: int, slot: int, args: tuple):
+    return fn(JobContext(job_id, slot), *args)
+
+
+class Job:
+    """
+    A job submitted to a `JobRunner`.
+
+    Attributes:
+        id (int): Unique job number.
+        name (str): What the job does, e.g. "export guild 123".
+        state (str): "queued", "running", "done", "failed" or "cancelled".
+        fraction (float): Last reported progress (0..1).
+        message (str): Last reported step.
+        position (int): Jobs ahead of this one while it is queued.
+    """
+
+    def __init__(self, runner: "JobRunner", job_id: int, name: str):
+        self.runner = runner
+        self.id = job_id
+        self.name = name
+        self.state = "queued"
+        self.fraction = 0.0
+        self.message = ""
+        self.position = 0
+        self.submitted_at = time.monotonic()
+        self.started_at: float | None = None
+        self.cancel_requested = False
+        self.slot: int | None = None
+        self.task: asyncio.Task | None = None
+
+    def cancel(self):
+        """Cancels the job: a queued job never starts, a running one stops at its next progress report."""
+        self.cancel_requested = True
+        if self.state == "queued" and self.task is not None:
+            self.task.cancel()
+        elif self.state == "running" and self.slot is not None:
+            self.runner._cancel_flags[self.slot] = 1
+
+    async def result(self):
+        """
+        Waits for the job and returns what it returned.
+
+        If the caller itself is cancelled, the job is cancelled too, since nobody is left to
+        use its result.
+
+        Raises:
+            JobCancelled: If the job was cancelled.
+            Exception: Whatever the job raised.
+        """
+        try:
+            return await asyncio.shield(self.task)
+        except asyncio.CancelledError:
+            if self.task.cancelled() and self.cancel_requested:
+                raise JobCancelled() from None
+            self.cancel()
+            raise
+
+    def describe(self) -> str:
+        """Returns a one-line status for progress messages, e.g. "⏳ Export: 40% (writing rows)"."""
+        if self.state == "queued":
+            return f"🕒 {self.name}: waiting for {self.position} other job(s) to finish…"
+        percent = f"{self.fraction * 100:.0f}%"
+        return f"⏳ {self.name}: {percent}" + (f" ({self.message})" if self.message else "")
+
+
+class JobRunner:
+    """
+    Runs CPU-heavy report jobs (exports, full progress reports, charts) in worker processes.
+
+    Building a workbook or formatting every user's rows holds the GIL, which would stall the
+    gateway even in a thread. Jobs instead run in a small process pool, at most `workers` at
+    a time; later jobs wait in line, so concurrent exports never use more than that many
+    cores. Jobs receive file paths rather than DataFrames: the worker maps the Arrow
+    snapshot (or parses the workbook) itself, and since every save replaces the files
+    atomically, a job always reads one consistent version of the data.
+
+    A job is a module-level function `fn(ctx: JobContext, *args)` whose arguments and
+    result can be pickled.
+
+    Example:
+        job = REPORTS.submit("Export", export_log, paths, on_progress=show)
+        data = await job.result()
+    """
+
+    def __init__(self, workers: int):
+        self.workers = max(workers, 1)
+        self._pool: ProcessPoolExecutor | None = None
+        self._progress_queue = None
+        self._cancel_flags = None
+        self._free_slots = list(range(self.workers))
+        self._semaphore = asyncio.Semaphore(self.workers)
+        self._ids = itertools.count(1)
+        self._jobs: dict[int, Job] = {}
+        self._finished: dict[str, int] = {"done": 0, "failed": 0, "cancelled": 0}
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            context = multiprocessing.get_context()
+            self._progress_queue = context.Queue()
+            self._cancel_flags = context.Array("b", self.workers, lock=False)
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=context,
+                initializer=_init_worker,
+                initargs=(self._progress_queue, self._cancel_flags)
+            )
+        return self._pool
+
+    def submit(
+        self,
+        name: str,
+        fn: Callable,
+        *args,
+        on_progress: Callable[[Job], Awaitable[None]] | None = None
+    ) -> Job:
+        """
+        Queues a job and returns at once.
+
+        Args:
+            name (str): What the job does, shown in progress messages.
+            fn (Callable): Module-level function called as `fn(ctx, *args)` in a worker.
+            *args: Picklable arguments, e.g. data file paths.
+            on_progress (Callable, optional): Awaited with the job every
+                `REPORT_PROGRESS_SECONDS` while it is queued or running (e.g. to edit a message).
+
+        Returns:
+            Job: Handle to await (`result`) or cancel the job.
+        """
+        job = Job(self, next(self._ids), name)
+        self._jobs[job.id] = job
+        job.position = sum(1 for other in self._jobs.values() if other.state in ("queued", "running")) - 1
+        job.task = asyncio.create_task(self._execute(job, fn, args, on_progress))
+        return job
+
+    async def _execute(self, job: Job, fn: Callable, args: tuple, on_progress):
+        try:
+            await self._acquire(job, on_progress)
+            try:
+                if job.cancel_requested:
+                    raise JobCancelled()
+                return await self._run(job, fn, args, on_progress)
+            finally:
+                self._semaphore.release()
+        except (JobCancelled, asyncio.CancelledError):
+            job.state = "cancelled"
+            raise
+        except Exception:
+            job.state = "failed"
+            raise
+        finally:
+            self._finished[job.state if job.state in self._finished else "failed"] += 1
+            self._jobs.pop(job.id, None)
+            self._update_positions()
+
+    async def _acquire(self, job: Job, on_progress):
+        """Waits for a free worker, reporting the job's place in line meanwhile."""
+        while True:
+            try:
+                await asyncio.wait_for(self._semaphore.acquire(), timeout=REPORT_PROGRESS_SECONDS)
+                return
+            except asyncio.TimeoutError:
+                await self._notify(job, on_progress)
+
+    @staticmethod
+    async def _notify(job: Job, on_progress):
+        if on_progress is None:
+            return
+        try:
+            await on_progress(job)
+        except Exception as e:
+            logger.debug(f"🟡 Progress update of `{job.name}` failed: {e}")
+
+    async def _run(self, job: Job, fn: Callable, args: tuple, on_progress):
+        pool = self._get_pool()
+        job.slot = self._free_slots.pop()
+        self._cancel_flags[job.slot] = 0
+        job.state, job.started_at = "running", time.monotonic()
+        future = asyncio.get_running_loop().run_in_executor(pool, _run_job, fn, job.id, job.slot, args)
+        try:
+            while True:
+                done, _ = await asyncio.wait({future}, timeout=REPORT_PROGRESS_SECONDS)
+                self._drain_progress()
+                if done:
+                    break
+                await self._notify(job, on_progress)
+            result = future.result()
+        except BrokenProcessPool:
+            logger.error(f"❌ A report worker died while running `{job.name}`; restarting the pool.")
+            self._pool = None
+            raise
+        finally:
+            self._cancel_flags[job.slot] = 0
+            self._free_slots.append(job.slot)
+            job.slot = None
+        job.state, job.fraction = "done", 1.0
+        logger.info(f"✅ Job `{job.name}` finished in {time.monotonic() - job.started_at:.1f}s.")
+        return result
+
+    def _drain_progress(self):
+        while True:
+            try:
+                job_id, fraction, message = self._progress_queue.get_nowait()
+            except queue.Empty:
+                return
+            job = self._jobs.get(job_id)
+            if job is not None:
+                job.fraction, job.message = fraction, message
+
+    def _update_positions(self):
+        queued = sorted((job for job in self._jobs.values() if job.state == "queued"), key=lambda job: job.id)
+        running = sum(1 for job in self._jobs.values() if job.state == "running")
+        for position, job in enumerate(queued):
+            job.position = position + running
+
+    def stats(self) -> dict[str, int]:
+        """Returns how many jobs are queued and running, and how many ended in each state."""
+        states = [job.state for job in self._jobs.values()]
+        return {"queued": states.count("queued"), "running": states.count("running"), **self._finished}
+
+    def shutdown(self):
+        """Cancels every job and stops the worker processes (e.g. when the bot shuts down)."""
+        for job in list(self._jobs.values()):
+            job.cancel()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+
+REPORTS = JobRunner(REPORT_WORKERS)
@@ -0,0 +1,121 @@
+import heapq
+from datetime import datetime
+import pandas as pd
+from utils.indexes import RowIndex, register_index
+from utils.stats import row_contributions, progress_contributions, period_key
+from utils.progress_journal import PROGRESS_JOURNAL, progress_deltas
+
+TOP_K: int = 10
+METRICS: dict[str, str] = {"pages": "Pages", "finished": "Finished", "minutes": "Minutes"}
+LEADERBOARD_PERIODS: tuple[str, ...] = ("week", "month", "all")
+MEDALS: list[str] = ["🥇", "🥈", "🥉"]
+
+
+def format_score(metric: str, score: int) -> str:
+    """Formats a leaderboard score for display."""
+    if metric == "minutes":
+        hours, minutes = divmod(score, 60)
+        return f"{hours}h {minutes}m"
+    if metric == "finished":
+        return f"{score} book{'s' if score != 1 else ''}"
+    return f"{score} pages"
+
+
+def format_leaderboard(entries: list[tuple[str, int]], metric: str) -> str:
+    """Renders leaderboard entries as ranked lines with user mentions."""
+    return "\n".join(
+        f"{MEDALS[rank] if rank < len(MEDALS) else f'`#{rank + 1}`'} <@{user_id}> — {format_score(metric, score)}"
+        for rank, (user_id, score) in enumerate(entries)
+    )
+
+
+class Leaderboards(RowIndex):
+    """
+    Incrementally maintained top-K leaderboards per metric and period.
+
+    For every guild and (metric, period, bucket) the index keeps each user's score and a
+    bounded, sorted top-K list. A mutation adjusts only the affected users' scores and
+    patches the top-K list; the full score table is only scanned again when a user who
+    was in a full top-K list drops, since someone outside the list may now overtake them.
+
+    All-time scores come from the reading log; weekly and monthly scores count the progress
+    logged in that week or month (see `utils.progress_journal`).
+
+    Metrics:
+        pages: Pages read in books. finished: Books finished. minutes: Audiobook minutes.
+    """
+
+    def __init__(self, k: int = TOP_K):
+        self.k = k
+        self._boards: dict[int, dict[tuple[str, str, str], dict]] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._boards[guild_id] = {}
+        totals = pd.concat([
+            row_contributions(df)[0],
+            progress_contributions(PROGRESS_JOURNAL.load(guild_id))[0],
+        ], ignore_index=True)
+        totals = totals[totals["Period"].isin(LEADERBOARD_PERIODS)]
+        boards = self._boards[guild_id]
+        for metric, column in METRICS.items():
+            for (period, key), group in totals[totals[column] > 0].groupby(["Period", "Key"]):
+                scores = dict(zip(group["UserID"], group[column].astype(int)))
+                boards[(metric, period, key)] = {"scores": scores, "top": self._top_of(scores)}
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        deltas: dict[tuple[str, str, str, str], int] = {}
+        contributions = [
+            (row_contributions(removed)[0], -1),
+            (row_contributions(added)[0], 1),
+            (progress_contributions(progress_deltas(removed, added))[0], 1),
+        ]
+        for totals, sign in contributions:
+            for row in totals[totals["Period"].isin(LEADERBOARD_PERIODS)].itertuples(index=False):
+                for metric, column in METRICS.items():
+                    key = (metric, row.Period, row.Key, row.UserID)
+                    deltas[key] = deltas.get(key, 0) + sign * int(getattr(row, column))
+
+        boards = self._boards.setdefault(guild_id, {})
+        for (metric, period, key, user_id), delta in deltas.items():
+            if delta:
+                board = boards.setdefault((metric, period, key), {"scores": {}, "top": []})
+                self._adjust(board, user_id, delta)
+
+    def _top_of(self, scores: dict[str, int]) -> list[tuple[str, int]]:
+        return heapq.nsmallest(self.k, scores.items(), key=lambda item: (-item[1], item[0]))
+
+    def _adjust(self, board: dict, user_id: str, delta: int):
+        scores, top = board["scores"], board["top"]
+        score = scores.get(user_id, 0) + delta
+        if score > 0:
+            scores[user_id] = score
+        else:
+            scores.pop(user_id, None)
+
+        was_in_top = any(uid == user_id for uid, _ in top)
+        if was_in_top and delta < 0 and len(top) == self.k:
+            board["top"] = self._top_of(scores)
+            return
+
+        top = [(uid, s) for uid, s in top if uid != user_id]
+        if score > 0:
+            top.append((user_id, score))
+        top.sort(key=lambda item: (-item[1], item[0]))
+        board["top"] = top[:self.k]
+
+    def get(self, guild_id: int, metric: str, period: str, when: datetime | None = None) -> list[tuple[str, int]]:
+        """
+        Returns the top-K (user_id, score) pairs of a leaderboard, best first.
+
+        Args:
+            guild_id (int): The guild.
+            metric (str): One of "pages", "finished" or "minutes".
+            period (str): One of "week", "month" or "all".
+            when (datetime, optional): A time inside the wanted period. Defaults to now.
+        """
+        key = period_key(period, when or datetime.now())
+        board = self._boards.get(guild_id, {}).get((metric, period, key))
+        return list(board["top"]) if board else []
+
+
+LEADERBOARDS = register_index(Leaderboards())
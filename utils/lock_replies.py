@@ -0,0 +1,40 @@
+import discord
+from discord import ui
+from utils.file_lock import DataLockTimeout
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+DATA_LOCKED_MESSAGE = "⏳ The reading log is being edited elsewhere right now. Please try again in a minute."
+
+
+async def reply_data_locked(interaction: discord.Interaction, error: DataLockTimeout):
+    """
+    Tells the user their interaction hit a data file locked by another process (an admin
+    tool or a second worker), whether or not the interaction was already acknowledged.
+    """
+    logger.warning(f"⏳ {error}", extra={"guild_id": interaction.guild_id})
+    if interaction.response.is_done():
+        await interaction.followup.send(DATA_LOCKED_MESSAGE, ephemeral=True)
+    else:
+        await interaction.response.send_message(DATA_LOCKED_MESSAGE, ephemeral=True)
+
+
+class DataLockModal(ui.Modal):
+    """A modal that answers a `DataLockTimeout` with a "try again" reply instead of leaving it hanging."""
+
+    async def on_error(self, interaction: discord.Interaction, error: Exception):
+        if isinstance(error, DataLockTimeout):
+            await reply_data_locked(interaction, error)
+        else:
+            await super().on_error(interaction, error)
+
+
+class DataLockView(ui.View):
+    """A view that answers a `DataLockTimeout` with a "try again" reply instead of leaving it hanging."""
+
+    async def on_error(self, interaction: discord.Interaction, error: Exception, item: ui.Item):
+        if isinstance(error, DataLockTimeout):
+            await reply_data_locked(interaction, error)
+        else:
+            await super().on_error(interaction, error, item)
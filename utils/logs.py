@@ -0,0 +1,129 @@
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from collections import Counter, deque
+from datetime import datetime, timezone
+from config import DEBUG, LOG_FILE, LOG_FILE_MAX_BYTES, LOG_FILE_BACKUPS, LOG_CHANNEL_BUFFER_SIZE
+
+ROOT_LOGGER = "booktracker"
+
+# Attributes every LogRecord has; anything else was passed through `extra=` and is logged as a field.
+_STANDARD_ATTRS = set(vars(logging.LogRecord("", 0, "", 0, "", None, None))) | {"message", "asctime", "taskName"}
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Returns a logger below the bot's root logger, e.g. `get_logger(__name__)`.
+
+    Pass context such as the guild with `extra`, e.g.
+    `logger.warning("⚠️ Summary failed", extra={"guild_id": guild_id})`; it becomes a JSON
+    field and routes channel posts to that guild's log channel.
+    """
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+class JsonFormatter(logging.Formatter):
+    """Formats a record as one JSON object per line, including `extra` fields and tracebacks."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        entry.update({key: value for key, value in vars(record).items() if key not in _STANDARD_ATTRS})
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class LogChannelBuffer(logging.Handler):
+    """
+    Collects warnings and errors for the log channel forwarder (`cogs.log_forwarder`).
+
+    Runs on the logging thread and only appends to a bounded deque; the forwarder drains it
+    from the event loop. When the buffer is full the oldest entries are dropped and counted.
+    Records logged with `extra={"log_channel": False}` are skipped (the forwarder uses this
+    for its own failures so they can't feed back into the channel).
+    """
+
+    def __init__(self, maxlen: int = LOG_CHANNEL_BUFFER_SIZE):
+        super().__init__(level=logging.WARNING)
+        self.entries: deque = deque(maxlen=maxlen)
+        self.dropped = 0
+        self._drain_lock = threading.Lock()
+
+    def emit(self, record: logging.LogRecord):
+        if getattr(record, "log_channel", True) is False:
+            return
+        if len(self.entries) == self.entries.maxlen:
+            self.dropped += 1
+        self.entries.append((getattr(record, "guild_id", None), record.levelname, record.getMessage()))
+
+    def drain(self) -> tuple[dict[int | None, Counter], int]:
+        """
+        Takes every buffered entry, de-duplicated per guild.
+
+        Returns:
+            tuple: ({guild_id: Counter({(level, message): count})}, dropped entries since last drain)
+        """
+        grouped: dict[int | None, Counter] = {}
+        with self._drain_lock:
+            while self.entries:
+                guild_id, level, message = self.entries.popleft()
+                grouped.setdefault(guild_id, Counter())[(level, message)] += 1
+            dropped, self.dropped = self.dropped, 0
+        return grouped, dropped
+
+
+LOG_CHANNEL_BUFFER = LogChannelBuffer()
+
+
+def setup_logging():
+    """
+    Installs the logging pipeline; safe to call more than once.
+
+    Loggers only put records on a queue (never blocking the event loop). A background
+    listener thread writes them as JSON lines to a rotating `LOG_FILE`, prints them to the
+    console, and buffers warnings and errors for batched posts to the log channel.
+    """
+    global _listener
+    if _listener is not None:
+        return
+
+    os.makedirs(os.path.dirname(LOG_FILE) or ".", exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_FILE_MAX_BYTES, backupCount=LOG_FILE_BACKUPS, encoding="utf-8"
+    )
+    file_handler.setFormatter(JsonFormatter())
+
+    console_handler = logging.StreamHandler()
+    console_handler.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+    console_handler.setFormatter(logging.Formatter("%(asctime)s %(levelname)-7s %(message)s", "%H:%M:%S"))
+
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    root = logging.getLogger(ROOT_LOGGER)
+    root.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.propagate = False
+
+    _listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, LOG_CHANNEL_BUFFER, respect_handler_level=True
+    )
+    _listener.start()
+    atexit.register(stop_logging)
+
+
+def stop_logging():
+    """Flushes queued records and stops the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
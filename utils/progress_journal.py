@@ -0,0 +1,129 @@
+import json
+import os
+from datetime import datetime, timedelta
+import pandas as pd
+from utils.guilds import guild_progress_path
+from utils.indexes import RowIndex, register_index
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+JOURNAL_COLUMNS: list[str] = ["Time", "UserID", "Pages", "Minutes", "Finished", "Genres"]
+JOURNAL_RETENTION_DAYS: int = 400  # Enough for the current year's rollups; older lines are skipped on load
+
+
+def _empty_journal() -> pd.DataFrame:
+    return pd.DataFrame(columns=JOURNAL_COLUMNS)
+
+
+def _progress(df: pd.DataFrame) -> tuple[pd.Series, pd.Series, pd.Series, pd.Series]:
+    genres = df["Genres"].fillna("").astype(str).str.lower()
+    is_audio = genres.str.contains("audiobook")
+    progress = pd.to_numeric(df["LastPage"], errors="coerce").fillna(0).astype(int)
+    finished = (pd.to_numeric(df["Status"], errors="coerce") == 2).astype(int)
+    return genres, is_audio, progress, finished
+
+
+def progress_deltas(removed: pd.DataFrame | None, added: pd.DataFrame | None) -> pd.DataFrame:
+    """
+    Computes the reading progress a committed mutation represents.
+
+    A row present in both `removed` and `added` (same index label) was updated: its new
+    `LastPage` minus the old one is credited to the time of the update, as pages for books
+    and minutes for audiobooks, and a change to or from Status 2 counts as a book finished
+    (or un-finished). Rows that were only added or only removed (new books, deletions, moves
+    between the hot log and the archive) contribute nothing: a book may be added already
+    half read, so its progress counts towards all-time totals only.
+
+    Args:
+        removed (pandas.DataFrame | None): Rows as they were before the mutation.
+        added (pandas.DataFrame | None): Rows as they are after the mutation.
+
+    Returns:
+        pandas.DataFrame: One row per changed book with columns `JOURNAL_COLUMNS`.
+    """
+    if removed is None or added is None or removed.empty or added.empty:
+        return _empty_journal()
+    removed = removed[~removed.index.duplicated()]
+    added = added[~added.index.duplicated()]
+    labels = removed.index.intersection(added.index)
+    if labels.empty:
+        return _empty_journal()
+
+    before, after = removed.loc[labels], added.loc[labels]
+    _, _, old_progress, old_finished = _progress(before)
+    genres, is_audio, new_progress, new_finished = _progress(after)
+    delta = new_progress - old_progress
+    deltas = pd.DataFrame({
+        "Time": pd.to_datetime(after["LastUpdated"], errors="coerce").fillna(pd.Timestamp(datetime.now())),
+        "UserID": after["UserID"].astype(str),
+        "Pages": delta.where(~is_audio, 0),
+        "Minutes": delta.where(is_audio, 0),
+        "Finished": new_finished - old_finished,
+        "Genres": genres,
+    })
+    changed = (deltas[["Pages", "Minutes", "Finished"]] != 0).any(axis=1)
+    return deltas[changed].reset_index(drop=True)
+
+
+class ProgressJournal(RowIndex):
+    """
+    Appends the progress of every commit to a per-guild JSON lines file.
+
+    The reading log only keeps each book's latest page, so it can't say when pages were read.
+    The journal records each update's delta (see `progress_deltas`) with its time, which is
+    what the weekly, monthly and yearly rollups (`utils.stats`, `utils.leaderboard`) are
+    rebuilt from. Lines are appended, so several bot processes can share a journal.
+    """
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        pass  # The journal is its own source; the rollups read it with `load`.
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        deltas = progress_deltas(removed, added)
+        if deltas.empty:
+            return
+        lines = "".join(
+            json.dumps({
+                "t": row.Time.isoformat(), "user": row.UserID, "pages": int(row.Pages),
+                "minutes": int(row.Minutes), "finished": int(row.Finished), "genres": row.Genres,
+            }) + "\n"
+            for row in deltas.itertuples(index=False)
+        )
+        path = guild_progress_path(guild_id)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+    def load(self, guild_id: int) -> pd.DataFrame:
+        """
+        Reads a guild's journal, skipping lines older than `JOURNAL_RETENTION_DAYS`.
+
+        Returns:
+            pandas.DataFrame: Columns `JOURNAL_COLUMNS`.
+        """
+        path = guild_progress_path(guild_id)
+        if not os.path.exists(path):
+            return _empty_journal()
+        cutoff = (datetime.now() - timedelta(days=JOURNAL_RETENTION_DAYS)).isoformat()
+        records = []
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    logger.warning(f"⚠️ Skipping a malformed line in `{path}`.", extra={"guild_id": guild_id})
+                    continue
+                if record["t"] >= cutoff:
+                    records.append(record)
+        if not records:
+            return _empty_journal()
+        journal = pd.DataFrame.from_records(records).rename(columns={
+            "t": "Time", "user": "UserID", "pages": "Pages", "minutes": "Minutes",
+            "finished": "Finished", "genres": "Genres",
+        })
+        journal["Time"] = pd.to_datetime(journal["Time"], errors="coerce")
+        return journal[JOURNAL_COLUMNS]
+
+
+PROGRESS_JOURNAL = register_index(ProgressJournal())
@@ -0,0 +1,103 @@
+import copy
+from collections import Counter
+from typing import Any, Awaitable, Callable
+from cachetools import LRUCache
+from config import QUERY_CACHE_SIZE
+from utils.versions import VERSIONS
+from utils.excel import read_excel_async, booknames_with_status
+from utils.archive import archived_booknames
+from utils.guilds import guild_excel_path
+
+
+class QueryCache:
+    """
+    LRU cache of per-user query results, keyed by the user's data version.
+
+    Every commit that touches a user's rows bumps their version (`utils.versions`), so a
+    cached result is only served while the user's data is unchanged; outdated entries are
+    never hit again and age out of the LRU.
+
+    Args:
+        maxsize (int): Maximum number of cached results.
+
+    Attributes:
+        hits (Counter): Cache hits per kind of query.
+        misses (Counter): Cache misses per kind of query.
+    """
+
+    def __init__(self, maxsize: int):
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self.hits: Counter = Counter()
+        self.misses: Counter = Counter()
+
+    async def get_or_compute(
+        self,
+        kind: str,
+        guild_id: int,
+        user_id: str,
+        compute: Callable[[], Awaitable[Any]],
+        *extra
+    ) -> Any:
+        """
+        Returns a cached result of a user's query, computing it on a miss.
+
+        Args:
+            kind (str): The query, e.g. "shelved_titles".
+            guild_id (int): The guild.
+            user_id (str): The user whose rows the result is derived from.
+            compute (Callable): Coroutine function producing the result.
+            *extra: Other inputs the result depends on (e.g. the current date).
+
+        Returns:
+            A shallow copy of the result, so callers may modify it freely.
+        """
+        key = (kind, guild_id, str(user_id), VERSIONS.get(guild_id, user_id), *extra)
+        result = self._cache.get(key)
+        if result is None:
+            self.misses[kind] += 1
+            result = await compute()
+            self._cache[key] = result
+        else:
+            self.hits[kind] += 1
+        return copy.copy(result)
+
+    def stats(self) -> dict[str, dict]:
+        """Returns {kind: {"hits", "misses", "hit_rate"}} for every kind of query seen."""
+        return {
+            kind: {
+                "hits": self.hits[kind],
+                "misses": self.misses[kind],
+                "hit_rate": round(self.hits[kind] / (self.hits[kind] + self.misses[kind]), 4),
+            }
+            for kind in sorted(set(self.hits) | set(self.misses))
+        }
+
+
+QUERY_CACHE = QueryCache(QUERY_CACHE_SIZE)
+
+
+async def cached_booknames(guild_id: int, user_id: str, status: int, include_archived: bool = False) -> list[str]:
+    """
+    Returns the names of a user's books with the given status, from the cache when possible.
+
+    Args:
+        guild_id (int): The guild.
+        user_id (str): The user.
+        status (int): 0 (Shelved), 1 (Reading) or 2 (Completed).
+        include_archived (bool, optional): Also list matching books from the archive (cold tier),
+            after the ones in the reading log.
+
+    Returns:
+        list[str]: The book names, least recently updated first.
+
+    Raises:
+        Any exception raised while reading the log (errors are never cached).
+    """
+    async def compute() -> list[str]:
+        books = booknames_with_status(await read_excel_async(guild_excel_path(guild_id)), user_id, status)
+        if include_archived:
+            books += [book for book in archived_booknames(guild_id, user_id, status) if book not in books]
+        return books
+
+    kind = f"titles:{status}" + (":archived" if include_archived else "")
+    return await QUERY_CACHE.get_or_compute(kind, guild_id, user_id, compute)
@@ -0,0 +1,81 @@
+import pandas as pd
+from utils.book_index import BOOKS, BookKey
+from utils.search_index import SEARCH
+
+# When a user has a book more than once (book and audiobook), the most active status is shown.
+_STATUS_PRIORITY = {1: 0, 2: 1, 0: 2}
+_STATUS_LABELS = [(1, "📖", "reading"), (2, "🏆", "finished"), (0, "📦", "shelved")]
+
+
+def format_readers(readers: dict[str, int], limit: int = 10) -> str:
+    """
+    Renders readers grouped by status, e.g. "📖 <@1>, <@2> reading · 🏆 <@3> finished".
+
+    Args:
+        readers (dict[str, int]): {user ID: status} as returned by `BookReaders.get`.
+        limit (int, optional): Mentions shown per status before summarizing as "+N".
+
+    Returns:
+        str: The rendered line, or an empty string if there are no readers.
+    """
+    parts = []
+    for status, icon, label in _STATUS_LABELS:
+        user_ids = sorted(user_id for user_id, value in readers.items() if value == status)
+        if not user_ids:
+            continue
+        mentions = ", ".join(f"<@{user_id}>" for user_id in user_ids[:limit])
+        if len(user_ids) > limit:
+            mentions += f" +{len(user_ids) - limit}"
+        parts.append(f"{icon} {mentions} {label}")
+    return " · ".join(parts)
+
+
+class BookReaders:
+    """
+    Answers "who else logged this book" from the search and book indexes.
+
+    The search index already groups every row (archived ones included) by book, and the book
+    index holds each row's current values, so readers are found without a third per-row
+    index. Statuses come from the book index, where a row in the reading log wins over an
+    archived copy of the same book.
+    """
+
+    def get(self, guild_id: int, title: str, author: str | None = None, exclude: str | None = None) -> dict[str, int]:
+        """
+        Returns who logged a book and with which status.
+
+        Args:
+            guild_id (int): The guild.
+            title (str): The book's title, in any spelling `normalize_title` maps together.
+            author (str | None, optional): The author, to tell apart different books with the
+                same title. If omitted, or nobody logged the book with this author (authors are
+                often typed differently), every book with the title counts.
+            exclude (str | None, optional): A user ID to leave out, e.g. the one asking.
+
+        Returns:
+            dict[str, int]: {user ID: status}, e.g. {"123": 1, "456": 2}.
+        """
+        if author:
+            readers = self._merge(guild_id, SEARCH.work_rows(guild_id, title, author), exclude)
+            if readers:
+                return readers
+        return self._merge(guild_id, SEARCH.work_rows(guild_id, title), exclude)
+
+    @staticmethod
+    def _merge(guild_id: int, matches: list[list[BookKey]], exclude: str | None) -> dict[str, int]:
+        readers: dict[str, int] = {}
+        for rows in matches:
+            for user_id, title, is_audio in rows:
+                if user_id == exclude:
+                    continue
+                entry = BOOKS.entry(guild_id, user_id, title, is_audio)
+                value = pd.to_numeric(entry.status, errors="coerce") if entry else None
+                if value is None or pd.isna(value):
+                    continue
+                value, current = int(value), readers.get(user_id)
+                if current is None or _STATUS_PRIORITY.get(value, 3) < _STATUS_PRIORITY.get(current, 3):
+                    readers[user_id] = value
+        return readers
+
+
+READERS = BookReaders()
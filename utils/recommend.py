@@ -0,0 +1,194 @@
+import asyncio
+import heapq
+from collections import Counter
+import numpy as np
+import pandas as pd
+from utils.indexes import RowIndex, register_index
+from utils.text import normalize_title
+
+Work = tuple[str, str]  # (normalized title, normalized author)
+
+COOCCURRENCE_WEIGHT = 0.5  # How much related genres count towards a reader's taste
+SIMILAR_READERS = 20  # Most similar readers whose finished books are considered
+
+
+def split_genres(genres) -> list[str]:
+    """Returns the taste genres of a row's genre list ("audiobook" is a format, not a taste)."""
+    if not isinstance(genres, str):
+        return []
+    return sorted({g.strip().lower() for g in genres.split(",") if g.strip() and g.strip().lower() != "audiobook"})
+
+
+class _GuildTaste:
+    """The taste matrices and finished books of one guild."""
+
+    def __init__(self):
+        self.users: dict[str, int] = {}
+        self.genres: dict[str, int] = {}
+        self.counts = np.zeros((16, 16), dtype=np.int32)  # users × genres, grown as needed
+        self.cooccurrence = np.zeros((16, 16), dtype=np.int32)  # genres × genres
+        self.finished: dict[str, Counter] = {}  # user -> Counter of finished works
+        self.logged: dict[str, Counter] = {}  # user -> Counter of normalized titles
+        self.display: dict[Work, tuple[str, str]] = {}
+        self.profiles: np.ndarray | None = None  # Unit-length smoothed taste vectors
+        self.profile_users: list[str] = []
+        self.dirty = True
+        self.changes = 0  # Adjustments so far, to tell whether a refresh saw the latest ones
+
+    def user_row(self, user_id: str) -> int:
+        if user_id not in self.users:
+            self.users[user_id] = len(self.users)
+            if len(self.users) > self.counts.shape[0]:
+                self.counts = np.vstack([self.counts, np.zeros_like(self.counts)])
+        return self.users[user_id]
+
+    def genre_column(self, genre: str) -> int:
+        if genre not in self.genres:
+            self.genres[genre] = len(self.genres)
+            size = self.counts.shape[1]
+            if len(self.genres) > size:
+                self.counts = np.hstack([self.counts, np.zeros_like(self.counts)])
+                grown = np.zeros((size * 2, size * 2), dtype=np.int32)
+                grown[:size, :size] = self.cooccurrence
+                self.cooccurrence = grown
+        return self.genres[genre]
+
+
+def _smoothing(cooccurrence: np.ndarray) -> np.ndarray:
+    """Returns I + w·P, where P spreads each genre over the genres it is listed with."""
+    totals = cooccurrence.sum(axis=1, keepdims=True)
+    spread = np.divide(cooccurrence, totals, out=np.zeros(cooccurrence.shape), where=totals > 0)
+    return np.eye(len(cooccurrence)) + COOCCURRENCE_WEIGHT * spread
+
+
+def _unit_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros(matrix.shape), where=norms > 0)
+
+
+def _compute_profiles(counts: np.ndarray, cooccurrence: np.ndarray) -> np.ndarray:
+    return _unit_rows(counts @ _smoothing(cooccurrence))
+
+
+class Recommender(RowIndex):
+    """
+    Genre-based taste model for book and reader recommendations.
+
+    For every guild it keeps a users × genres matrix (how many logged books of each genre a
+    user has) and a genres × genres co-occurrence matrix (how often two genres are listed on
+    the same book), both adjusted in place on every commit. A reader's taste profile is
+    their genre counts smoothed over related genres and scaled to unit length, so cosine
+    similarity between readers is a single matrix-vector product.
+
+    The profiles of all readers are recomputed by `refresh_async` in a worker thread (see
+    `cogs.recommend`), never while answering a command; only the asking user's own profile
+    is computed on the spot, so their latest books always count.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildTaste] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._guilds[guild_id] = _GuildTaste()
+        self._adjust(guild_id, df, 1)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        self._adjust(guild_id, removed, -1)
+        self._adjust(guild_id, added, 1)
+
+    def _adjust(self, guild_id: int, df: pd.DataFrame, sign: int):
+        if df.empty:
+            return
+        taste = self._guilds.setdefault(guild_id, _GuildTaste())
+        status = pd.to_numeric(df["Status"], errors="coerce")
+        for user_id, name, author, genres, value in zip(df["UserID"], df["BookName"], df["Author"], df["Genres"], status):
+            user_id = str(user_id)
+            title = normalize_title(name)
+            if not title:
+                continue
+            columns = [taste.genre_column(genre) for genre in split_genres(genres)]
+            row = taste.user_row(user_id)
+            if columns:
+                taste.counts[row, columns] += sign
+                taste.cooccurrence[np.ix_(columns, columns)] += sign
+                taste.cooccurrence[columns, columns] -= sign  # A genre doesn't co-occur with itself
+            taste.logged.setdefault(user_id, Counter())[title] += sign
+            if value == 2:
+                work = (title, normalize_title(author))
+                taste.finished.setdefault(user_id, Counter())[work] += sign
+                if sign > 0:
+                    taste.display.setdefault(work, (str(name), str(author) if isinstance(author, str) else ""))
+        taste.dirty = True
+        taste.changes += 1
+
+    async def refresh_async(self, guild_id: int) -> bool:
+        """
+        Recomputes every reader's taste profile of a guild in a worker thread, if anything changed.
+
+        Returns:
+            bool: True if the profiles were recomputed.
+        """
+        taste = self._guilds.get(guild_id)
+        if taste is None or not taste.dirty:
+            return False
+        # Copy on the event loop, so commits can keep adjusting the live matrices meanwhile.
+        changes = taste.changes
+        users = list(taste.users)
+        counts = taste.counts[:len(users), :len(taste.genres)].copy()
+        cooccurrence = taste.cooccurrence[:len(taste.genres), :len(taste.genres)].copy()
+        profiles = await asyncio.to_thread(_compute_profiles, counts, cooccurrence)
+        taste.profiles, taste.profile_users = profiles, users
+        # Cleared only now: if the computation failed, or a commit came in meanwhile, the next refresh runs again.
+        if taste.changes == changes:
+            taste.dirty = False
+        return True
+
+    def recommend(self, guild_id: int, user_id: str, limit: int = 5) -> tuple[list, list] | None:
+        """
+        Suggests books finished by readers with a similar taste, and those readers.
+
+        Args:
+            guild_id (int): The guild.
+            user_id (str): The reader asking.
+            limit (int, optional): Maximum books and readers returned. Defaults to 5.
+
+        Returns:
+            tuple | None: (books, readers) where books are (title, author, score) and readers
+                are (user ID, similarity) tuples, best first; None while the profiles of the
+                guild have not been computed yet.
+        """
+        taste = self._guilds.get(guild_id)
+        if taste is None or taste.profiles is None:
+            return None
+        user_id = str(user_id)
+        if user_id not in taste.users or not len(taste.profile_users):
+            return [], []
+
+        genres = taste.profiles.shape[1]
+        own = taste.counts[taste.users[user_id], :genres].astype(float)
+        query = _unit_rows((own @ _smoothing(taste.cooccurrence[:genres, :genres]))[None, :])[0]
+        similarities = taste.profiles @ query
+
+        candidates = min(SIMILAR_READERS + 1, len(similarities))
+        best = np.argpartition(-similarities, candidates - 1)[:candidates]
+        similar = sorted(
+            ((taste.profile_users[i], float(similarities[i])) for i in best
+             if similarities[i] > 0 and taste.profile_users[i] != user_id),
+            key=lambda pair: pair[1],
+            reverse=True
+        )[:SIMILAR_READERS]
+
+        logged = taste.logged.get(user_id, Counter())
+        scores: Counter = Counter()
+        for other, similarity in similar:
+            for work, count in taste.finished.get(other, Counter()).items():
+                if count > 0 and logged[work[0]] <= 0:
+                    scores[work] += similarity
+        books = [
+            (*taste.display.get(work, work), round(score, 3))
+            for work, score in heapq.nlargest(limit, scores.items(), key=lambda item: item[1])
+        ]
+        return books, [(other, round(similarity, 3)) for other, similarity in similar[:limit]]
+
+
+RECOMMENDER = register_index(Recommender())
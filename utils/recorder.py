@@ -0,0 +1,132 @@
+import json
+import os
+import discord
+from utils.guilds import log_channel_id, summary_channel_id
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+RECORDING_VERSION = 1
+
+
+def _options(options: list[dict]) -> list[dict]:
+    """Keeps the name, type and value of command options (nested for subcommands)."""
+    kept = []
+    for option in options or []:
+        entry = {"name": option["name"], "type": option["type"]}
+        if "options" in option:
+            entry["options"] = _options(option["options"])
+        if "value" in option:
+            entry["value"] = option["value"]
+        kept.append(entry)
+    return kept
+
+
+def _modal_fields(rows: list[dict]) -> list[str]:
+    """Returns the submitted text of every modal field, in the order the modal lists them."""
+    fields = []
+    for row in rows or []:
+        for component in row.get("components") or [row.get("component") or {}]:
+            if "value" in component:
+                fields.append(component["value"])
+    return fields
+
+
+def _component_position(message: discord.Message | None, custom_id: str) -> dict | None:
+    """Locates a clicked component in its message by row and index (custom IDs differ between runs)."""
+    if message is None:
+        return None
+    for row_index, row in enumerate(message.components):
+        for index, component in enumerate(getattr(row, "children", [])):
+            if getattr(component, "custom_id", None) == custom_id:
+                return {"row": row_index, "index": index, "label": getattr(component, "label", None)}
+    return None
+
+
+def sanitize_interaction(interaction: discord.Interaction) -> dict | None:
+    """
+    Reduces an interaction to what is needed to replay it.
+
+    Tokens, names, avatars, resolved objects and attachment URLs are dropped. Only the
+    user, guild and channel IDs, the command and its options, the values picked in a
+    component and the text typed into a modal are kept.
+
+    Returns:
+        dict | None: The record, or None for interactions that aren't replayed (autocomplete, pings).
+    """
+    data = interaction.data or {}
+    permissions = getattr(interaction.user, "guild_permissions", None)
+    record = {
+        "t": interaction.created_at.timestamp(),
+        "user": str(interaction.user.id),
+        "admin": bool(permissions and permissions.administrator),
+        "guild": str(interaction.guild_id),
+        "channel": str(interaction.channel_id),
+    }
+    if interaction.type == discord.InteractionType.application_command:
+        record.update(kind="command", name=data.get("name"), options=_options(data.get("options")))
+    elif interaction.type == discord.InteractionType.component:
+        record.update(
+            kind="component",
+            component_type=data.get("component_type"),
+            values=list(data.get("values") or []),
+            position=_component_position(interaction.message, data.get("custom_id")),
+        )
+    elif interaction.type == discord.InteractionType.modal_submit:
+        record.update(kind="modal", fields=_modal_fields(data.get("components")))
+    else:
+        return None
+    return record
+
+
+class InteractionRecorder:
+    """
+    Appends sanitized interactions to a JSON lines file, for `loadtest.replay`.
+
+    The first line of a recording is a header with the channel configuration of the
+    recorded guilds; every following line is one interaction (see `sanitize_interaction`).
+
+    Args:
+        path (str): The recording file; appended to if it exists.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.recorded = 0
+        self._file = None
+
+    def open(self, guild_ids: list[int]):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        new_file = not os.path.exists(self.path) or os.path.getsize(self.path) == 0
+        self._file = open(self.path, "a", encoding="utf-8", buffering=1)  # Line buffered
+        if new_file:
+            self._write({
+                "kind": "header",
+                "version": RECORDING_VERSION,
+                "guilds": {
+                    str(guild_id): {
+                        "log_channel_id": str(log_channel_id(guild_id)),
+                        "summary_channel_id": str(summary_channel_id(guild_id)),
+                    }
+                    for guild_id in guild_ids
+                },
+            })
+
+    def _write(self, record: dict):
+        self._file.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+
+    def record(self, interaction: discord.Interaction):
+        if self._file is None:
+            return
+        try:
+            record = sanitize_interaction(interaction)
+            if record is not None:
+                self._write(record)
+                self.recorded += 1
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to record an interaction: {e}", extra={"guild_id": interaction.guild_id})
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,45 @@
+from io import BytesIO
+import pandas as pd
+from utils.excel import read_excel_readonly
+from utils.jobs import JobContext
+
+EXPORT_CHUNK_ROWS = 5000  # Rows written between progress reports (and cancellation checks)
+
+
+def export_log(ctx: JobContext, paths: list[str], user_id: str | None = None) -> bytes | None:
+    """
+    Builds an xlsx export of the reading log from its data files (runs in a report worker).
+
+    Args:
+        ctx (JobContext): Progress reporting and cancellation.
+        paths (list[str]): The data files to export, e.g. the hot log and its archive.
+        user_id (str | None, optional): Only export this user's rows.
+
+    Returns:
+        bytes | None: The workbook, or None if there are no rows to export.
+    """
+    frames = []
+    for i, path in enumerate(paths):
+        ctx.progress(0.2 * i / len(paths), "loading the log")
+        df = read_excel_readonly(path)
+        if user_id is not None:
+            df = df[df["UserID"].astype(str) == str(user_id)]
+        if not df.empty:
+            frames.append(df)
+    if not frames:
+        return None
+    df = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+
+    buffer = BytesIO()
+    with pd.ExcelWriter(buffer, engine="openpyxl") as writer:
+        for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+            end = min(start + EXPORT_CHUNK_ROWS, len(df))
+            ctx.progress(0.2 + 0.75 * start / len(df), f"writing rows {start + 1}-{end} of {len(df)}")
+            df.iloc[start:end].to_excel(
+                writer,
+                index=False,
+                header=start == 0,
+                startrow=0 if start == 0 else start + 1
+            )
+    ctx.progress(1.0, "uploading")
+    return buffer.getvalue()
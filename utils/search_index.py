@@ -0,0 +1,205 @@
+import heapq
+from bisect import bisect_left, insort
+import pandas as pd
+from utils.book_index import BookKey, book_key
+from utils.indexes import RowIndex, register_index
+from utils.text import normalize_title
+
+Work = tuple[str, str]  # (normalized title, normalized author)
+SearchResult = tuple[str, str, list[BookKey]]  # (title, author, sorted rows of everyone who logged it)
+
+MAX_PREFIX_TOKENS = 64  # Vocabulary tokens a partially typed last word may expand to
+
+
+class _GuildPostings:
+    """The search structures of one guild."""
+
+    def __init__(self):
+        self.row_works: dict[BookKey, Work] = {}
+        self.work_rows: dict[Work, list[BookKey]] = {}  # Kept sorted, so results need no sorting
+        self.popularity: dict[Work, int] = {}
+        self.display: dict[Work, tuple[str, str]] = {}
+        self.text: dict[Work, str] = {}  # " title author", for matching a partial last word
+        self.postings: dict[str, set[Work]] = {}
+        self.vocabulary: list[str] = []  # Sorted tokens, for prefix matches
+        self.titles: dict[str, set[Work]] = {}
+        self.sorted_titles: list[str] = []  # Sorted normalized titles, for "starts with" matches
+
+
+def _tokens(work: Work) -> set[str]:
+    return set(work[0].split()) | set(work[1].split())
+
+
+def _sorted_range(values: list[str], prefix: str, limit: int) -> list[str]:
+    start = bisect_left(values, prefix)
+    matches = []
+    for value in values[start:start + limit]:
+        if not value.startswith(prefix):
+            break
+        matches.append(value)
+    return matches
+
+
+def _sorted_remove(values: list, value):
+    position = bisect_left(values, value)
+    if position < len(values) and values[position] == value:
+        del values[position]
+
+
+class SearchIndex(RowIndex):
+    """
+    Inverted index from normalized title and author tokens to the books of a guild.
+
+    Rows are grouped into works (same normalized title and author), and every token of a
+    work's title and author maps to the work. A query matches the works containing all of
+    its words, the last word also matching as a prefix so results update while typing.
+    Results rank exact title matches first, then titles starting with the query, then the
+    works with the most readers. Only the words of the query are looked up, so the cost
+    depends on how many books match, not on the size of the log.
+    """
+
+    def __init__(self):
+        self._guilds: dict[int, _GuildPostings] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._guilds[guild_id] = _GuildPostings()
+        self._add_rows(guild_id, df)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        guild = self._guilds.setdefault(guild_id, _GuildPostings())
+        if not removed.empty:
+            is_audio = removed["Genres"].str.contains("audiobook", na=False)
+            for user_id, name, audio in zip(removed["UserID"], removed["BookName"], is_audio):
+                self._remove(guild, book_key(user_id, name, audio))
+        self._add_rows(guild_id, added)
+
+    def _add_rows(self, guild_id: int, df: pd.DataFrame):
+        guild = self._guilds.setdefault(guild_id, _GuildPostings())
+        if df.empty:
+            return
+        is_audio = df["Genres"].str.contains("audiobook", na=False)
+        for user_id, name, author, audio in zip(df["UserID"], df["BookName"], df["Author"], is_audio):
+            self._add(guild, book_key(user_id, name, audio), name, author)
+
+    def _add(self, guild: _GuildPostings, key: BookKey, title, author):
+        self._remove(guild, key)
+        work = (normalize_title(title), normalize_title(author))
+        if not work[0]:
+            return
+        guild.row_works[key] = work
+        rows = guild.work_rows.get(work)
+        if rows is None:
+            rows = guild.work_rows[work] = []
+            guild.display[work] = (str(title), str(author) if isinstance(author, str) else "")
+            guild.text[work] = f" {work[0]} {work[1]}"
+            for token in _tokens(work):
+                if token not in guild.postings:
+                    guild.postings[token] = set()
+                    insort(guild.vocabulary, token)
+                guild.postings[token].add(work)
+            if work[0] not in guild.titles:
+                guild.titles[work[0]] = set()
+                insort(guild.sorted_titles, work[0])
+            guild.titles[work[0]].add(work)
+        insort(rows, key)
+        guild.popularity[work] = len(rows)
+
+    def _remove(self, guild: _GuildPostings, key: BookKey):
+        work = guild.row_works.pop(key, None)
+        if work is None:
+            return
+        rows = guild.work_rows[work]
+        _sorted_remove(rows, key)
+        guild.popularity[work] = len(rows)
+        if rows:
+            return
+
+        del guild.work_rows[work], guild.popularity[work], guild.display[work], guild.text[work]
+        for token in _tokens(work):
+            posting = guild.postings[token]
+            posting.discard(work)
+            if not posting:
+                del guild.postings[token]
+                _sorted_remove(guild.vocabulary, token)
+        same_title = guild.titles[work[0]]
+        same_title.discard(work)
+        if not same_title:
+            del guild.titles[work[0]]
+            _sorted_remove(guild.sorted_titles, work[0])
+
+    def search(self, guild_id: int, query: str, limit: int = 10) -> list[SearchResult]:
+        """
+        Finds the books whose title or author contain every word of the query.
+
+        Args:
+            guild_id (int): The guild.
+            query (str): Words of the title and/or author; the last one may be partial.
+            limit (int, optional): Maximum number of results. Defaults to 10.
+
+        Returns:
+            list: (title, author, row keys) per matching book, best match first. The row keys
+                (see `utils.book_index.book_key`) identify every reader's entry of the book,
+                sorted; the list is the index's own, so slice it rather than changing it.
+        """
+        guild = self._guilds.get(guild_id)
+        normalized = normalize_title(query)
+        if guild is None or not normalized:
+            return []
+
+        *words, prefix = normalized.split()
+        postings = []
+        for word in words:
+            posting = guild.postings.get(word)
+            if not posting:
+                return []
+            postings.append(posting)
+
+        if postings:
+            postings.sort(key=len)
+            candidates = postings[0].intersection(*postings[1:])
+            needle = f" {prefix}"
+            candidates = {work for work in candidates if needle in guild.text[work]}
+        else:
+            expansions = _sorted_range(guild.vocabulary, prefix, MAX_PREFIX_TOKENS)
+            candidates = set().union(*(guild.postings[token] for token in expansions))
+        if not candidates:
+            return []
+
+        ranked = sorted(guild.titles.get(normalized, ()), key=guild.popularity.__getitem__, reverse=True)
+        for title in _sorted_range(guild.sorted_titles, normalized, limit + 1):
+            if len(ranked) >= limit:
+                break
+            if title != normalized:
+                ranked.extend(sorted(guild.titles[title], key=guild.popularity.__getitem__, reverse=True))
+        ranked = [work for work in ranked if work in candidates][:limit]
+        if len(ranked) < limit:
+            seen = set(ranked)
+            best = heapq.nlargest(limit + len(seen), candidates, key=guild.popularity.__getitem__)
+            ranked.extend(work for work in best if work not in seen)
+
+        return [(*guild.display[work], guild.work_rows[work]) for work in ranked[:limit]]
+
+
+    def work_rows(self, guild_id: int, title: str, author: str | None = None) -> list[list[BookKey]]:
+        """
+        Returns the row keys of every reader's entry of a book, grouped by work.
+
+        Args:
+            guild_id (int): The guild.
+            title (str): The book's title, in any spelling `normalize_title` maps together.
+            author (str | None, optional): Only the work with this author; otherwise every
+                work with the title.
+
+        Returns:
+            list[list[BookKey]]: The sorted row keys of each matching work (empty if none match).
+        """
+        guild = self._guilds.get(guild_id)
+        if guild is None:
+            return []
+        title_key = normalize_title(title)
+        if author is not None:
+            rows = guild.work_rows.get((title_key, normalize_title(author)))
+            return [rows] if rows else []
+        return [guild.work_rows[work] for work in guild.titles.get(title_key, ())]
+
+SEARCH = register_index(SearchIndex())
@@ -0,0 +1,137 @@
+import os
+import pandas as pd
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.feather as feather
+except ImportError:
+    pa = None
+    feather = None
+
+SNAPSHOT_SUFFIX = ".arrow"
+SOURCE_MTIME_KEY = b"source_mtime_ns"
+SOURCE_SIZE_KEY = b"source_size"
+# Columns with many repeats (popular books, prolific readers) are stored as dictionaries in the snapshot.
+DICTIONARY_COLUMNS = ("UserID", "UserName", "BookName", "Author", "Genres")
+
+# Memory-mapped snapshot tables, keyed by snapshot path.
+# Each entry is (snapshot_mtime_ns, pyarrow.Table) so a rewritten snapshot is re-mapped.
+_mapped_tables: dict[str, tuple[int, "pa.Table"]] = {}
+
+
+def snapshot_path_for(excel_path: str) -> str:
+    """Returns the Arrow snapshot path that sits next to the given Excel file."""
+    return os.path.splitext(excel_path)[0] + SNAPSHOT_SUFFIX
+
+
+def snapshots_enabled() -> bool:
+    """Returns True if pyarrow is installed and snapshots can be used."""
+    return feather is not None
+
+
+def _source_stamp(excel_path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(excel_path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def write_snapshot(df: pd.DataFrame, excel_path: str) -> bool:
+    """
+    Writes an uncompressed Arrow IPC (Feather v2) snapshot of the DataFrame next to the Excel file.
+
+    Repetitive text columns (`DICTIONARY_COLUMNS`) are dictionary-encoded, so each distinct
+    title, author or genre list is stored once.
+
+    The snapshot records the mtime and size of the Excel file it mirrors, so a later
+    load can tell whether the workbook was changed behind its back. The file is written
+    to a temporary path first and then renamed, so readers never map a half-written file.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame that was just written to the Excel file.
+        excel_path (str): Path of the Excel file the snapshot mirrors.
+
+    Returns:
+        bool: True if the snapshot was written, False if snapshots are unavailable or failed.
+    """
+    if not snapshots_enabled():
+        return False
+    stamp = _source_stamp(excel_path)
+    if stamp is None:
+        return False
+
+    path = snapshot_path_for(excel_path)
+    tmp_path = path + ".tmp"
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        for name in DICTIONARY_COLUMNS:
+            position = table.schema.get_field_index(name)
+            if position >= 0 and pa.types.is_string(table.schema.field(position).type):
+                table = table.set_column(position, name, table.column(position).dictionary_encode())
+        metadata = dict(table.schema.metadata or {})
+        metadata[SOURCE_MTIME_KEY] = str(stamp[0]).encode()
+        metadata[SOURCE_SIZE_KEY] = str(stamp[1]).encode()
+        table = table.replace_schema_metadata(metadata)
+        # Memory-mapping only avoids copies for uncompressed buffers.
+        feather.write_feather(table, tmp_path, compression="uncompressed")
+        os.replace(tmp_path, path)
+        _mapped_tables.pop(path, None)
+        return True
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to write snapshot {path}: {e}")
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        return False
+
+
+def load_snapshot(excel_path: str) -> pd.DataFrame | None:
+    """
+    Loads the memory-mapped Arrow snapshot for the given Excel file.
+
+    Args:
+        excel_path (str): Path of the Excel file the snapshot mirrors.
+
+    Returns:
+        pandas.DataFrame | None: The snapshot contents, or None if the snapshot is missing,
+        unreadable or stale (the Excel file was modified after the snapshot was written).
+    """
+    if not snapshots_enabled():
+        return None
+    stamp = _source_stamp(excel_path)
+    if stamp is None:
+        return None
+
+    path = snapshot_path_for(excel_path)
+    try:
+        snapshot_mtime = os.stat(path).st_mtime_ns
+        cached = _mapped_tables.get(path)
+        if cached and cached[0] == snapshot_mtime:
+            table = cached[1]
+        else:
+            table = feather.read_table(path, memory_map=True)
+            _mapped_tables[path] = (snapshot_mtime, table)
+
+        metadata = table.schema.metadata or {}
+        if (
+            metadata.get(SOURCE_MTIME_KEY) != str(stamp[0]).encode()
+            or metadata.get(SOURCE_SIZE_KEY) != str(stamp[1]).encode()
+        ):
+            logger.debug(f"🟡 Snapshot {path} is stale, rebuilding from {excel_path}.")
+            return None
+        df = table.to_pandas()
+        for name in DICTIONARY_COLUMNS:
+            if name in df and isinstance(df[name].dtype, pd.CategoricalDtype):
+                # Back to plain strings (callers assign new values), still one object per distinct value.
+                df[name] = df[name].astype(object)
+        return df
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Failed to load snapshot {path}: {e}")
+        _mapped_tables.pop(path, None)
+        return None
+
@@ -0,0 +1,165 @@
+from collections import Counter
+from datetime import datetime
+import pandas as pd
+from utils.indexes import RowIndex, register_index
+from utils.progress_journal import PROGRESS_JOURNAL, progress_deltas
+
+PERIODS: dict[str, str] = {"week": "%G-W%V", "month": "%Y-%m", "year": "%Y"}
+ALL_TIME = "all"
+
+
+def period_key(period: str, when: datetime) -> str:
+    """
+    Returns the rollup bucket a timestamp falls into for the given period.
+
+    Args:
+        period (str): One of "week", "month", "year" or "all".
+        when (datetime): The timestamp to bucket.
+
+    Returns:
+        str: The bucket key, e.g. "2025-W27", "2025-07", "2025" or "all".
+    """
+    if period == ALL_TIME:
+        return ALL_TIME
+    return when.strftime(PERIODS[period])
+
+
+_TOTAL_COLUMNS = ["UserID", "Period", "Key", "Pages", "Minutes", "Finished"]
+_GENRE_COLUMNS = ["UserID", "Period", "Key", "Genre", "Count"]
+
+
+def _contributions(base: pd.DataFrame, buckets: list[tuple[str, pd.Series]]) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Sums `base` (columns UserID, Pages, Minutes, Finished, Genres) per user and bucket.
+
+    Args:
+        base (pandas.DataFrame): One row per contribution.
+        buckets (list): (period, keys) pairs, where keys holds each row's bucket key for that
+            period (rows with a missing key are left out of that period).
+    """
+    if base.empty:
+        return pd.DataFrame(columns=_TOTAL_COLUMNS), pd.DataFrame(columns=_GENRE_COLUMNS)
+
+    frames = [base[keys.notna()].assign(Period=period, Key=keys[keys.notna()]) for period, keys in buckets]
+    stacked = pd.concat(frames, ignore_index=True)
+    totals = stacked.groupby(["UserID", "Period", "Key"], as_index=False)[["Pages", "Minutes", "Finished"]].sum()
+
+    exploded = stacked[["UserID", "Period", "Key", "Genres"]].assign(
+        Genre=stacked["Genres"].str.split(",")
+    ).explode("Genre")
+    exploded["Genre"] = exploded["Genre"].str.strip()
+    exploded = exploded[(exploded["Genre"] != "") & (exploded["Genre"] != "audiobook")]
+    genre_counts = exploded.groupby(["UserID", "Period", "Key", "Genre"]).size().reset_index(name="Count")
+
+    return totals, genre_counts
+
+
+def row_contributions(df: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Computes what rows of the reading log contribute to the all-time rollups, in one vectorized pass.
+
+    Books count their `LastPage` as pages read, audiobooks count it as minutes listened,
+    and finished rows (Status 2) count as one finished book.
+
+    Args:
+        df (pandas.DataFrame): Rows of the reading log.
+
+    Returns:
+        tuple: (totals, genres)
+            totals: Columns UserID, Period, Key, Pages, Minutes, Finished.
+            genres: Columns UserID, Period, Key, Genre, Count (audiobook excluded).
+    """
+    if df.empty:
+        return _contributions(pd.DataFrame(), [])
+    genres = df["Genres"].fillna("").astype(str).str.lower()
+    is_audio = genres.str.contains("audiobook")
+    progress = pd.to_numeric(df["LastPage"], errors="coerce").fillna(0).astype(int)
+    base = pd.DataFrame({
+        "UserID": df["UserID"].astype(str),
+        "Pages": progress.where(~is_audio, 0),
+        "Minutes": progress.where(is_audio, 0),
+        "Finished": (pd.to_numeric(df["Status"], errors="coerce") == 2).astype(int),
+        "Genres": genres,
+    })
+    return _contributions(base, [(ALL_TIME, pd.Series(ALL_TIME, index=base.index))])
+
+
+def progress_contributions(journal: pd.DataFrame) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Computes what progress journal entries (see `utils.progress_journal`) contribute to the
+    week, month and year rollups: each entry counts in the buckets of the time it was logged.
+
+    Args:
+        journal (pandas.DataFrame): Entries with columns Time, UserID, Pages, Minutes, Finished, Genres.
+
+    Returns:
+        tuple: (totals, genres), shaped like `row_contributions`.
+    """
+    if journal.empty:
+        return _contributions(pd.DataFrame(), [])
+    base = journal.reset_index(drop=True)
+    times = pd.to_datetime(base["Time"], errors="coerce")
+    base = base[["UserID", "Pages", "Minutes", "Finished"]].assign(Genres=base["Genres"].fillna("").astype(str))
+    return _contributions(base, [(period, times.dt.strftime(fmt)) for period, fmt in PERIODS.items()])
+
+
+class StatsRollups(RowIndex):
+    """
+    Per-user reading totals by week, month, year and all time, kept up to date on every commit.
+
+    All-time totals come from the reading log itself. Weekly, monthly and yearly totals count
+    the progress logged in that period (see `utils.progress_journal`), so finishing a long book
+    only credits the pages read since its previous update, not its whole length.
+
+    Rollups are stored per guild as `{(user_id, period, key): {"pages", "minutes", "finished", "genres"}}`,
+    so answering `/stats` is a single dictionary lookup regardless of how long the log is.
+    """
+
+    def __init__(self):
+        self._rollups: dict[int, dict[tuple[str, str, str], dict]] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._rollups[guild_id] = {}
+        self._merge(guild_id, row_contributions(df), 1)
+        self._merge(guild_id, progress_contributions(PROGRESS_JOURNAL.load(guild_id)), 1)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        if not removed.empty:
+            self._merge(guild_id, row_contributions(removed), -1)
+        if not added.empty:
+            self._merge(guild_id, row_contributions(added), 1)
+        self._merge(guild_id, progress_contributions(progress_deltas(removed, added)), 1)
+
+    def _merge(self, guild_id: int, contributions: tuple[pd.DataFrame, pd.DataFrame], sign: int):
+        rollups = self._rollups.setdefault(guild_id, {})
+        totals, genre_counts = contributions
+
+        for row in totals.itertuples(index=False):
+            bucket = rollups.setdefault((row.UserID, row.Period, row.Key), _empty_bucket())
+            bucket["pages"] += sign * int(row.Pages)
+            bucket["minutes"] += sign * int(row.Minutes)
+            bucket["finished"] += sign * int(row.Finished)
+
+        for row in genre_counts.itertuples(index=False):
+            bucket = rollups.setdefault((row.UserID, row.Period, row.Key), _empty_bucket())
+            bucket["genres"][row.Genre] += sign * int(row.Count)
+            if bucket["genres"][row.Genre] <= 0:
+                del bucket["genres"][row.Genre]
+
+    def get(self, guild_id: int, user_id: str, period: str, when: datetime | None = None) -> dict:
+        """
+        Returns a user's totals for the period containing `when` (defaults to now).
+
+        Returns:
+            dict: Keys "pages", "minutes", "finished" (ints) and "genres" (Counter).
+        """
+        key = period_key(period, when or datetime.now())
+        bucket = self._rollups.get(guild_id, {}).get((str(user_id), period, key))
+        return bucket if bucket else _empty_bucket()
+
+
+def _empty_bucket() -> dict:
+    return {"pages": 0, "minutes": 0, "finished": 0, "genres": Counter()}
+
+
+STATS = register_index(StatsRollups())
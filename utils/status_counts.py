@@ -0,0 +1,43 @@
+from collections import Counter
+import pandas as pd
+from utils.indexes import RowIndex, register_index
+
+STATUS_NAMES: dict[int, str] = {0: "shelved", 1: "reading", 2: "finished"}
+
+
+class StatusCounts(RowIndex):
+    """
+    Per-user counts of books by status (0 = shelved, 1 = reading, 2 = finished).
+
+    Rebuilt when a guild is loaded and adjusted on every commit, so checks such as the
+    active book limit are a dictionary lookup instead of a scan of the reading log.
+    """
+
+    def __init__(self):
+        self._counts: dict[int, dict[str, Counter]] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._counts[guild_id] = {}
+        self._adjust(guild_id, df, 1)
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        self._adjust(guild_id, removed, -1)
+        self._adjust(guild_id, added, 1)
+
+    def _adjust(self, guild_id: int, df: pd.DataFrame, sign: int):
+        if df.empty:
+            return
+        counts = self._counts.setdefault(guild_id, {})
+        status = pd.to_numeric(df["Status"], errors="coerce")
+        grouped = pd.DataFrame({"UserID": df["UserID"].astype(str), "Status": status}).dropna().value_counts()
+        for (user_id, value), count in grouped.items():
+            user_counts = counts.setdefault(user_id, Counter())
+            user_counts[int(value)] += sign * int(count)
+
+    def get(self, guild_id: int, user_id: str) -> dict[int, int]:
+        """Returns a user's book counts by status, e.g. {0: 2, 1: 5, 2: 40}."""
+        user_counts = self._counts.get(guild_id, {}).get(str(user_id), Counter())
+        return {status: max(user_counts[status], 0) for status in STATUS_NAMES}
+
+
+STATUS_COUNTS = register_index(StatusCounts())
@@ -1,6 +1,9 @@
 from datetime import datetime, timedelta
 import discord
 from config import GUILD_ID
+from utils.logs import get_logger
+
+logger = get_logger(__name__)
 
 def get_week_bounds(reference: datetime):
     """
@@ -23,26 +26,27 @@ def get_week_bounds(reference: datetime):
     end_of_week = start_of_week + timedelta(days=6, hours=23, minutes=59, seconds=59)
     return start_of_week, end_of_week
 
-async def get_user_mentions(user_ids: list[int], bot) -> list[str]:
+async def get_user_mentions(user_ids: list[int], bot, guild_id: int = GUILD_ID) -> list[str]:
     """
     Asynchronously retrieves Discord mention strings for a list of user IDs in a specific guild.
 
     Args:
         user_ids (list[int]): A list of Discord user IDs to fetch mentions for.
         bot: The Discord bot instance, expected to have `get_guild` and `fetch_member` methods.
+        guild_id (int, optional): The guild to look the members up in. Defaults to GUILD_ID.
 
     Returns:
         list[str]: A list of mention strings (e.g., '<@user_id>') for the users found in the guild.
 
     Notes:
-        - If the guild with the specified GUILD_ID is not found, an empty list is returned.
+        - If the guild with the specified guild_id is not found, an empty list is returned.
         - If a user is not found in the guild, a warning is printed and that user is skipped.
         - Handles exceptions for missing members and other errors during fetching.
     """
     mentions = []
-    guild = bot.get_guild(GUILD_ID)
+    guild = bot.get_guild(guild_id)
     if not guild:
-        print(f"⚠️ Guild with ID {GUILD_ID} not found.")
+        logger.warning(f"⚠️ Guild with ID {guild_id} not found.", extra={"guild_id": guild_id})
         return mentions
     for uid in user_ids:
         try:
@@ -50,9 +54,9 @@ async def get_user_mentions(user_ids: list[int], bot) -> list[str]:
             if member:
                 mentions.append(member.mention)
         except discord.NotFound:
-            print(f"⚠️ Member with ID {uid} not found in guild.")
+            logger.warning(f"⚠️ Member with ID {uid} not found in guild.", extra={"guild_id": guild_id})
         except Exception as e:
-            print(f"⚠️ Error fetching member {uid}: {e}")
+            logger.warning(f"⚠️ Error fetching member {uid}: {e}", extra={"guild_id": guild_id})
     return mentions
 
 def get_all_reader_ids(guild: discord.Guild) -> list[str]:
@@ -72,7 +76,7 @@ def get_all_reader_ids(guild: discord.Guild) -> list[str]:
     reader_role = discord.utils.get(guild.roles, name="Reader")
     bot_role = discord.utils.get(guild.roles, name="Bots")
     if not reader_role:
-        print("⚠️ 'Reader' role not found in guild.")
+        logger.warning("⚠️ 'Reader' role not found in guild.", extra={"guild_id": guild.id})
         return []
     return [
         str(member.id)
@@ -0,0 +1,26 @@
+import re
+import sys
+import unicodedata
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_title(text: str) -> str:
+    """
+    Normalizes a book title or author name for comparisons and index keys.
+
+    Applies NFKC normalization and casefolding, strips punctuation and collapses whitespace,
+    so "Good Omens ", "good  omens" and "Good Omens!" all map to "good omens".
+    The result is interned, so the in-memory indexes keyed by it share one copy per title.
+
+    Args:
+        text (str): The title or author as typed by the user.
+
+    Returns:
+        str: The normalized form (empty string for missing values).
+    """
+    if not isinstance(text, str):
+        return ""
+    text = unicodedata.normalize("NFKC", text).casefold()
+    text = "".join(" " if unicodedata.category(ch).startswith("P") else ch for ch in text)
+    return sys.intern(_WHITESPACE.sub(" ", text).strip())
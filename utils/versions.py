@@ -0,0 +1,39 @@
+import itertools
+import pandas as pd
+from utils.indexes import RowIndex, register_index
+
+
+class UserVersions(RowIndex):
+    """
+    Per-user data version counters, bumped by every commit that touches a user's rows.
+
+    Caches of derived per-user output (charts, query results) key their entries by
+    `get(guild_id, user_id)`, so an entry is automatically bypassed once the user's data changes.
+    Versions come from one process-wide counter and include a per-guild epoch that changes
+    whenever the guild is reloaded, so a version is never reused for different data.
+    """
+
+    def __init__(self):
+        self._counter = itertools.count(1)
+        self._epochs: dict[int, int] = {}
+        self._versions: dict[int, dict[str, int]] = {}
+
+    def rebuild(self, guild_id: int, df: pd.DataFrame):
+        self._epochs[guild_id] = next(self._counter)
+        self._versions[guild_id] = {}
+
+    def apply(self, guild_id: int, removed: pd.DataFrame, added: pd.DataFrame):
+        user_ids = set()
+        for frame in (removed, added):
+            if not frame.empty:
+                user_ids.update(frame["UserID"].astype(str))
+        versions = self._versions.setdefault(guild_id, {})
+        for user_id in user_ids:
+            versions[user_id] = next(self._counter)
+
+    def get(self, guild_id: int, user_id: str) -> tuple[int, int]:
+        """Returns the current (guild epoch, user version) pair of a user."""
+        return self._epochs.get(guild_id, 0), self._versions.get(guild_id, {}).get(str(user_id), 0)
+
+
+VERSIONS = register_index(UserVersions())
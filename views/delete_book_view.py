@@ -1,9 +1,11 @@
 import discord
 from discord import ui, Interaction
-from config import EXCEL_FILE
-from utils.excel import read_excel_async, write_excel_async
+from utils.excel import delete_entry
+from utils.lock_replies import DataLockView
+from utils.book_index import BOOKS
+from utils.archive import restore_archived_async
 
-class DeleteBookSelectView(ui.View):
+class DeleteBookSelectView(DataLockView):
     """
     A Discord UI View that allows users to select and delete a book from their reading log.
 
@@ -33,27 +35,16 @@ class DeleteBookSelectView(ui.View):
 
     async def on_select(self, interaction: Interaction):
         await interaction.response.defer(ephemeral=True)
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str)
-
         selected_value = self.select.values[0]
         is_audiobook = selected_value.startswith("🎧 ")
         selected_book = selected_value[2:] 
-        if is_audiobook:
-            match = (
-                (df["UserID"] == str(interaction.user.id)) &
-                (df["BookName"].str.lower() == selected_book.lower()) &
-                (df["Genres"].str.contains("audiobook", na=False))
-            )
-        else:
-            match = (
-                (df["UserID"] == str(interaction.user.id)) &
-                (df["BookName"].str.lower() == selected_book.lower()) &
-                (~df["Genres"].str.contains("audiobook", na=False))
-            )
-
-        df = df[~match]
-        await write_excel_async(df, EXCEL_FILE)
+        if BOOKS.is_archived(interaction.guild_id, interaction.user.id, selected_book, is_audio=is_audiobook):
+            await restore_archived_async(interaction.guild_id, str(interaction.user.id), selected_book, is_audio=is_audiobook)
+
+        deleted = await delete_entry(interaction.guild_id, interaction.user.id, selected_book, is_audio=is_audiobook)
+        if not deleted:
+            await interaction.followup.send("⚠️ Book not found in your reading log.", ephemeral=True)
+            return
 
         await interaction.followup.send(
             f"🗑️ **{selected_book.title()}** has been deleted from your reading log.\n"
@@ -0,0 +1,61 @@
+import discord
+from discord import ui, Interaction
+from utils.jobs import REPORTS, Job
+
+
+class JobProgressView(ui.View):
+    """
+    A Cancel button shown under a report's progress message.
+
+    Args:
+        owner_id (int): The user who started the report; only they can cancel it.
+
+    Attributes:
+        job (Job | None): The report job, set once it is submitted.
+    """
+    def __init__(self, owner_id: int):
+        super().__init__(timeout=None)
+        self.owner_id = owner_id
+        self.job: Job | None = None
+
+    @ui.button(label="Cancel", style=discord.ButtonStyle.secondary, emoji="✖️")
+    async def cancel(self, interaction: Interaction, button: ui.Button):
+        if interaction.user.id != self.owner_id:
+            await interaction.response.send_message("⛔ Only the person who started this can cancel it.", ephemeral=True)
+            return
+        if self.job is not None:
+            self.job.cancel()
+        button.disabled = True
+        await interaction.response.edit_message(content="✖️ Cancelling…", view=self)
+
+
+async def run_report(interaction: Interaction, name: str, fn, *args):
+    """
+    Runs a report job in a worker process (see `utils.jobs`), keeping the interaction's
+    deferred response updated with the job's progress and a Cancel button.
+
+    The caller replaces the progress message with the result (pass `view=None` to remove
+    the button).
+
+    Args:
+        interaction (Interaction): An interaction that has already been deferred.
+        name (str): What the job does, shown in the progress message.
+        fn: The job function (see `JobRunner.submit`).
+        *args: The job's arguments.
+
+    Returns:
+        The job's result.
+
+    Raises:
+        JobCancelled: If the user cancelled the job.
+    """
+    view = JobProgressView(interaction.user.id)
+
+    async def show_progress(job: Job):
+        await interaction.edit_original_response(content=job.describe(), view=view)
+
+    view.job = REPORTS.submit(name, fn, *args, on_progress=show_progress)
+    try:
+        return await view.job.result()
+    finally:
+        view.stop()
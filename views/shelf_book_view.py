@@ -1,7 +1,10 @@
 import discord
 from discord import Interaction
 from modals.shelf_book_modal import ShelfBookModal
-from config import DEBUG
+from utils.logs import get_logger
+from utils.auto_defer import auto_defer
+
+logger = get_logger(__name__)
 
 
 class ShelfBookSelectView(discord.ui.View):
@@ -33,21 +36,19 @@ class ShelfBookSelectView(discord.ui.View):
         self.select.callback = self.on_select
         self.add_item(self.select)
 
+    @auto_defer(opens_modal=True)
     async def on_select(self, interaction: Interaction):
         selection = self.select.values[0]
 
         if not selection:
-            if DEBUG:
-                print("🟡 No selection made")
+            logger.debug("🟡 No selection made")
             return
 
         modal = ShelfBookModal(selection)
         try:
             await interaction.response.send_modal(modal)
-            if DEBUG:
-                print("✅ Modal sent")
+            logger.info("✅ Modal sent")
         except Exception as e:
-            if DEBUG:
-                print(f"❌ Failed to send modal: {e}")
+            logger.error(f"❌ Failed to send modal: {e}", exc_info=True)
 
         
\ No newline at end of file
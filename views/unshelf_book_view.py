@@ -1,11 +1,16 @@
 from datetime import datetime
 import discord
 from discord import Interaction
-from utils.excel import read_excel_async, write_excel_async
-from config import EXCEL_FILE, DEBUG
+from utils.excel import update_entry
+from utils.lock_replies import DataLockView
+from utils.book_index import BOOKS
+from utils.archive import restore_archived_async
+from utils.logs import get_logger
 
+logger = get_logger(__name__)
 
-class UnShelfBookSelectView(discord.ui.View):
+
+class UnShelfBookSelectView(DataLockView):
     """
     UnShelfBookSelectView is a Discord UI View that presents a dropdown menu for users to select a book to "un-shelf" (resume reading) from their personal reading log.
 
@@ -21,8 +26,8 @@ class UnShelfBookSelectView(discord.ui.View):
 
     Notes:
         - Only up to 25 book titles are shown due to Discord UI limitations.
-        - Requires asynchronous Excel read/write helpers (`read_excel_async`, `write_excel_async`) and a defined `EXCEL_FILE` path.
-        - Uses a DEBUG flag for optional error and status logging.
+        - The row is changed through the point API of `utils.excel` (`update_entry`).
+        - Errors and status messages go through the bot's logger (`utils.logs`).
     """
     def __init__(self, user_books: list[str]):
         super().__init__(timeout=60)
@@ -37,39 +42,36 @@ class UnShelfBookSelectView(discord.ui.View):
         selection = self.select.values[0]
 
         if not selection:
-            if DEBUG:
-                print("🟡 No selection made")
+            logger.debug("🟡 No selection made")
             return
 
         try:
             await interaction.response.defer()  # Allow public followup
 
-            df = await read_excel_async(EXCEL_FILE)
-            df["UserID"] = df["UserID"].astype(str)
+            if BOOKS.is_archived(interaction.guild_id, interaction.user.id, selection):
+                await restore_archived_async(interaction.guild_id, str(interaction.user.id), selection)
 
-            match = (
-                (df["UserID"] == str(interaction.user.id)) &
-                (df["BookName"].str.lower() == selection.lower())
+            updated = await update_entry(
+                interaction.guild_id,
+                interaction.user.id,
+                selection,
+                {"Status": 1, "LastUpdated": datetime.now()}
             )
 
-            if not match.any():
+            if not updated:
                 await interaction.followup.send(
                     "⚠️ Book not found in your reading log. Use `/add_book` first.",
                     ephemeral=True
                 )
                 return
 
-            df.loc[match, ["Status", "LastUpdated"]] = [1, datetime.now()]
-            await write_excel_async(df, EXCEL_FILE)
-
             await interaction.followup.send(
                 f"📖 <@{interaction.user.id}> resumed reading **{selection}**.",
                 ephemeral=False
             )
 
         except Exception as e:
-            if DEBUG:
-                print("❌ Error unshelving:", e)
+            logger.error(f"❌ Error unshelving: {e}", exc_info=True)
             await interaction.followup.send(
                 f"❌ Something went wrong: {e}",
                 ephemeral=True
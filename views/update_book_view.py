@@ -1,16 +1,21 @@
 import discord
 from discord import ui, Interaction
-from utils.excel import read_excel_async
-from config import EXCEL_FILE
+from utils.excel import get_entry
+from utils.lock_replies import DataLockView
+from utils.book_index import BOOKS
+from utils.auto_defer import auto_defer
 from modals.update_book_modal import UpdateBookModal, UpdateAudioBookModal
 
 
-class UpdateBookSelectView(ui.View):
+class UpdateBookSelectView(DataLockView):
     """
     A Discord UI View that presents a dropdown menu for users to select one of their books to update.
 
     Args:
         user_books (list[str]): A list of book titles associated with the user.
+        prefetched (dict[str, dict], optional): The books' rows, read by the command that
+            created the view. Used when a book is not in the book index, so the modal opens
+            without reading the log.
 
     Attributes:
         select (ui.Select): The dropdown select menu populated with up to 25 book titles.
@@ -21,11 +26,12 @@ class UpdateBookSelectView(ui.View):
             Opens an UpdateBookModal pre-filled with the selected book's details.
 
         _get_book(interaction: Interaction):
-            Asynchronously retrieves the selected book's details for the current user from the Excel file.
-            Returns a dictionary of book attributes, or default values if the book is not found.
+            Retrieves the selected book's details from the book index or the prefetched rows.
+            Returns the book's ReadingEntry (or its prefetched row dict).
     """
-    def __init__(self, user_books: list[str]):
+    def __init__(self, user_books: list[str], prefetched: dict[str, dict] | None = None):
         super().__init__(timeout=60)
+        self.prefetched = prefetched or {}
         user_books = list(set(user_books))[:25]  # Limit to 25 books for the select menu
         self.select = ui.Select(
             placeholder="Select a book to update",
@@ -34,27 +40,31 @@ class UpdateBookSelectView(ui.View):
         self.select.callback = self.on_select
         self.add_item(self.select)
 
+    @auto_defer(opens_modal=True)
     async def on_select(self, interaction: Interaction):
         await interaction.response.send_modal(UpdateBookModal(await self._get_book(interaction)))
 
     async def _get_book(self, interaction: Interaction):
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str)
         selected_book = self.select.values[0]
-        book_row = df[
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["BookName"].str.lower() == selected_book.lower()) &
-            (~df["Genres"].str.contains("audiobook", na=False))
-        ]
-        return book_row.iloc[0].to_dict()
+        book = BOOKS.entry(interaction.guild_id, interaction.user.id, selected_book, is_audio=False)
+        if book is not None:
+            return book
+        if selected_book in self.prefetched:
+            return self.prefetched[selected_book]
 
+        # Not indexed or prefetched (e.g. the guild is still warming up): fall back to reading the log.
+        return await get_entry(interaction.guild_id, interaction.user.id, selected_book, is_audio=False)
 
-class UpdateAudioBookSelectView(ui.View):
+
+class UpdateAudioBookSelectView(DataLockView):
     """
     A Discord UI View that presents a dropdown menu for users to select one of their audiobooks to update.
 
     Args:
         user_books (list[str]): A list of audiobook titles associated with the user.
+        prefetched (dict[str, dict], optional): The audiobooks' rows, read by the command that
+            created the view. Used when an audiobook is not in the book index, so the modal
+            opens without reading the log.
 
     Attributes:
         select (ui.Select): The dropdown select menu populated with up to 25 audiobook titles.
@@ -65,11 +75,12 @@ class UpdateAudioBookSelectView(ui.View):
             Opens an UpdateAudioBookModal pre-filled with the selected book's details.
 
         _get_book(interaction: Interaction):
-            Asynchronously retrieves the selected audiobook's details for the current user from the Excel file.
-            Returns a dictionary of audiobook attributes, or default values if the audiobook is not found.
+            Retrieves the selected audiobook's details from the book index or the prefetched rows.
+            Returns the audiobook's ReadingEntry (or its prefetched row dict).
     """
-    def __init__(self, user_books: list[str]):
+    def __init__(self, user_books: list[str], prefetched: dict[str, dict] | None = None):
         super().__init__(timeout=60)
+        self.prefetched = prefetched or {}
         user_books = list(set(user_books))[:25]  # Limit to 25 audiobooks for the select menu
         self.select = ui.Select(
             placeholder="Select an audiobook to update",
@@ -78,16 +89,17 @@ class UpdateAudioBookSelectView(ui.View):
         self.select.callback = self.on_select
         self.add_item(self.select)
 
+    @auto_defer(opens_modal=True)
     async def on_select(self, interaction: Interaction):
         await interaction.response.send_modal(UpdateAudioBookModal(await self._get_book(interaction)))
 
     async def _get_book(self, interaction: Interaction):
-        df = await read_excel_async(EXCEL_FILE)
-        df["UserID"] = df["UserID"].astype(str)
         selected_book = self.select.values[0]
-        book_row = df[
-            (df["UserID"] == str(interaction.user.id)) &
-            (df["BookName"].str.lower() == selected_book.lower()) &
-            (df["Genres"].str.contains("audiobook", na=False)) 
-        ]
-        return book_row.iloc[0].to_dict()
\ No newline at end of file
+        book = BOOKS.entry(interaction.guild_id, interaction.user.id, selected_book, is_audio=True)
+        if book is not None:
+            return book
+        if selected_book in self.prefetched:
+            return self.prefetched[selected_book]
+
+        # Not indexed or prefetched (e.g. the guild is still warming up): fall back to reading the log.
+        return await get_entry(interaction.guild_id, interaction.user.id, selected_book, is_audio=True)
\ No newline at end of file